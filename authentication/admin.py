@@ -1,5 +1,6 @@
 from django.contrib import admin
-from .models import User ,PlatformActivity
+from .models import User ,PlatformActivity, PlatformDailyStat
 # Register your models here.
 admin.site.register(User)
-admin.site.register(PlatformActivity)
\ No newline at end of file
+admin.site.register(PlatformActivity)
+admin.site.register(PlatformDailyStat)
@@ -0,0 +1,94 @@
+# analytics.py
+from datetime import datetime, timedelta
+
+from django.db.models import Count
+from django.db.models.functions import TruncDay, TruncMonth
+from django.utils import timezone
+
+GRANULARITIES = {
+    'day': TruncDay,
+    'month': TruncMonth,
+}
+
+
+def bucket_start(value, granularity):
+    """Normalize a date/datetime to the start of its bucket"""
+    if isinstance(value, datetime):
+        value = timezone.localtime(value).date() if timezone.is_aware(value) else value.date()
+    if granularity == 'month':
+        return value.replace(day=1)
+    return value
+
+
+def _next_bucket(value, granularity):
+    if granularity == 'month':
+        if value.month == 12:
+            return value.replace(year=value.year + 1, month=1)
+        return value.replace(month=value.month + 1)
+    return value + timedelta(days=1)
+
+
+def bucket_range(start, end, granularity='day'):
+    """Return every bucket start between start and end (inclusive)"""
+    current = bucket_start(start, granularity)
+    last = bucket_start(end, granularity)
+    buckets = []
+    while current <= last:
+        buckets.append(current)
+        current = _next_bucket(current, granularity)
+    return buckets
+
+
+def time_series(queryset, start, end, granularity='day', field='created_at'):
+    """
+    Count rows of a queryset per day/month between start and end
+    using a single GROUP BY query. Missing buckets are filled with 0.
+    """
+    if granularity not in GRANULARITIES:
+        raise ValueError(f"Unsupported granularity: {granularity}")
+
+    trunc = GRANULARITIES[granularity]
+    rows = (
+        queryset.filter(**{f'{field}__gte': start, f'{field}__lte': end})
+        .annotate(bucket=trunc(field))
+        .values('bucket')
+        .annotate(count=Count('pk'))
+        .order_by('bucket')
+    )
+    counts = {bucket_start(row['bucket'], granularity): row['count'] for row in rows}
+
+    return [
+        {'date': bucket, 'count': counts.get(bucket, 0)}
+        for bucket in bucket_range(start, end, granularity)
+    ]
+
+
+def daily_series(queryset, days, field='created_at'):
+    """Counts for the last `days` days, ending today"""
+    end = timezone.now()
+    start = (end - timedelta(days=days - 1)).replace(hour=0, minute=0, second=0, microsecond=0)
+    return [
+        {'date': item['date'].strftime('%Y-%m-%d'), 'count': item['count']}
+        for item in time_series(queryset, start, end, 'day', field)
+    ]
+
+
+def monthly_series(queryset, year, field='created_at'):
+    """Counts for each month of the given year"""
+    tz = timezone.get_current_timezone()
+    start = datetime(year, 1, 1, tzinfo=tz)
+    end = datetime(year + 1, 1, 1, tzinfo=tz) - timedelta(microseconds=1)
+    return time_series(queryset, start, end, 'month', field)
+
+
+def series_for_window(queryset, days, granularity='day', field='created_at'):
+    """Counts for the last `days` days grouped by day or month"""
+    if granularity == 'day':
+        return daily_series(queryset, days, field)
+
+    end = timezone.now()
+    start = end - timedelta(days=days - 1)
+    return [
+        {'date': item['date'].strftime('%Y-%m'), 'count': item['count']}
+        for item in time_series(queryset, start, end, granularity, field)
+    ]
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class AuthenticationConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'authentication'
+
+    def ready(self):
+        from .signals import connect_rollup_signals
+        connect_rollup_signals()
+
+        from taleemEdge.http_cache import connect_cache_signals
+        connect_cache_signals()
@@ -0,0 +1,198 @@
+import random
+import time
+from datetime import time as dt_time, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from authentication.models import User
+from chatbot.models import ChatSession, ChatMessage
+from library.models import Book, StudentBookActivity, ReadingProgress
+from medium.models import BlogPost
+from mentore.models import Mentor
+from scholarship.models import Scholarship, ScholarshipApplication, Notification
+from workshops.models import Workshop
+from youtube_vedios.models import Video
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed large tables inside a rolled-back transaction and check with EXPLAIN "
+        "that the hot queries use their composite indexes"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000,
+                            help="Rows to seed in each large table (planners ignore indexes on tiny tables)")
+        parser.add_argument('--keep', action='store_true',
+                            help="Commit the seeded rows instead of rolling them back")
+
+    def handle(self, *args, **options):
+        if options['rows'] < 100:
+            raise CommandError("--rows must be at least 100")
+
+        with transaction.atomic():
+            self.seed(options['rows'])
+            with connection.cursor() as cursor:
+                # Give the planner real statistics for the seeded tables
+                cursor.execute('ANALYZE')
+            failures = self.check_plans()
+            if not options['keep']:
+                transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(f"{len(failures)} query plan(s) not using the expected index: {', '.join(failures)}")
+        self.stdout.write(self.style.SUCCESS("All queries use their indexes"))
+
+    def seed(self, rows):
+        started = time.monotonic()
+        now = timezone.now()
+        user_count = max(50, rows // 100)
+        parent_count = max(20, rows // 50)
+
+        def spread(objects):
+            # auto_now_add ignores the value passed in, so spread creation dates afterwards
+            for i, obj in enumerate(objects):
+                obj.created_at = now - timedelta(days=i % 365, minutes=i)
+            type(objects[0]).objects.bulk_update(objects, ['created_at'], batch_size=1000)
+
+        users = User.objects.bulk_create([
+            User(username=f'bench{i}', email=f'bench{i}@example.com', full_name=f'Bench User {i}',
+                 role='admin' if i % 10 == 0 else 'student', password='!')
+            for i in range(user_count)
+        ], batch_size=1000)
+        spread(users)
+        admins = [u for u in users if u.role == 'admin']
+
+        sessions = ChatSession.objects.bulk_create([
+            ChatSession(user=users[i % user_count], title=f'Session {i}', is_active=i % 5 != 0)
+            for i in range(parent_count)
+        ], batch_size=1000)
+        ChatMessage.objects.bulk_create([
+            ChatMessage(session=sessions[i % parent_count], message_type='user' if i % 2 else 'bot',
+                        content=f'Message {i}')
+            for i in range(rows)
+        ], batch_size=1000)
+
+        scholarships = Scholarship.objects.bulk_create([
+            Scholarship(title=f'Scholarship {i}', provider='Bench', description='Benchmark scholarship',
+                        amount=1000, deadline=now + timedelta(days=30), category='merit',
+                        academic_level='undergraduate', country='PK', application_url='https://example.com',
+                        eligibility_criteria=['a'], requirements=['b'], benefits=['c'],
+                        status=random.choice(['upcoming', 'active', 'closed']))
+            for i in range(parent_count)
+        ], batch_size=1000)
+        spread(scholarships)
+        ScholarshipApplication.objects.bulk_create([
+            ScholarshipApplication(scholarship=scholarships[i % parent_count],
+                                   student=users[(i // parent_count) % user_count],
+                                   status=random.choice(['pending', 'approved', 'rejected', 'under_review']))
+            for i in range(min(rows, parent_count * user_count))
+        ], batch_size=1000)
+        Notification.objects.bulk_create([
+            Notification(user=users[i % user_count], title=f'Notification {i}', message='Benchmark',
+                         notification_type='new_scholarship', is_read=i % 4 != 0)
+            for i in range(rows)
+        ], batch_size=1000)
+
+        books = Book.objects.bulk_create([
+            Book(title=f'Book {i}', author='Bench', description='Benchmark book',
+                 category=random.choice(Book.CATEGORY_CHOICES)[0], pages=100, publish_year=2020,
+                 isbn=f'isbn-{i}', status='available' if i % 3 else 'unavailable')
+            for i in range(rows)
+        ], batch_size=1000)
+        spread(books)
+        StudentBookActivity.objects.bulk_create([
+            StudentBookActivity(user=users[(i // 2) % user_count], book=books[(i // 2 // user_count) % rows],
+                                activity_type='read' if i % 2 else 'download')
+            for i in range(rows)
+        ], batch_size=1000)
+        ReadingProgress.objects.bulk_create([
+            ReadingProgress(user=users[i % user_count], book=books[(i // user_count) % rows],
+                            is_completed=i % 3 == 0)
+            for i in range(rows)
+        ], batch_size=1000)
+
+        BlogPost.objects.bulk_create([
+            BlogPost(title=f'Post {i}', author='Bench', excerpt='Benchmark post', read_time='5 min read',
+                     status='published' if i % 4 else 'draft', views=random.randint(0, 100000))
+            for i in range(rows)
+        ], batch_size=1000)
+
+        workshops = Workshop.objects.bulk_create([
+            Workshop(title=f'Workshop {i}', instructor='Bench', description='Benchmark workshop',
+                     date=now.date(), time=dt_time(10, 0), duration='2 hours', capacity=50,
+                     level='beginner', category='tech', location='online', created_by=admins[i % len(admins)],
+                     status=random.choice(['upcoming', 'ongoing', 'completed', 'cancelled']))
+            for i in range(rows)
+        ], batch_size=1000)
+        spread(workshops)
+
+        videos = Video.objects.bulk_create([
+            Video(title=f'Video {i}', description='Benchmark video', category='tech',
+                  youtube_video_id=f'bench{i}', duration='10:00')
+            for i in range(rows)
+        ], batch_size=1000)
+        spread(videos)
+
+        mentors = Mentor.objects.bulk_create([
+            Mentor(full_name=f'Mentor {i}', email=f'mentor{i}@example.com', job_title='Engineer',
+                   years_of_experience=5, bio='Benchmark mentor', location='Lahore', availability='Weekends',
+                   expertise_areas=['a'], specializations=['b'], languages=['English'])
+            for i in range(rows)
+        ], batch_size=1000)
+        spread(mentors)
+
+        self.stdout.write(f"Seeded {rows} rows per table in {time.monotonic() - started:.1f}s")
+
+    def check_plans(self):
+        # Seeded accounts, so existing data doesn't skew the plans
+        user = User.objects.get(username='bench1')
+        admin = User.objects.get(username='bench0')
+        session = ChatSession.objects.filter(user=user).first()
+        window_start = timezone.now() - timedelta(days=7)
+
+        # (label, queryset, index expected in the plan)
+        cases = [
+            ('chat sessions of a user', ChatSession.objects.filter(user=user, is_active=True),
+             'chat_session_user_active_idx'),
+            ('recent chat history', ChatMessage.objects.filter(session=session).order_by('-timestamp', '-id')[:10],
+             'chat_msg_session_ts_idx'),
+            ('notifications of a user', Notification.objects.filter(user=user),
+             'notif_user_created_idx'),
+            ('unread notifications', Notification.objects.filter(user=user, is_read=False),
+             'notif_user_unread_idx'),
+            ('student applications by status', ScholarshipApplication.objects.filter(student=user, status='pending'),
+             'sch_app_student_status_idx'),
+            ('book activity of a user', StudentBookActivity.objects.filter(user=user, activity_type='read'),
+             'book_activity_user_type_idx'),
+            ('completed books of a user', ReadingProgress.objects.filter(user=user, is_completed=True),
+             'reading_user_completed_idx'),
+            ('available books in a category', Book.objects.filter(status='available', category='physics'),
+             'book_status_category_idx'),
+            ('popular blog posts', BlogPost.objects.filter(status='published').order_by('-views')[:5],
+             'blog_status_views_idx'),
+            ('workshops of an admin', Workshop.objects.filter(created_by=admin, status='upcoming'),
+             'workshop_creator_status_idx'),
+        ]
+        for model, index in [(User, 'user_created_idx'), (Video, 'video_created_idx'),
+                             (Book, 'book_created_idx'), (Workshop, 'workshop_created_idx'),
+                             (Scholarship, 'scholarship_created_idx'), (Mentor, 'mentor_created_idx')]:
+            cases.append((f'{model.__name__.lower()} growth window',
+                          model.objects.filter(created_at__gte=window_start).order_by(), index))
+
+        failures = []
+        for label, queryset, index in cases:
+            plan = queryset.explain()
+            started = time.perf_counter()
+            list(queryset)
+            elapsed = (time.perf_counter() - started) * 1000
+
+            if index in plan:
+                self.stdout.write(f"  ok    {label:<34} {elapsed:7.2f} ms  {index}")
+            else:
+                failures.append(label)
+                self.stdout.write(self.style.ERROR(f"  MISS  {label:<34} {elapsed:7.2f} ms  expected {index}"))
+                self.stdout.write(f"        {plan}")
+        return failures
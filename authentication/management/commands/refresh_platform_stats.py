@@ -0,0 +1,43 @@
+from datetime import date, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from authentication.rollups import ENTITY_MODELS, refresh_day
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild PlatformDailyStat rollup rows (today by default, or a backfill window). "
+        "Schedule it daily just after midnight, e.g. cron: 5 0 * * * python manage.py refresh_platform_stats --days 2"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=1,
+                            help="Number of days to rebuild, ending today")
+        parser.add_argument('--since', type=str,
+                            help="Rebuild every day from this date (YYYY-MM-DD) until today")
+        parser.add_argument('--entity', action='append', choices=list(ENTITY_MODELS),
+                            help="Limit the refresh to one entity (can be repeated)")
+
+    def handle(self, *args, **options):
+        today = timezone.localdate()
+
+        if options['since']:
+            try:
+                start_day = date.fromisoformat(options['since'])
+            except ValueError:
+                raise CommandError("--since must be in YYYY-MM-DD format")
+        else:
+            if options['days'] < 1:
+                raise CommandError("--days must be at least 1")
+            start_day = today - timedelta(days=options['days'] - 1)
+
+        day = start_day
+        refreshed = 0
+        while day <= today:
+            refresh_day(day, options['entity'])
+            refreshed += 1
+            day += timedelta(days=1)
+
+        self.stdout.write(self.style.SUCCESS(f"Refreshed platform stats for {refreshed} day(s)"))
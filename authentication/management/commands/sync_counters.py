@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from authentication.counters import counter_buffer
+from workshops.models import Workshop
+
+
+class Command(BaseCommand):
+    help = (
+        "Write this process's buffered counter increments and recount derived counters "
+        "(Workshop.enrolled_count). Web workers flush their own buffers every "
+        "COUNTER_FLUSH_INTERVAL seconds; run this after scripts that increment counters "
+        "or to repair drift"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--skip-recount', action='store_true',
+                            help="Only flush buffered increments")
+
+    def handle(self, *args, **options):
+        flushed = counter_buffer.flush()
+        self.stdout.write(f"Flushed buffered increments for {flushed} row(s)")
+
+        if not options['skip_recount']:
+            recounted = Workshop.objects.recount_enrollments()
+            self.stdout.write(f"Recounted enrollments of {recounted} workshop(s)")
+
+        self.stdout.write(self.style.SUCCESS("Counters are in sync"))
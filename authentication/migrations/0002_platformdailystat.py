@@ -0,0 +1,61 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PlatformDailyStat",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                (
+                    "entity",
+                    models.CharField(
+                        choices=[
+                            ("users", "Users"),
+                            ("videos", "Videos"),
+                            ("books", "Books"),
+                            ("workshops", "Workshops"),
+                            ("scholarships", "Scholarships"),
+                            ("mentors", "Mentors"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "metric",
+                    models.CharField(
+                        choices=[
+                            ("created", "Created On Day"),
+                            ("total", "Total At End Of Day"),
+                            ("approved", "Approved"),
+                            ("pending", "Pending"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("value", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name_plural": "Platform Daily Stats",
+                "ordering": ["-date", "entity", "metric"],
+                "unique_together": {("date", "entity", "metric")},
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("authentication", "0002_platformdailystat"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(fields=["created_at"], name="user_created_idx"),
+        ),
+    ]
@@ -1,8 +1,16 @@
 # models.py
+import copy
+import logging
+import time
+
+from django.conf import settings as django_settings
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.core.validators import EmailValidator
 from django.utils import timezone
+from taleemEdge.http_cache import get_versions
+
+logger = logging.getLogger(__name__)
 
 class User(AbstractUser):
     ROLE_CHOICES = [
@@ -22,6 +30,12 @@ class User(AbstractUser):
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['full_name', 'username']
     
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Growth stats bucket users by creation date
+            models.Index(fields=['created_at'], name='user_created_idx'),
+        ]
+    
     def __str__(self):
         return self.full_name
 
@@ -46,6 +60,48 @@ class PlatformActivity(models.Model):
 
 
 
+class PlatformDailyStat(models.Model):
+    """
+    Pre-aggregated platform statistics, one row per day x entity x metric.
+    Kept up to date by authentication.rollups (signals + management command).
+    """
+    ENTITY_CHOICES = [
+        ('users', 'Users'),
+        ('videos', 'Videos'),
+        ('books', 'Books'),
+        ('workshops', 'Workshops'),
+        ('scholarships', 'Scholarships'),
+        ('mentors', 'Mentors'),
+    ]
+
+    METRIC_CHOICES = [
+        ('created', 'Created On Day'),
+        ('total', 'Total At End Of Day'),
+        ('approved', 'Approved'),
+        ('pending', 'Pending'),
+    ]
+
+    date = models.DateField()
+    entity = models.CharField(max_length=20, choices=ENTITY_CHOICES)
+    metric = models.CharField(max_length=20, choices=METRIC_CHOICES)
+    value = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ['date', 'entity', 'metric']
+        ordering = ['-date', 'entity', 'metric']
+        verbose_name_plural = "Platform Daily Stats"
+
+    def __str__(self):
+        return f"{self.date} {self.entity} {self.metric}: {self.value}"
+
+
+
+
+# (version, read at, PlatformSettings) last read by this process; see get_settings()
+_cached_settings = None
+_warned_uncached = False
+
 
 class PlatformSettings(models.Model):
     # Basic Platform Settings
@@ -103,8 +159,32 @@ class PlatformSettings(models.Model):
     
     @classmethod
     def get_settings(cls):
-        settings, created = cls.objects.get_or_create(pk=1)
-        return settings
+        """
+        The settings row, created on first use. Each process keeps its last
+        read in memory and re-reads when the version that post_save /
+        post_delete bump (taleemEdge.http_cache) has moved, or after
+        PLATFORM_SETTINGS_MAX_AGE seconds in case the bump never reached
+        this process (a per-process cache such as LocMemCache)
+        """
+        global _cached_settings, _warned_uncached
+        # Read the version first: a save racing with the query below then
+        # leaves the entry outdated (refetched next call), never stuck stale
+        version = get_versions(['authentication.PlatformSettings'])[0]
+        if version is None:
+            # The cache keeps nothing (DummyCache), so a save would never be noticed
+            if not _warned_uncached:
+                logger.warning("The response cache doesn't store versions; PlatformSettings is read on every call")
+                _warned_uncached = True
+            return cls.objects.get_or_create(pk=1)[0]
+
+        now = time.monotonic()
+        max_age = getattr(django_settings, 'PLATFORM_SETTINGS_MAX_AGE', 30)
+        cached = _cached_settings
+        if cached is None or cached[0] != version or now - cached[1] > max_age:
+            settings, created = cls.objects.get_or_create(pk=1)
+            cached = _cached_settings = (version, now, settings)
+        # Callers may edit and save what they get; never hand out the shared copy
+        return copy.copy(cached[2])
     
 
     
\ No newline at end of file
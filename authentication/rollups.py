@@ -0,0 +1,284 @@
+# rollups.py
+"""
+Daily platform statistics read from PlatformDailyStat rows.
+
+Saves and deletes adjust today's 'created' / 'total' counters in place
+(see signals.py). Snapshot metrics such as pending counts depend on the
+current time: today's rows are recomputed when read if a write to the
+table expired them or they are older than ROLLUP_SNAPSHOT_MAX_AGE
+seconds. Past days are filled in by
+
+    python manage.py refresh_platform_stats
+
+which should run once a day shortly after midnight (cron or a platform
+scheduler); use --days / --since to backfill. Reads over days without
+rows fall back to live queries, log a warning and queue a backfill of at
+most ROLLUP_MAX_BACKFILL_DAYS of the most recent missing days.
+"""
+import logging
+import threading
+from datetime import date, datetime, time, timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db.models import Count, F, Q
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from taleemEdge.background import defer
+from . import analytics
+from .models import PlatformDailyStat
+
+logger = logging.getLogger(__name__)
+
+ENTITY_MODELS = {
+    'users': 'authentication.User',
+    'videos': 'youtube_vedios.Video',
+    'books': 'library.Book',
+    'workshops': 'workshops.Workshop',
+    'scholarships': 'scholarship.Scholarship',
+    'mentors': 'mentore.Mentor',
+}
+
+# Metrics that describe the current state of a table rather than its history.
+# Today's rows are refreshed on read once stale (see stats_for_day); older
+# rows keep the value stored by the last refresh of that day.
+SNAPSHOT_METRICS = {
+    'mentors': {
+        'approved': lambda: Q(status='approved'),
+        'pending': lambda: Q(status='pending'),
+    },
+    'scholarships': {
+        'pending': lambda: Q(status='upcoming', deadline__gte=timezone.now()),
+    },
+    'workshops': {
+        'pending': lambda: Q(status='upcoming', date__gte=timezone.localdate()),
+    },
+}
+
+
+def get_entity_model(entity):
+    return apps.get_model(ENTITY_MODELS[entity])
+
+
+def _day_bounds(day):
+    """Aware [start, end) datetimes for a calendar day"""
+    tz = timezone.get_current_timezone()
+    start = datetime.combine(day, time.min, tzinfo=tz)
+    return start, start + timedelta(days=1)
+
+
+def compute_day(day, entity):
+    """Compute every metric for one entity and day with a single aggregate query"""
+    start, end = _day_bounds(day)
+    aggregates = {
+        'created': Count('pk', filter=Q(created_at__gte=start, created_at__lt=end)),
+        'total': Count('pk', filter=Q(created_at__lt=end)),
+    }
+    if day == timezone.localdate():
+        for metric, condition in SNAPSHOT_METRICS.get(entity, {}).items():
+            aggregates[metric] = Count('pk', filter=condition())
+
+    return get_entity_model(entity).objects.aggregate(**aggregates)
+
+
+def refresh_day(day, entities=None):
+    """
+    Recompute and upsert the rollup rows for a day.
+    Returns {entity: {metric: value}} for the refreshed entities.
+    """
+    entities = entities or list(ENTITY_MODELS)
+    results = {}
+    rows = []
+    for entity in entities:
+        results[entity] = compute_day(day, entity)
+        rows.extend(
+            PlatformDailyStat(date=day, entity=entity, metric=metric, value=value)
+            for metric, value in results[entity].items()
+        )
+
+    PlatformDailyStat.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=['date', 'entity', 'metric'],
+        update_fields=['value', 'updated_at'],
+    )
+    return results
+
+
+def refresh_today(entity):
+    """Refresh only today's bucket for one entity"""
+    return refresh_day(timezone.localdate(), [entity])
+
+
+def record_created(entity):
+    """A row was added: bump today's counters instead of recounting the table"""
+    updated = PlatformDailyStat.objects.filter(
+        date=timezone.localdate(), entity=entity, metric__in=['created', 'total']
+    ).update(value=F('value') + 1)
+    if updated < 2:
+        # First write of the day: compute the bucket once (it includes the new row)
+        refresh_today(entity)
+
+
+def record_deleted(entity, created_at):
+    """A row was removed: lower today's total and the 'created' count of its day"""
+    PlatformDailyStat.objects.filter(
+        Q(metric='total', date=timezone.localdate())
+        | Q(metric='created', date=timezone.localdate(created_at)),
+        entity=entity,
+    ).update(value=Greatest(F('value') - 1, 0))
+
+
+def snapshot_stats(entity):
+    """Current values of the entity's snapshot metrics (one aggregate query)"""
+    metrics = SNAPSHOT_METRICS.get(entity, {})
+    if not metrics:
+        return {}
+    return get_entity_model(entity).objects.aggregate(**{
+        metric: Count('pk', filter=condition()) for metric, condition in metrics.items()
+    })
+
+
+def refresh_snapshots(entities):
+    """Recompute and store today's snapshot metrics; returns {entity: {metric: value}}"""
+    today = timezone.localdate()
+    results = {entity: snapshot_stats(entity) for entity in entities}
+    PlatformDailyStat.objects.bulk_create(
+        [
+            PlatformDailyStat(date=today, entity=entity, metric=metric, value=value)
+            for entity, values in results.items() for metric, value in values.items()
+        ],
+        update_conflicts=True,
+        unique_fields=['date', 'entity', 'metric'],
+        update_fields=['value', 'updated_at'],
+    )
+    return results
+
+
+def expire_snapshots(entity):
+    """A row changed: drop today's snapshot rows so the next read recomputes them"""
+    if entity in SNAPSHOT_METRICS:
+        PlatformDailyStat.objects.filter(
+            date=timezone.localdate(), entity=entity, metric__in=list(SNAPSHOT_METRICS[entity])
+        ).delete()
+
+
+def stats_for_day(day=None, entities=None):
+    """
+    Read pre-aggregated stats for a day as {entity: {metric: value}}.
+    Entities with no rows yet are computed once and stored; today's
+    snapshot metrics are recomputed only when expired or stale.
+    """
+    today = timezone.localdate()
+    day = day or today
+    entities = entities or list(ENTITY_MODELS)
+
+    stats = {entity: {} for entity in entities}
+    updated = {}
+    rows = PlatformDailyStat.objects.filter(date=day, entity__in=entities)
+    for entity, metric, value, updated_at in rows.values_list('entity', 'metric', 'value', 'updated_at'):
+        stats[entity][metric] = value
+        updated[entity, metric] = updated_at
+
+    missing = [entity for entity in entities if not stats[entity]]
+    if missing:
+        logger.info(f"No rollup rows for {', '.join(missing)} on {day}; computing them now")
+        stats.update(refresh_day(day, missing))
+
+    if day == today:
+        # Deadlines pass without any write, so stored snapshots also age out
+        cutoff = timezone.now() - timedelta(seconds=getattr(settings, 'ROLLUP_SNAPSHOT_MAX_AGE', 60))
+        stale = [
+            entity for entity in entities
+            if entity not in missing and any(
+                updated.get((entity, metric)) is None or updated[entity, metric] < cutoff
+                for metric in SNAPSHOT_METRICS.get(entity, {})
+            )
+        ]
+        if stale:
+            for entity, values in refresh_snapshots(stale).items():
+                stats[entity].update(values)
+    return stats
+
+
+_backfills = set()
+_backfills_lock = threading.Lock()
+
+
+def backfill(entity, days):
+    for day in days:
+        refresh_day(day, [entity])
+
+
+def _schedule_backfill(entity, days):
+    """Fill the missing days in the background, once per process"""
+    key = (entity, min(days), max(days))
+    with _backfills_lock:
+        if key in _backfills:
+            return
+        _backfills.add(key)
+    defer(backfill, entity, days)
+
+
+def _created_counts(entity, start_day, end_day):
+    """Daily 'created' values between two days, or None if any day is missing"""
+    rows = dict(
+        PlatformDailyStat.objects.filter(
+            entity=entity, metric='created', date__gte=start_day, date__lte=end_day
+        ).values_list('date', 'value')
+    )
+    expected = [start_day + timedelta(days=offset) for offset in range((end_day - start_day).days + 1)]
+    missing = [day for day in expected if day not in rows]
+    if missing:
+        # Each day is an aggregate query; a long gap is the management command's job
+        limit = getattr(settings, 'ROLLUP_MAX_BACKFILL_DAYS', 31)
+        logger.warning(
+            f"Rollups for {entity} are missing {len(missing)} day(s) between {start_day} and {end_day}; "
+            f"using live queries and backfilling the latest {min(len(missing), limit)} "
+            f"(run refresh_platform_stats --since {missing[0]} for the rest, and schedule it daily)"
+        )
+        _schedule_backfill(entity, missing[-limit:])
+        return None
+    return rows
+
+
+def _bucketed(daily_counts, start_day, end_day, granularity):
+    counts = {}
+    for day, value in daily_counts.items():
+        bucket = analytics.bucket_start(day, granularity)
+        counts[bucket] = counts.get(bucket, 0) + value
+    return [
+        {'date': bucket, 'count': counts.get(bucket, 0)}
+        for bucket in analytics.bucket_range(start_day, end_day, granularity)
+    ]
+
+
+def series_for_window(entity, days, granularity='day'):
+    """
+    Same output as analytics.series_for_window, read from rollup rows.
+    Falls back to the live GROUP BY query until the window has been backfilled.
+    """
+    end_day = timezone.localdate()
+    start_day = end_day - timedelta(days=days - 1)
+
+    daily_counts = _created_counts(entity, start_day, end_day)
+    if daily_counts is None:
+        return analytics.series_for_window(get_entity_model(entity).objects.all(), days, granularity)
+
+    date_format = '%Y-%m-%d' if granularity == 'day' else '%Y-%m'
+    return [
+        {'date': item['date'].strftime(date_format), 'count': item['count']}
+        for item in _bucketed(daily_counts, start_day, end_day, granularity)
+    ]
+
+
+def monthly_series(entity, year):
+    """Same output as analytics.monthly_series, read from rollup rows"""
+    start_day = date(year, 1, 1)
+    end_day = date(year, 12, 31)
+
+    daily_counts = _created_counts(entity, start_day, min(end_day, timezone.localdate()))
+    if daily_counts is None:
+        return analytics.monthly_series(get_entity_model(entity).objects.all(), year)
+    return _bucketed(daily_counts, start_day, end_day, 'month')
@@ -0,0 +1,26 @@
+from django.apps import apps
+from django.db.models.signals import post_save, post_delete
+
+from .rollups import ENTITY_MODELS, expire_snapshots, record_created, record_deleted
+
+
+def _make_rollup_handlers(entity):
+    def handle_save(sender, instance, created, **kwargs):
+        """Count new rows in today's rollup; snapshot metrics are recomputed on the next read"""
+        expire_snapshots(entity)
+        if created:
+            record_created(entity)
+
+    def handle_delete(sender, instance, **kwargs):
+        expire_snapshots(entity)
+        record_deleted(entity, instance.created_at)
+
+    return handle_save, handle_delete
+
+
+def connect_rollup_signals():
+    for entity, model_label in ENTITY_MODELS.items():
+        model = apps.get_model(model_label)
+        handle_save, handle_delete = _make_rollup_handlers(entity)
+        post_save.connect(handle_save, sender=model, weak=False, dispatch_uid=f'rollup_save_{entity}')
+        post_delete.connect(handle_delete, sender=model, weak=False, dispatch_uid=f'rollup_delete_{entity}')
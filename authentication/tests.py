@@ -1,3 +1,180 @@
-from django.test import TestCase
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from library.models import Book
+from mentore.models import Mentor
+from scholarship.models import Scholarship
+from taleemEdge.http_cache import get_cache
+from . import models, rollups
+from .counters import CounterBuffer, decrement, increment
+from .models import PlatformDailyStat, PlatformSettings, User
+from .rollups import stats_for_day
+
+
+def make_scholarship(**kwargs):
+    defaults = dict(
+        title='Merit award', provider='Provider', description='Description', amount=1000,
+        deadline=timezone.now() + timedelta(days=1), category='merit', academic_level='graduate',
+        country='PK', application_url='https://example.com', eligibility_criteria=['a'],
+        requirements=['b'], benefits=['c'], status='upcoming',
+    )
+    defaults.update(kwargs)
+    return Scholarship.objects.create(**defaults)
+
+
+def make_mentor(**kwargs):
+    defaults = dict(
+        full_name='Mentor', email='mentor@example.com', job_title='Engineer', years_of_experience=5,
+        bio='Bio', location='Lahore', availability='Weekends', expertise_areas=['Python'],
+        specializations=['Web'], languages=['English'],
+    )
+    defaults.update(kwargs)
+    return Mentor.objects.create(**defaults)
+
+
+class RollupTests(TestCase):
+    def test_new_rows_bump_todays_counters(self):
+        make_scholarship()
+        self.assertEqual(stats_for_day(entities=['scholarships'])['scholarships']['total'], 1)
+
+        with CaptureQueriesContext(connection) as queries:
+            make_scholarship(title='Second')
+        # An in-place increment, not a recount of the table
+        self.assertFalse([query for query in queries.captured_queries if 'COUNT(' in query['sql']])
+        row = PlatformDailyStat.objects.get(date=timezone.localdate(), entity='scholarships', metric='total')
+        self.assertEqual(row.value, 2)
+
+    def test_delete_lowers_todays_total(self):
+        scholarship = make_scholarship()
+        make_scholarship(title='Second')
+        scholarship.delete()
+        self.assertEqual(stats_for_day(entities=['scholarships'])['scholarships']['total'], 1)
+
+    def test_snapshot_metrics_are_recomputed_once_stale(self):
+        make_scholarship(deadline=timezone.now() + timedelta(hours=1))
+        self.assertEqual(stats_for_day(entities=['scholarships'])['scholarships']['pending'], 1)
+
+        # The deadline passes without any write to the table
+        later = timezone.now() + timedelta(hours=2)
+        with mock.patch('django.utils.timezone.now', return_value=later):
+            self.assertEqual(stats_for_day(entities=['scholarships'])['scholarships']['pending'], 0)
+
+    def test_fresh_snapshots_are_read_without_aggregating(self):
+        make_scholarship()
+        stats_for_day(entities=['scholarships'])
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(stats_for_day(entities=['scholarships'])['scholarships']['pending'], 1)
+        self.assertEqual(len(queries.captured_queries), 1)
+        self.assertNotIn('COUNT(', queries.captured_queries[0]['sql'])
+
+    def test_saves_expire_snapshots(self):
+        mentor = make_mentor()
+        self.assertEqual(stats_for_day(entities=['mentors'])['mentors']['approved'], 0)
+        mentor.status = 'approved'
+        mentor.save()
+        self.assertEqual(stats_for_day(entities=['mentors'])['mentors']['approved'], 1)
+
+    def test_queryset_update_shows_up_after_the_max_age(self):
+        mentor = make_mentor()
+        self.assertEqual(stats_for_day(entities=['mentors'])['mentors']['approved'], 0)
+        Mentor.objects.filter(pk=mentor.pk).update(status='approved')
+        self.assertEqual(stats_for_day(entities=['mentors'])['mentors']['approved'], 0)
+        with self.settings(ROLLUP_SNAPSHOT_MAX_AGE=0):
+            self.assertEqual(stats_for_day(entities=['mentors'])['mentors']['approved'], 1)
+
+    def test_backfill_queued_by_a_read_is_capped(self):
+        with mock.patch('authentication.rollups.defer') as defer, \
+                mock.patch.object(rollups, '_backfills', set()), \
+                self.settings(ROLLUP_MAX_BACKFILL_DAYS=31):
+            rollups.series_for_window('books', 400)
+        entity, days = defer.call_args.args[1:]
+        self.assertEqual(len(days), 31)
+        self.assertEqual(days[-1], timezone.localdate())
+
+
+class CounterTests(TransactionTestCase):
+    # The flush timer writes from its own thread, so rows must be committed
+    def setUp(self):
+        self.book = Book.objects.create(title='Book', author='Author', description='Description',
+                                        category='physics', pages=10, publish_year=2020, isbn='isbn-1')
+
+    def test_decrement_stops_at_zero(self):
+        increment(self.book, 'read_count', buffered=False)
+        decrement(self.book, 'read_count', amount=3, buffered=False)
+        self.book.refresh_from_db()
+        self.assertEqual(self.book.read_count, 0)
+
+    def test_buffer_flushes_on_timer_without_further_adds(self):
+        buffer = CounterBuffer()
+        with self.settings(COUNTER_FLUSH_INTERVAL=0.01, COUNTER_FLUSH_THRESHOLD=1000):
+            buffer.add('library.Book', self.book.pk, 'read_count', 2)
+            buffer._timer.join(1)
+        self.book.refresh_from_db()
+        self.assertEqual(self.book.read_count, 2)
+        self.assertIsNone(buffer._timer)
+
+
+class PlatformSettingsCacheTests(TestCase):
+    def setUp(self):
+        PlatformSettings.objects.get_or_create(pk=1)
+        get_cache().clear()
+        patcher = mock.patch.multiple(models, _cached_settings=None, _warned_uncached=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_save_is_visible_on_the_next_read(self):
+        settings = PlatformSettings.get_settings()
+        settings.site_name = 'Renamed'
+        settings.save()
+        self.assertEqual(PlatformSettings.get_settings().site_name, 'Renamed')
+
+    def test_reads_are_served_from_memory_until_the_version_moves(self):
+        PlatformSettings.get_settings()
+        with self.assertNumQueries(0):
+            PlatformSettings.get_settings()
+
+    def test_writes_without_signals_show_up_after_the_max_age(self):
+        PlatformSettings.get_settings()
+        PlatformSettings.objects.filter(pk=1).update(site_name='Renamed')
+        self.assertNotEqual(PlatformSettings.get_settings().site_name, 'Renamed')
+        with self.settings(PLATFORM_SETTINGS_MAX_AGE=0):
+            self.assertEqual(PlatformSettings.get_settings().site_name, 'Renamed')
+
+    def test_callers_get_their_own_copy(self):
+        PlatformSettings.get_settings().site_name = 'Changed in place'
+        self.assertNotEqual(PlatformSettings.get_settings().site_name, 'Changed in place')
+
+    def test_not_cached_when_the_cache_keeps_no_versions(self):
+        dummy = {'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}
+        with self.settings(CACHES=dummy), self.assertLogs('authentication.models', 'WARNING'):
+            PlatformSettings.get_settings()
+            PlatformSettings.objects.filter(pk=1).update(site_name='Renamed')
+            self.assertEqual(PlatformSettings.get_settings().site_name, 'Renamed')
+
+
+class AnalyticsParameterTests(TestCase):
+    def setUp(self):
+        admin = User.objects.create_user(username='admin', email='admin@example.com', password='x', role='admin')
+        self.client = APIClient()
+        self.client.force_authenticate(admin)
+
+    def test_days_must_be_a_number_in_range(self):
+        for days in ['abc', '0', '100000000']:
+            response = self.client.get('/auth/admin/analytics/', {'days': days})
+            self.assertEqual(response.status_code, 400, days)
+        response = self.client.get('/auth/admin/analytics/', {'days': '730', 'granularity': 'month'})
+        self.assertEqual(response.status_code, 200)
+
+    def test_year_must_be_a_number_in_range(self):
+        for year in ['abc', '1999', str(timezone.localdate().year + 1), '99999999']:
+            response = self.client.get('/auth/admin/monthly-stats/', {'year': year})
+            self.assertEqual(response.status_code, 400, year)
+        response = self.client.get('/auth/admin/monthly-stats/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 12)
@@ -14,6 +14,14 @@ from datetime import datetime, timedelta
 from library.serializers import  BookSerializer
 import calendar
 from youtube_vedios.models import Video
+from youtube_vedios.serializers import VideoSerializer
+from .analytics import GRANULARITIES
+from django.conf import settings
+from . import rollups
+from .rollups import stats_for_day
+from taleemEdge.pagination import CreatedAtCursorPagination
+from taleemEdge.http_cache import cache_response
+from django.utils.decorators import method_decorator
 
 
 
@@ -94,23 +102,22 @@ class DashboardStatsView(generics.GenericAPIView):
         if request.user.role != 'admin':
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         
-        # Current month stats
-        current_month_start = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        last_month_start = (current_month_start - timedelta(days=1)).replace(day=1)
+        # Read pre-aggregated totals for today and the end of last month
+        current_month_start = timezone.localdate().replace(day=1)
+        today_stats = stats_for_day()
+        last_month_stats = stats_for_day(current_month_start - timedelta(days=1))
         
         # Get current stats
-        total_users = User.objects.count()
-        youtube_videos = Video.objects.count()
-        library_books = Book.objects.count()
-        workshops = Workshop.objects.count()
-        scholarships = Scholarship.objects.count()
-        active_mentors = Mentor.objects.filter(status='approved').count()
+        total_users = today_stats['users']['total']
+        youtube_videos = today_stats['videos']['total']
+        library_books = today_stats['books']['total']
+        workshops = today_stats['workshops']['total']
+        scholarships = today_stats['scholarships']['total']
+        active_mentors = today_stats['mentors']['approved']
         
-        # Get last month stats for growth calculation
-        def get_growth(current, last_month_start, current_month_start, model):
-            last_month_count = model.objects.filter(
-                created_at__lt=current_month_start
-            ).count()
+        # Compare against totals at the end of last month for growth calculation
+        def get_growth(current, entity):
+            last_month_count = last_month_stats[entity]['total']
             if last_month_count == 0:
                 return "+100%"
             growth = ((current - last_month_count) / last_month_count) * 100
@@ -123,12 +130,12 @@ class DashboardStatsView(generics.GenericAPIView):
             'workshops': workshops,
             'scholarships': scholarships,
             'active_mentors': active_mentors,
-            'users_growth': get_growth(total_users, last_month_start, current_month_start, User),
-            'videos_growth': get_growth(youtube_videos, last_month_start, current_month_start, Video),
-            'books_growth': get_growth(library_books, last_month_start, current_month_start, Book),
-            'workshops_growth': get_growth(workshops, last_month_start, current_month_start, Workshop),
-            'scholarships_growth': get_growth(scholarships, last_month_start, current_month_start, Scholarship),
-            'mentors_growth': get_growth(active_mentors, last_month_start, current_month_start, Mentor),
+            'users_growth': get_growth(total_users, 'users'),
+            'videos_growth': get_growth(youtube_videos, 'videos'),
+            'books_growth': get_growth(library_books, 'books'),
+            'workshops_growth': get_growth(workshops, 'workshops'),
+            'scholarships_growth': get_growth(scholarships, 'scholarships'),
+            'mentors_growth': get_growth(active_mentors, 'mentors'),
         }
         # print('videos_growth: ',get_growth(youtube_videos, last_month_start, current_month_start, Video))
         return Response(DashboardStatsSerializer(stats).data)
@@ -149,17 +156,10 @@ class PendingTasksView(generics.GenericAPIView):
         if request.user.role != 'admin':
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         
-        pending_scholarships = Scholarship.objects.filter(
-            status='upcoming',
-            deadline__gte=timezone.now()
-        ).count()
-        
-        pending_mentors = Mentor.objects.filter(status='pending').count()
-        
-        pending_workshops = Workshop.objects.filter(
-            status='upcoming',
-            date__gte=timezone.now().date()
-        ).count()
+        today_stats = stats_for_day(entities=['scholarships', 'mentors', 'workshops'])
+        pending_scholarships = today_stats['scholarships']['pending']
+        pending_mentors = today_stats['mentors']['pending']
+        pending_workshops = today_stats['workshops']['pending']
         
         tasks = [
             {
@@ -212,6 +212,7 @@ class PlatformSettingsView(generics.RetrieveUpdateAPIView):
         return super().update(request, *args, **kwargs)
 
 # Public Settings View (for frontend to get basic settings)
+@method_decorator(cache_response('authentication.PlatformSettings'), name='get')
 class PublicSettingsView(generics.GenericAPIView):
     permission_classes = [AllowAny]
     
@@ -255,43 +256,43 @@ class AnalyticsView(generics.GenericAPIView):
             return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
         
         # Get date range from query params
-        days = int(request.GET.get('days', 30))
-        end_date = timezone.now()
-        start_date = end_date - timedelta(days=days)
+        max_days = getattr(settings, 'ANALYTICS_MAX_DAYS', 730)
+        try:
+            days = int(request.GET.get('days', 30))
+        except ValueError:
+            return Response({'error': 'days must be a number'}, status=status.HTTP_400_BAD_REQUEST)
+        granularity = request.GET.get('granularity', 'day')
+        if granularity not in GRANULARITIES:
+            return Response({'error': f"granularity must be one of {', '.join(GRANULARITIES)}"},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if not 1 <= days <= max_days:
+            return Response({'error': f'days must be between 1 and {max_days}'}, status=status.HTTP_400_BAD_REQUEST)
         
-        # User registrations over time
-        user_registrations = []
-        for i in range(days):
-            date = start_date + timedelta(days=i)
-            count = User.objects.filter(
-                created_at__date=date.date()
-            ).count()
-            user_registrations.append({
-                'date': date.strftime('%Y-%m-%d'),
-                'count': count
-            })
+        # User registrations over time (pre-aggregated daily rows)
+        user_registrations = rollups.series_for_window('users', days, granularity)
         
         # Most popular content
         popular_books = Book.objects.order_by('-download_count')[:5]
-        # popular_videos = Video.objects.order_by('-views')[:5]
+        popular_videos = Video.objects.order_by('-views')[:5]
         
         # Workshop enrollments
+        today_stats = stats_for_day(entities=['users', 'books', 'workshops', 'scholarships'])
         workshop_stats = Workshop.objects.values('title', 'enrolled_count').order_by('-enrolled_count')[:5]
         
         analytics_data = {
             'user_registrations': user_registrations,
             'popular_books': BookSerializer(popular_books, many=True).data,
-            # 'popular_videos': VideoSerializer(popular_videos, many=True).data,
+            'popular_videos': VideoSerializer(popular_videos, many=True).data,
             'workshop_stats': list(workshop_stats),
-            'total_users': User.objects.count(),
+            'total_users': today_stats['users']['total'],
             'active_users_today': User.objects.filter(
                 last_login__date=timezone.now().date()
             ).count(),
             'content_breakdown': {
-                'books': Book.objects.count(),
-                # 'videos': Video.objects.count(),
-                'workshops': Workshop.objects.count(),
-                'scholarships': Scholarship.objects.count(),
+                'books': today_stats['books']['total'],
+                # 'videos': today_stats['videos']['total'],
+                'workshops': today_stats['workshops']['total'],
+                'scholarships': today_stats['scholarships']['total'],
             }
         }
         
@@ -299,42 +300,40 @@ class AnalyticsView(generics.GenericAPIView):
 
 
 # Statistics for specific periods
+# Earliest year monthly_stats reports on
+ANALYTICS_FIRST_YEAR = 2000
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def monthly_stats(request):
     if request.user.role != 'admin':
         return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
     
-    year = int(request.GET.get('year', timezone.now().year))
+    current_year = timezone.localdate().year
+    try:
+        year = int(request.GET.get('year', current_year))
+    except ValueError:
+        return Response({'error': 'year must be a number'}, status=status.HTTP_400_BAD_REQUEST)
+    if not ANALYTICS_FIRST_YEAR <= year <= current_year:
+        return Response({'error': f'year must be between {ANALYTICS_FIRST_YEAR} and {current_year}'},
+                        status=status.HTTP_400_BAD_REQUEST)
+    
+    # Monthly totals from the daily rollup rows
+    users_by_month = rollups.monthly_series('users', year)
+    books_by_month = rollups.monthly_series('books', year)
+    # videos_by_month = rollups.monthly_series('videos', year)
+    workshops_by_month = rollups.monthly_series('workshops', year)
     
     monthly_data = []
     for month in range(1, 13):
-        month_start = datetime(year, month, 1)
-        month_end = datetime(year, month, calendar.monthrange(year, month)[1], 23, 59, 59)
-        
-        users_count = User.objects.filter(
-            created_at__range=[month_start, month_end]
-        ).count()
-        
-        books_count = Book.objects.filter(
-            created_at__range=[month_start, month_end]
-        ).count()
-        
-        # videos_count = Video.objects.filter(
-        #     created_at__range=[month_start, month_end]
-        # ).count()
-        
-        workshops_count = Workshop.objects.filter(
-            created_at__range=[month_start, month_end]
-        ).count()
-        
         monthly_data.append({
             'month': calendar.month_name[month],
             'month_num': month,
-            'users': users_count,
-            'books': books_count,
-            # 'videos': videos_count,
-            'workshops': workshops_count,
+            'users': users_by_month[month - 1]['count'],
+            'books': books_by_month[month - 1]['count'],
+            # 'videos': videos_by_month[month - 1]['count'],
+            'workshops': workshops_by_month[month - 1]['count'],
         })
     
     return Response(monthly_data)
@@ -344,6 +343,7 @@ def monthly_stats(request):
 class UserListView(generics.ListAPIView):
     serializer_class = UserSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
     
     def get_queryset(self):
         if self.request.user.role != 'admin':
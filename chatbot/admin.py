@@ -7,12 +7,16 @@ class ChatSessionAdmin(admin.ModelAdmin):
     list_display = ['user', 'title', 'created_at', 'updated_at', 'is_active', 'message_count']
     list_filter = ['is_active', 'created_at', 'user__role']
     search_fields = ['user__full_name', 'user__email', 'title']
-    readonly_fields = ['id', 'created_at', 'updated_at']
+    readonly_fields = ['id', 'created_at', 'updated_at', 'summary_through', 'summary_message_count']
     date_hierarchy = 'created_at'
     
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related('user').with_message_stats()
+    
     def message_count(self, obj):
-        return obj.messages.count()
+        return obj.get_message_count()
     message_count.short_description = 'Messages'
+    message_count.admin_order_field = 'message_count'
 
 @admin.register(ChatMessage)
 class ChatMessageAdmin(admin.ModelAdmin):
@@ -0,0 +1,233 @@
+# async_views.py
+"""
+Async (ASGI) variants of the chatbot endpoints.
+
+Gemini calls are awaited instead of blocking a worker, so a single
+process served with `uvicorn taleemEdge.asgi:application` can keep many
+LLM requests in flight at once. Under WSGI these views still work, but
+each one runs in its own event loop and gains nothing.
+"""
+import json
+import logging
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from .models import ChatSession, ChatMessage, UserChatPreferences
+from .serializers import (
+    ChatSessionSerializer, ChatMessageSerializer,
+    SendMessageSerializer, CreateSessionSerializer
+)
+from .gemini_service import get_gemini_service
+from .summaries import arefresh_summary, schedule_summary_refresh
+from .titles import DEFAULT_TITLE, schedule_title
+
+logger = logging.getLogger(__name__)
+
+
+def jwt_required(view):
+    """Authenticate the JWT bearer token (DRF can't wrap async views) and set request.user"""
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        try:
+            result = await sync_to_async(JWTAuthentication().authenticate)(request)
+        except (AuthenticationFailed, InvalidToken, TokenError):
+            result = None
+
+        if result is None:
+            return JsonResponse(
+                {'detail': 'Authentication credentials were not provided or are invalid.'},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        request.user = result[0]
+        return await view(request, *args, **kwargs)
+    return wrapper
+
+
+def _json_body(request):
+    try:
+        return json.loads(request.body or b'{}')
+    except ValueError:
+        return None
+
+
+async def _get_session(user, session_id):
+    try:
+        return await ChatSession.objects.aget(id=session_id, user=user, is_active=True)
+    except ChatSession.DoesNotExist:
+        return None
+
+
+@csrf_exempt
+@require_POST
+@jwt_required
+async def send_message_async(request):
+    """
+    Async version of send_message
+    """
+    data = _json_body(request)
+    if data is None:
+        return JsonResponse({'error': 'Invalid JSON body'}, status=status.HTTP_400_BAD_REQUEST)
+
+    serializer = SendMessageSerializer(data=data)
+    if not serializer.is_valid():
+        return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    user_message = serializer.validated_data['message']
+    session_id = serializer.validated_data.get('session_id')
+    gemini_service = get_gemini_service()
+
+    try:
+        # Get or create session
+        if session_id:
+            session = await _get_session(request.user, session_id)
+            if session is None:
+                return JsonResponse({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
+        else:
+            # The title is generated in the background
+            session = await ChatSession.objects.acreate(user=request.user, title=DEFAULT_TITLE)
+            await sync_to_async(schedule_title)(session, user_message)
+
+        # Get recent conversation history (before the new message is saved)
+        history = await session.aget_recent_history() if session_id else []
+
+        # Save user message
+        user_msg = await ChatMessage.objects.acreate(
+            session=session,
+            message_type='user',
+            content=user_message
+        )
+
+        # Get user preferences
+        preferences, _ = await UserChatPreferences.objects.aget_or_create(user=request.user)
+
+        # Generate AI response without blocking the event loop
+        ai_response = await gemini_service.generate_response_async(
+            user_message=user_message,
+            conversation_history=history,
+            system_prompt=preferences.bot_personality,
+            conversation_summary=session.summary
+        )
+
+        # Save AI response
+        ai_msg = await ChatMessage.objects.acreate(
+            session=session,
+            message_type='bot',
+            content=ai_response
+        )
+
+        # Update session timestamp
+        await ChatSession.objects.filter(pk=session.pk).aupdate(updated_at=timezone.now())
+        await sync_to_async(schedule_summary_refresh)(session)
+
+        return JsonResponse({
+            'session_id': str(session.id),
+            'user_message': ChatMessageSerializer(user_msg).data,
+            'bot_response': ChatMessageSerializer(ai_msg).data
+        })
+
+    except Exception as e:
+        logger.error(f"Error processing message: {str(e)}")
+        return JsonResponse(
+            {'error': 'Failed to process message'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+
+@csrf_exempt
+@require_POST
+@jwt_required
+async def create_session_async(request):
+    """
+    Async version of ChatSessionListCreateView.create
+    """
+    data = _json_body(request)
+    if data is None:
+        return JsonResponse({'error': 'Invalid JSON body'}, status=status.HTTP_400_BAD_REQUEST)
+
+    serializer = CreateSessionSerializer(data=data)
+    if not serializer.is_valid():
+        return JsonResponse(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    title = serializer.validated_data.get('title', '')
+    first_message = serializer.validated_data.get('first_message', '')
+
+    # Create new session
+    session = await ChatSession.objects.acreate(
+        user=request.user,
+        title=title or DEFAULT_TITLE
+    )
+
+    # If first message is provided, generate title and process it
+    if first_message:
+        try:
+            gemini_service = get_gemini_service()
+
+            # Generate title in the background if not provided
+            if not title:
+                await sync_to_async(schedule_title)(session, first_message)
+
+            await ChatMessage.objects.acreate(
+                session=session,
+                message_type='user',
+                content=first_message
+            )
+
+            preferences, _ = await UserChatPreferences.objects.aget_or_create(user=request.user)
+
+            ai_response = await gemini_service.generate_response_async(
+                user_message=first_message,
+                system_prompt=preferences.bot_personality
+            )
+
+            await ChatMessage.objects.acreate(
+                session=session,
+                message_type='bot',
+                content=ai_response
+            )
+
+            session.updated_at = timezone.now()
+            await session.asave(update_fields=['updated_at'])
+
+        except Exception as e:
+            logger.error(f"Error processing first message: {str(e)}")
+
+    # Serializer touches the related manager, so run it in a thread
+    data = await sync_to_async(lambda: ChatSessionSerializer(session).data)()
+    return JsonResponse(data, status=status.HTTP_201_CREATED)
+
+
+@require_GET
+@jwt_required
+async def chat_summary_async(request, session_id):
+    """
+    Async version of chat_summary
+    """
+    session = await _get_session(request.user, session_id)
+    if session is None:
+        return JsonResponse({'detail': 'Not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+    if not await session.messages.aexists():
+        return JsonResponse({'summary': 'No messages in this conversation yet.'})
+
+    try:
+        # Served from the stored summary unless enough new messages arrived
+        summary = await arefresh_summary(session)
+
+        return JsonResponse({'summary': summary or "No summary available"})
+
+    except Exception as e:
+        logger.error(f"Error generating summary: {str(e)}")
+        return JsonResponse(
+            {'error': 'Failed to generate summary'},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
@@ -1,115 +1,346 @@
 # services/gemini_service.py
 import google.generativeai as genai
 from django.conf import settings
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterator
 import logging
+import threading
+
+from asgiref.sync import sync_to_async
+
+from .response_cache import get_response_cache
 
 logger = logging.getLogger(__name__)
 
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_gemini_service() -> "GeminiChatService":
+    """
+    Return the process-wide GeminiChatService, creating it on first use.
+    The model (and its gRPC channel) is reused by every request in the process,
+    async ones included (see _generate_async).
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = GeminiChatService()
+    return _service
+
+
+def estimate_tokens(char_count: int) -> int:
+    """Rough token estimate (~4 characters per token) without calling the API"""
+    return (char_count + 3) // 4
+
+
 class GeminiChatService:
-    def __init__(self):
+    def __init__(self, model_name: Optional[str] = None, generation_config: Optional[Dict] = None):
         # Configure Gemini API
         genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel('gemini-1.5-flash')
+        self.model_name = model_name or getattr(settings, 'GEMINI_MODEL', 'gemini-1.5-flash')
+        self.model = genai.GenerativeModel(
+            self.model_name,
+            generation_config=generation_config or getattr(settings, 'GEMINI_GENERATION_CONFIG', None) or None
+        )
+        # None when CHATBOT_RESPONSE_CACHE is unset
+        self.response_cache = get_response_cache(namespace=self.model_name)
+
+    async def _generate_async(self, prompt: str):
+        """
+        generate_content() on a worker thread. The SDK's async client is one
+        process-wide grpc.aio channel tied to the first event loop that used it,
+        while every async_to_sync call under WSGI runs a new loop; the sync
+        channel is thread-safe and shared.
+        """
+        return await sync_to_async(self.model.generate_content, thread_sensitive=False)(prompt)
 
     def generate_response(
         self, 
         user_message: str, 
         conversation_history: List[Dict] = None,
-        system_prompt: str = "You are a helpful AI assistant."
+        system_prompt: str = "You are a helpful AI assistant.",
+        conversation_summary: str = ""
     ) -> str:
         """
         Generate AI response using Gemini API
         """
         try:
-            # Build conversation context
-            context_messages = []
-            
-            # Add system prompt
-            context_messages.append(f"System: {system_prompt}")
+            prompt = self.build_prompt(user_message, conversation_history, system_prompt, conversation_summary)
             
-            # Add conversation history if provided
-            if conversation_history:
-                for msg in conversation_history[-10:]:  # Last 10 messages for context
-                    role = "Human" if msg['message_type'] == 'user' else "Assistant"
-                    context_messages.append(f"{role}: {msg['content']}")
-            
-            # Add current user message
-            context_messages.append(f"Human: {user_message}")
-            context_messages.append("Assistant:")
-            
-            # Join all messages
-            prompt = "\n".join(context_messages)
+            # Identical prompts are answered from the cache
+            if self.response_cache:
+                cached = self.response_cache.get(prompt)
+                if cached is not None:
+                    return cached
             
             # Generate response
             response = self.model.generate_content(prompt)
+            if self.response_cache and response and response.text:
+                self.response_cache.set(prompt, response.text.strip())
+            return self._response_text(response)
+                
+        except Exception as e:
+            logger.error(f"Gemini API error: {str(e)}")
+            return "I'm experiencing some technical difficulties. Please try again later."
+
+    async def generate_response_async(
+        self, 
+        user_message: str, 
+        conversation_history: List[Dict] = None,
+        system_prompt: str = "You are a helpful AI assistant.",
+        conversation_summary: str = ""
+    ) -> str:
+        """
+        Non-blocking version of generate_response for async views
+        """
+        try:
+            prompt = self.build_prompt(user_message, conversation_history, system_prompt, conversation_summary)
+            
+            if self.response_cache:
+                cached = await self.response_cache.aget(prompt)
+                if cached is not None:
+                    return cached
             
-            if response and response.text:
-                return response.text.strip()
-            else:
-                return "I'm sorry, I couldn't generate a response. Please try again."
+            response = await self._generate_async(prompt)
+            if self.response_cache and response and response.text:
+                await self.response_cache.aset(prompt, response.text.strip())
+            return self._response_text(response)
                 
         except Exception as e:
             logger.error(f"Gemini API error: {str(e)}")
             return "I'm experiencing some technical difficulties. Please try again later."
 
+    def _response_text(self, response) -> str:
+        if response and response.text:
+            return response.text.strip()
+        return "I'm sorry, I couldn't generate a response. Please try again."
+
+    def stream_response(
+        self, 
+        user_message: str, 
+        conversation_history: List[Dict] = None,
+        system_prompt: str = "You are a helpful AI assistant.",
+        conversation_summary: str = ""
+    ) -> Iterator[str]:
+        """
+        Generate AI response using Gemini API, yielding text chunks as they arrive
+        """
+        try:
+            prompt = self.build_prompt(user_message, conversation_history, system_prompt, conversation_summary)
+            
+            # A cached answer is sent as a single chunk
+            if self.response_cache:
+                cached = self.response_cache.get(prompt)
+                if cached is not None:
+                    yield cached
+                    return
+            
+            chunks = []
+            for chunk in self.model.generate_content(prompt, stream=True):
+                try:
+                    text = chunk.text
+                except ValueError:
+                    # Chunk without text parts (e.g. blocked by safety filters)
+                    continue
+                if text:
+                    chunks.append(text)
+                    yield text
+            
+            if not chunks:
+                yield "I'm sorry, I couldn't generate a response. Please try again."
+            elif self.response_cache:
+                self.response_cache.set(prompt, "".join(chunks).strip())
+                
+        except Exception as e:
+            logger.error(f"Gemini API streaming error: {str(e)}")
+            yield "I'm experiencing some technical difficulties. Please try again later."
+
+    def build_prompt(
+        self,
+        user_message: str,
+        conversation_history: List[Dict] = None,
+        system_prompt: str = "You are a helpful AI assistant.",
+        conversation_summary: str = ""
+    ) -> str:
+        """
+        Build the text prompt from system prompt, history and the new message
+        """
+        # Build conversation context
+        context_messages = []
+        
+        # Add system prompt
+        context_messages.append(f"System: {system_prompt}")
+        
+        # Add compressed context for messages that no longer fit the history
+        if conversation_summary:
+            context_messages.append(f"Summary of the conversation so far: {conversation_summary}")
+        
+        # Add conversation history if provided
+        if conversation_history:
+            reserved_chars = len(system_prompt) + len(user_message) + len(conversation_summary or "")
+            for msg in self.trim_history(conversation_history, reserved_chars):
+                role = "Human" if msg['message_type'] == 'user' else "Assistant"
+                context_messages.append(f"{role}: {msg['content']}")
+        
+        # Add current user message
+        context_messages.append(f"Human: {user_message}")
+        context_messages.append("Assistant:")
+        
+        # Join all messages
+        return "\n".join(context_messages)
+
+    def trim_history(self, conversation_history: List[Dict], reserved_chars: int = 0) -> List[Dict]:
+        """
+        Keep the most recent messages that fit the context window: at most
+        CHATBOT_HISTORY_MESSAGES, and within CHATBOT_HISTORY_TOKEN_BUDGET when set
+        """
+        max_messages = getattr(settings, 'CHATBOT_HISTORY_MESSAGES', 10)
+        history = conversation_history[-max_messages:] if max_messages else []
+        
+        token_budget = getattr(settings, 'CHATBOT_HISTORY_TOKEN_BUDGET', None)
+        if not token_budget:
+            return history
+        
+        # Walk back from the newest message until the budget is spent
+        budget = token_budget - estimate_tokens(reserved_chars)
+        kept = []
+        for msg in reversed(history):
+            budget -= estimate_tokens(len(msg['content']))
+            if budget < 0:
+                break
+            kept.append(msg)
+        kept.reverse()
+        return kept
+
     def generate_chat_title(self, first_message: str) -> str:
         """
         Generate a title for the chat session based on first message
         """
         try:
-            prompt = f"""
+            response = self.model.generate_content(self._title_prompt(first_message))
+            return self._title_text(response)
+                
+        except Exception as e:
+            logger.error(f"Error generating title: {str(e)}")
+            return "New Chat"
+
+    async def generate_chat_title_async(self, first_message: str) -> str:
+        """
+        Non-blocking version of generate_chat_title
+        """
+        try:
+            response = await self._generate_async(self._title_prompt(first_message))
+            return self._title_text(response)
+                
+        except Exception as e:
+            logger.error(f"Error generating title: {str(e)}")
+            return "New Chat"
+
+    def _title_prompt(self, first_message: str) -> str:
+        return f"""
             Generate a short, descriptive title (maximum 5 words) for a chat conversation that starts with this message:
             
             "{first_message}"
             
             Just return the title, nothing else.
             """
-            
-            response = self.model.generate_content(prompt)
-            
-            if response and response.text:
-                title = response.text.strip()
-                # Limit title length
-                if len(title) > 50:
-                    title = title[:47] + "..."
-                return title
-            else:
-                return "New Chat"
-                
-        except Exception as e:
-            logger.error(f"Error generating title: {str(e)}")
-            return "New Chat"
+
+    def _title_text(self, response) -> str:
+        if response and response.text:
+            title = response.text.strip()
+            # Limit title length
+            if len(title) > 50:
+                title = title[:47] + "..."
+            return title
+        return "New Chat"
 
     def get_conversation_summary(self, messages: List[Dict]) -> str:
         """
         Generate a summary of the conversation
         """
         try:
-            # Take first and last few messages
-            context_msgs = messages[:3] + messages[-3:] if len(messages) > 6 else messages
+            response = self.model.generate_content(self._summary_prompt(messages))
+            return self._summary_text(response)
+                
+        except Exception as e:
+            logger.error(f"Error generating summary: {str(e)}")
+            return "No summary available"
+
+    async def get_conversation_summary_async(self, messages: List[Dict]) -> str:
+        """
+        Non-blocking version of get_conversation_summary
+        """
+        try:
+            response = await self._generate_async(self._summary_prompt(messages))
+            return self._summary_text(response)
+                
+        except Exception as e:
+            logger.error(f"Error generating summary: {str(e)}")
+            return "No summary available"
+
+    def update_conversation_summary(self, previous_summary: str, new_messages: List[Dict]) -> str:
+        """
+        Extend an existing summary with messages that arrived since it was written.
+        Returns an empty string if the model call fails.
+        """
+        try:
+            response = self.model.generate_content(self._update_summary_prompt(previous_summary, new_messages))
+            return response.text.strip() if response and response.text else ""
+                
+        except Exception as e:
+            logger.error(f"Error updating summary: {str(e)}")
+            return ""
+
+    async def update_conversation_summary_async(self, previous_summary: str, new_messages: List[Dict]) -> str:
+        """
+        Non-blocking version of update_conversation_summary
+        """
+        try:
+            response = await self._generate_async(self._update_summary_prompt(previous_summary, new_messages))
+            return response.text.strip() if response and response.text else ""
+                
+        except Exception as e:
+            logger.error(f"Error updating summary: {str(e)}")
+            return ""
+
+    def _update_summary_prompt(self, previous_summary: str, new_messages: List[Dict]) -> str:
+        if not previous_summary:
+            return self._summary_prompt(new_messages)
+        
+        conversation_text = "\n".join([
+            f"{'User' if msg['message_type'] == 'user' else 'Bot'}: {msg['content']}"
+            for msg in new_messages
+        ])
+        
+        return f"""
+            Here is a brief summary of a conversation so far:
             
-            conversation_text = "\n".join([
-                f"{'User' if msg['message_type'] == 'user' else 'Bot'}: {msg['content']}"
-                for msg in context_msgs
-            ])
+            {previous_summary}
             
-            prompt = f"""
-            Provide a brief summary (2-3 sentences) of this conversation:
+            Update the summary (2-3 sentences) to also cover these newer messages:
             
             {conversation_text}
-            """
-            
-            response = self.model.generate_content(prompt)
             
-            if response and response.text:
-                return response.text.strip()
-            else:
-                return "No summary available"
-                
-        except Exception as e:
-            logger.error(f"Error generating summary: {str(e)}")
-            return "No summary available"
+            Just return the updated summary, nothing else.
+            """
+
+    def _summary_prompt(self, messages: List[Dict]) -> str:
+        # Take first and last few messages
+        context_msgs = messages[:3] + messages[-3:] if len(messages) > 6 else messages
         
+        conversation_text = "\n".join([
+            f"{'User' if msg['message_type'] == 'user' else 'Bot'}: {msg['content']}"
+            for msg in context_msgs
+        ])
+        
+        return f"""
+            Provide a brief summary (2-3 sentences) of this conversation:
+            
+            {conversation_text}
+            """
 
-    
\ No newline at end of file
+    def _summary_text(self, response) -> str:
+        if response and response.text:
+            return response.text.strip()
+        return "No summary available"
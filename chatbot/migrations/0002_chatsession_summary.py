@@ -0,0 +1,28 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="chatsession",
+            name="summary",
+            field=models.TextField(blank=True),
+        ),
+        migrations.AddField(
+            model_name="chatsession",
+            name="summary_message_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="chatsession",
+            name="summary_through",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
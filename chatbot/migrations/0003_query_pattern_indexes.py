@@ -0,0 +1,29 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chatbot", "0002_chatsession_summary"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chatmessage",
+            index=models.Index(
+                fields=["session", "timestamp", "id"], name="chat_msg_session_ts_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="chatsession",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["user", "-updated_at"],
+                name="chat_session_user_active_idx",
+            ),
+        ),
+    ]
@@ -1,10 +1,34 @@
 # models.py
+from django.conf import settings
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce, Left
 from django.contrib.auth import get_user_model
 import uuid
 
 User = get_user_model()
 
+
+class ChatSessionQuerySet(models.QuerySet):
+    def with_message_stats(self):
+        """
+        Annotate message_count and the latest message (content preview,
+        timestamp, type) so session lists need no query per session
+        """
+        messages = ChatMessage.objects.filter(session=OuterRef('pk'))
+        latest = messages.order_by('-timestamp', '-id')
+        # Counted in a subquery rather than Count('messages'): a GROUP BY
+        # would drop Meta.ordering from the session list
+        counts = messages.order_by().values('session').annotate(count=Count('id')).values('count')
+        return self.annotate(
+            message_count=Coalesce(Subquery(counts), 0),
+            # Previews are at most 100 characters, one more tells whether to add '...'
+            latest_message_content=Subquery(latest.values(preview=Left('content', 101))[:1]),
+            latest_message_timestamp=Subquery(latest.values('timestamp')[:1]),
+            latest_message_type=Subquery(latest.values('message_type')[:1]),
+        )
+
+
 class ChatSession(models.Model):
     """
     Each user can have multiple chat sessions
@@ -15,16 +39,65 @@ class ChatSession(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
+    
+    # Rolling summary of the conversation (see chatbot/summaries.py)
+    summary = models.TextField(blank=True)
+    summary_through = models.DateTimeField(null=True, blank=True)
+    summary_message_count = models.PositiveIntegerField(default=0)
 
     class Meta:
         ordering = ['-updated_at']
+        indexes = [
+            # A user's active sessions, most recently used first. Partial on
+            # is_active: the session list only ever filters on active sessions, so
+            # the index leaves out soft-deleted rows and stays smaller
+            models.Index(fields=['user', '-updated_at'], condition=models.Q(is_active=True),
+                         name='chat_session_user_active_idx'),
+        ]
+
+    objects = ChatSessionQuerySet.as_manager()
 
     def __str__(self):
         return f"{self.user.full_name} - {self.title}"
 
     def get_latest_message(self):
+        # Prefer the values annotated by with_message_stats()
+        if hasattr(self, 'latest_message_timestamp'):
+            if self.latest_message_timestamp is None:
+                return None
+            return ChatMessage(
+                session=self,
+                content=self.latest_message_content,
+                timestamp=self.latest_message_timestamp,
+                message_type=self.latest_message_type
+            )
         return self.messages.last()
 
+    def get_message_count(self):
+        if hasattr(self, 'message_count'):
+            return self.message_count
+        return self.messages.count()
+
+    def get_recent_history(self, limit=None):
+        """
+        Last `limit` messages as {'content', 'message_type'} dicts, oldest first.
+        Uses a descending LIMIT query so the cost doesn't grow with the session.
+        """
+        if limit is None:
+            limit = getattr(settings, 'CHATBOT_HISTORY_MESSAGES', 10)
+        recent = self.messages.order_by('-timestamp', '-id').values(
+            'content', 'message_type'
+        )[:limit]
+        return list(reversed(recent))
+
+    async def aget_recent_history(self, limit=None):
+        if limit is None:
+            limit = getattr(settings, 'CHATBOT_HISTORY_MESSAGES', 10)
+        recent = self.messages.order_by('-timestamp', '-id').values(
+            'content', 'message_type'
+        )[:limit]
+        return list(reversed([msg async for msg in recent]))
+
 
 class ChatMessage(models.Model):
     """
@@ -46,6 +119,10 @@ class ChatMessage(models.Model):
     
     class Meta:
         ordering = ['timestamp']
+        indexes = [
+            # History, latest message and (timestamp, id) keyset pages per session
+            models.Index(fields=['session', 'timestamp', 'id'], name='chat_msg_session_ts_idx'),
+        ]
 
     def __str__(self):
         return f"{self.session.user.full_name} - {self.message_type} - {self.timestamp}"
@@ -0,0 +1,83 @@
+# pagination.py
+"""
+Keyset pagination for chat messages on (timestamp, id).
+
+A cursor encodes the (timestamp, id) of a message, and a page is the range
+strictly before or after it. Each page is an index range scan, however
+long the session is, and new messages arriving between requests don't
+shift the pages the way OFFSET does.
+"""
+import base64
+import uuid
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(message):
+    raw = f"{message.timestamp.isoformat()}|{message.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        timestamp, message_id = base64.urlsafe_b64decode(padded).decode().split('|')
+        timestamp = parse_datetime(timestamp)
+        if timestamp is None:
+            raise ValueError
+        return timestamp, uuid.UUID(message_id)
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise InvalidCursor('Invalid cursor')
+
+
+def get_per_page(value, default=None):
+    """User-supplied page size, clamped to 1..CHATBOT_MESSAGES_MAX_PER_PAGE"""
+    if default is None:
+        default = getattr(settings, 'CHATBOT_MESSAGES_PER_PAGE', 50)
+    try:
+        per_page = int(value) if value is not None else default
+    except (TypeError, ValueError):
+        per_page = default
+    return max(1, min(per_page, getattr(settings, 'CHATBOT_MESSAGES_MAX_PER_PAGE', 100)))
+
+
+def paginate_messages(queryset, per_page, before=None, after=None):
+    """
+    One page of messages, oldest first.
+    With no cursor this is the newest `per_page` messages; `before` walks
+    back through older messages and `after` fetches newer ones.
+    Returns (messages, pagination) where pagination holds the cursors.
+    """
+    queryset = queryset.order_by()
+    if after:
+        timestamp, message_id = decode_cursor(after)
+        queryset = queryset.filter(
+            Q(timestamp__gt=timestamp) | Q(timestamp=timestamp, id__gt=message_id)
+        )
+        rows = list(queryset.order_by('timestamp', 'id')[:per_page + 1])
+        has_newer, has_older = len(rows) > per_page, True
+        messages = rows[:per_page]
+    else:
+        if before:
+            timestamp, message_id = decode_cursor(before)
+            queryset = queryset.filter(
+                Q(timestamp__lt=timestamp) | Q(timestamp=timestamp, id__lt=message_id)
+            )
+        rows = list(queryset.order_by('-timestamp', '-id')[:per_page + 1])
+        has_older, has_newer = len(rows) > per_page, bool(before)
+        messages = rows[:per_page][::-1]
+
+    return messages, {
+        'per_page': per_page,
+        'has_older': has_older,
+        'has_newer': has_newer,
+        # Pass as ?before= to load older messages, ?after= to poll for newer ones
+        'before': encode_cursor(messages[0]) if messages and has_older else None,
+        'after': encode_cursor(messages[-1]) if messages else after,
+    }
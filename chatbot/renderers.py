@@ -0,0 +1,39 @@
+# renderers.py
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from rest_framework.renderers import BaseRenderer
+
+
+def sse_event(event, data):
+    """Format one Server-Sent Events frame"""
+    return f"event: {event}\ndata: {json.dumps(data, cls=DjangoJSONEncoder)}\n\n"
+
+
+def ndjson_line(event, data):
+    """Format one JSON line for the chunked NDJSON stream"""
+    return json.dumps({'event': event, 'data': data}, cls=DjangoJSONEncoder) + "\n"
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets clients send `Accept: text/event-stream`.
+    Streaming views return a StreamingHttpResponse directly; this only
+    renders non-streamed responses such as validation errors.
+    """
+    media_type = 'text/event-stream'
+    format = 'event-stream'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return sse_event('error', data).encode(self.charset)
+
+
+class NDJSONRenderer(BaseRenderer):
+    """`Accept: application/x-ndjson` variant of EventStreamRenderer"""
+    media_type = 'application/x-ndjson'
+    format = 'ndjson'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return ndjson_line('error', data).encode(self.charset)
@@ -0,0 +1,100 @@
+# response_cache.py
+"""
+Cache of chatbot answers keyed by the normalized prompt.
+
+Students ask the same questions over and over; an identical prompt (system
+prompt, summary, trimmed history and message) is answered from the cache
+instead of another Gemini round-trip. Storage is a regular Django cache
+alias (CHATBOT_RESPONSE_CACHE), so TTL, eviction and the backend
+(locmem / file / database / redis) are configured in CACHES.
+"""
+import hashlib
+import re
+
+from django.conf import settings
+from django.core.cache import caches
+
+_whitespace = re.compile(r'\s+')
+
+
+def normalize_prompt(prompt):
+    """Case and whitespace differences shouldn't cause a miss"""
+    return _whitespace.sub(' ', prompt).strip().lower()
+
+
+class ResponseCache:
+    key_prefix = 'chatbot:response'
+
+    def __init__(self, alias, namespace=''):
+        self.alias = alias
+        # e.g. the model name, so switching models doesn't serve old answers
+        self.namespace = namespace
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def make_key(self, prompt):
+        digest = hashlib.sha256(
+            f"{self.namespace}\n{normalize_prompt(prompt)}".encode('utf-8')
+        ).hexdigest()
+        return f"{self.key_prefix}:{digest}"
+
+    def _stat_key(self, name):
+        return f"{self.key_prefix}:stats:{name}"
+
+    def _record(self, hit):
+        key = self._stat_key('hits' if hit else 'misses')
+        self.cache.add(key, 0, timeout=None)
+        try:
+            self.cache.incr(key)
+        except ValueError:
+            # Evicted between add() and incr()
+            self.cache.set(key, 1, timeout=None)
+
+    async def _arecord(self, hit):
+        key = self._stat_key('hits' if hit else 'misses')
+        await self.cache.aadd(key, 0, timeout=None)
+        try:
+            await self.cache.aincr(key)
+        except ValueError:
+            await self.cache.aset(key, 1, timeout=None)
+
+    def get(self, prompt):
+        response = self.cache.get(self.make_key(prompt))
+        self._record(response is not None)
+        return response
+
+    async def aget(self, prompt):
+        response = await self.cache.aget(self.make_key(prompt))
+        await self._arecord(response is not None)
+        return response
+
+    def set(self, prompt, response):
+        self.cache.set(self.make_key(prompt), response)
+
+    async def aset(self, prompt, response):
+        await self.cache.aset(self.make_key(prompt), response)
+
+    def stats(self):
+        counts = self.cache.get_many([self._stat_key('hits'), self._stat_key('misses')])
+        hits = counts.get(self._stat_key('hits'), 0)
+        misses = counts.get(self._stat_key('misses'), 0)
+        total = hits + misses
+        return {
+            'backend': settings.CACHES[self.alias]['BACKEND'],
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / total, 4) if total else 0.0,
+        }
+
+    def reset_stats(self):
+        self.cache.delete_many([self._stat_key('hits'), self._stat_key('misses')])
+
+
+def get_response_cache(namespace=''):
+    """ResponseCache for the configured alias, or None when caching is disabled"""
+    alias = getattr(settings, 'CHATBOT_RESPONSE_CACHE', None)
+    if not alias:
+        return None
+    return ResponseCache(alias, namespace)
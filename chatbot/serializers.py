@@ -1,6 +1,8 @@
 # serializers.py
+from django.conf import settings
 from rest_framework import serializers
 from .models import ChatSession, ChatMessage, UserChatPreferences
+from .pagination import paginate_messages
 
 class ChatMessageSerializer(serializers.ModelSerializer):
     class Meta:
@@ -10,7 +12,10 @@ class ChatMessageSerializer(serializers.ModelSerializer):
         ]
 
 class ChatSessionSerializer(serializers.ModelSerializer):
-    messages = ChatMessageSerializer(many=True, read_only=True)
+    # Only the most recent messages; older ones are loaded from
+    # sessions/<id>/messages/?before=<messages_before>
+    messages = serializers.SerializerMethodField()
+    messages_before = serializers.SerializerMethodField()
     latest_message = serializers.SerializerMethodField()
     message_count = serializers.SerializerMethodField()
 
@@ -18,9 +23,23 @@ class ChatSessionSerializer(serializers.ModelSerializer):
         model = ChatSession
         fields = [
             'id', 'title', 'created_at', 'updated_at', 'is_active',
-            'messages', 'latest_message', 'message_count'
+            'messages', 'messages_before', 'latest_message', 'message_count'
         ]
 
+    def _recent_messages(self, obj):
+        if not hasattr(obj, '_recent_messages_page'):
+            per_page = getattr(settings, 'CHATBOT_SESSION_RECENT_MESSAGES', 20)
+            obj._recent_messages_page = paginate_messages(obj.messages.all(), per_page)
+        return obj._recent_messages_page
+
+    def get_messages(self, obj):
+        messages, _ = self._recent_messages(obj)
+        return ChatMessageSerializer(messages, many=True).data
+
+    def get_messages_before(self, obj):
+        _, pagination = self._recent_messages(obj)
+        return pagination['before']
+
     def get_latest_message(self, obj):
         latest = obj.get_latest_message()
         if latest:
@@ -32,7 +51,7 @@ class ChatSessionSerializer(serializers.ModelSerializer):
         return None
 
     def get_message_count(self, obj):
-        return obj.messages.count()
+        return obj.get_message_count()
 
 class ChatSessionListSerializer(serializers.ModelSerializer):
     """Lighter serializer for listing sessions"""
@@ -56,7 +75,7 @@ class ChatSessionListSerializer(serializers.ModelSerializer):
         return None
 
     def get_message_count(self, obj):
-        return obj.messages.count()
+        return obj.get_message_count()
 
 class SendMessageSerializer(serializers.Serializer):
     message = serializers.CharField(max_length=5000)
@@ -0,0 +1,98 @@
+# summaries.py
+"""
+Rolling conversation summaries stored on ChatSession.
+
+The summary is only extended with the messages that arrived since it was
+last written, and only once CHATBOT_SUMMARY_EVERY of them have piled up,
+so reading it usually costs no LLM call and prompts stay a fixed size.
+"""
+from django.conf import settings
+from django.db.models import F
+
+from taleemEdge.background import defer
+from .models import ChatSession
+from .gemini_service import get_gemini_service
+
+
+def _summary_every():
+    return getattr(settings, 'CHATBOT_SUMMARY_EVERY', 10)
+
+
+def _unsummarized(session):
+    messages = session.messages.all()
+    if session.summary_through:
+        messages = messages.filter(timestamp__gt=session.summary_through)
+    return messages
+
+
+def _new_messages_query(session):
+    # Newest unsummarized messages first; callers reverse them
+    limit = getattr(settings, 'CHATBOT_SUMMARY_MAX_MESSAGES', 50)
+    return _unsummarized(session).order_by('-timestamp', '-id').values(
+        'content', 'message_type', 'timestamp'
+    )[:limit]
+
+
+def _is_stale(session, pending):
+    # A session with no summary yet is summarized on first request
+    return pending and (not session.summary or pending >= _summary_every())
+
+
+def _apply(session, summary, new_messages, pending):
+    """Set the new summary on the instance and return the values to write, or None"""
+    if not summary:
+        return None
+    session.summary = summary
+    session.summary_through = new_messages[-1]['timestamp']
+    session.summary_message_count += pending
+    return {
+        'summary': session.summary,
+        'summary_through': session.summary_through,
+        'summary_message_count': F('summary_message_count') + pending,
+    }
+
+
+def refresh_summary(session):
+    """Bring session.summary up to date if enough new messages arrived, and return it"""
+    pending = _unsummarized(session).count()
+    if not _is_stale(session, pending):
+        return session.summary
+
+    new_messages = list(reversed(_new_messages_query(session)))
+    summary = get_gemini_service().update_conversation_summary(session.summary, new_messages)
+
+    values = _apply(session, summary, new_messages, pending)
+    if values:
+        # .update() so a summary refresh doesn't bump updated_at and reorder the session list
+        ChatSession.objects.filter(pk=session.pk).update(**values)
+    return session.summary
+
+
+async def arefresh_summary(session):
+    """Async version of refresh_summary"""
+    pending = await _unsummarized(session).acount()
+    if not _is_stale(session, pending):
+        return session.summary
+
+    new_messages = list(reversed([msg async for msg in _new_messages_query(session)]))
+    summary = await get_gemini_service().update_conversation_summary_async(session.summary, new_messages)
+
+    values = _apply(session, summary, new_messages, pending)
+    if values:
+        await ChatSession.objects.filter(pk=session.pk).aupdate(**values)
+    return session.summary
+
+
+def _refresh_in_background(session_id):
+    session = ChatSession.objects.filter(pk=session_id).first()
+    if session:
+        refresh_summary(session)
+
+
+def schedule_summary_refresh(session):
+    """
+    Refresh the summary off the request path once CHATBOT_SUMMARY_EVERY
+    messages have arrived since it was last written
+    """
+    if _unsummarized(session).count() >= _summary_every():
+        defer(_refresh_in_background, session.pk)
@@ -1,3 +1,28 @@
-from django.test import TestCase
+import asyncio
+import threading
+from unittest import mock
 
-# Create your tests here.
+from django.test import SimpleTestCase, override_settings
+
+from .gemini_service import GeminiChatService
+
+
+@override_settings(GEMINI_API_KEY='test-key', CHATBOT_RESPONSE_CACHE=None)
+class AsyncGenerationTests(SimpleTestCase):
+    def test_async_calls_use_the_shared_model_off_the_event_loop(self):
+        service = GeminiChatService()
+        callers = []
+
+        def generate_content(prompt):
+            callers.append(threading.current_thread())
+            return mock.Mock(text=' A title ')
+
+        # Each asyncio.run is a new loop, like every async_to_sync call under WSGI
+        with mock.patch.object(service.model, 'generate_content', side_effect=generate_content), \
+                mock.patch.object(service.model, 'generate_content_async') as generate_content_async:
+            for _ in range(2):
+                self.assertEqual(asyncio.run(service.generate_chat_title_async('Hello')), 'A title')
+
+        self.assertEqual(len(callers), 2)
+        self.assertNotIn(threading.current_thread(), callers)
+        generate_content_async.assert_not_called()
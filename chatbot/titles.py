@@ -0,0 +1,58 @@
+# titles.py
+"""
+Chat session titles.
+
+Sessions start as "New Chat" and the model-generated title is filled in on
+a background thread, so the first reply doesn't wait on a second Gemini
+call. When the background queue is backed up (or the model call fails) a
+title is made from the first words of the message instead.
+"""
+from django.conf import settings
+
+from taleemEdge.background import defer, queue_depth
+from .models import ChatSession
+from .gemini_service import get_gemini_service
+
+DEFAULT_TITLE = "New Chat"
+
+
+def heuristic_title(message, max_words=None):
+    """First few words of the message, e.g. 'How do I apply for...'"""
+    if max_words is None:
+        max_words = getattr(settings, 'CHATBOT_TITLE_WORDS', 6)
+    words = message.split()
+    if not words:
+        return DEFAULT_TITLE
+
+    title = " ".join(words[:max_words])
+    if len(words) > max_words:
+        title += "..."
+    # Same limit as generated titles
+    if len(title) > 50:
+        title = title[:47] + "..."
+    return title
+
+
+def _set_title(session_id, title):
+    # Only replace the placeholder, never a title the user already changed;
+    # .update() so the session isn't reordered by updated_at
+    ChatSession.objects.filter(pk=session_id, title=DEFAULT_TITLE).update(title=title)
+
+
+def generate_title(session_id, first_message):
+    title = get_gemini_service().generate_chat_title(first_message)
+    if not title or title == DEFAULT_TITLE:
+        title = heuristic_title(first_message)
+    _set_title(session_id, title)
+
+
+def schedule_title(session, first_message):
+    """
+    Generate the session title in the background, or set a heuristic
+    title right away if CHATBOT_TITLE_QUEUE_LIMIT tasks are already waiting
+    """
+    if queue_depth() >= getattr(settings, 'CHATBOT_TITLE_QUEUE_LIMIT', 20):
+        session.title = heuristic_title(first_message)
+        _set_title(session.pk, session.title)
+        return
+    defer(generate_title, session.pk, first_message)
@@ -1,6 +1,6 @@
 # urls.py
 from django.urls import path
-from . import views
+from . import views, async_views
 
 app_name = 'chatbot'
 
@@ -14,7 +14,16 @@ urlpatterns = [
     
     # Messages
     path('send-message/', views.send_message, name='send-message'),
+    path('send-message/stream/', views.send_message_stream, name='send-message-stream'),
+    
+    # Async (ASGI) variants
+    path('async/sessions/', async_views.create_session_async, name='session-create-async'),
+    path('async/sessions/<uuid:session_id>/summary/', async_views.chat_summary_async, name='session-summary-async'),
+    path('async/send-message/', async_views.send_message_async, name='send-message-async'),
     
     # User Preferences  
     path('preferences/', views.UserChatPreferencesView.as_view(), name='user-preferences'),
+    
+    # Response cache metrics (admin)
+    path('cache-stats/', views.response_cache_stats, name='response-cache-stats'),
 ]
\ No newline at end of file
@@ -1,11 +1,13 @@
 # views.py
 from rest_framework import generics, status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
 from django.core.paginator import Paginator
-from django.db import transaction
+from django.db import connection, transaction
+from django.http import StreamingHttpResponse
 from django.utils import timezone
 
 from .models import ChatSession, ChatMessage, UserChatPreferences
@@ -14,7 +16,11 @@ from .serializers import (
     ChatMessageSerializer, SendMessageSerializer,
     UserChatPreferencesSerializer, CreateSessionSerializer
 )
-from .gemini_service import GeminiChatService
+from .gemini_service import get_gemini_service
+from .summaries import refresh_summary, schedule_summary_refresh
+from .titles import DEFAULT_TITLE, schedule_title
+from .pagination import InvalidCursor, get_per_page, paginate_messages
+from .renderers import EventStreamRenderer, NDJSONRenderer, sse_event, ndjson_line
 
 import logging
 
@@ -36,7 +42,7 @@ class ChatSessionListCreateView(generics.ListCreateAPIView):
         return ChatSession.objects.filter(
             user=self.request.user, 
             is_active=True
-        )
+        ).with_message_stats()
     
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -48,18 +54,17 @@ class ChatSessionListCreateView(generics.ListCreateAPIView):
         # Create new session
         session = ChatSession.objects.create(
             user=request.user,
-            title=title or "New Chat"
+            title=title or DEFAULT_TITLE
         )
         
         # If first message is provided, generate title and process it
         if first_message:
             try:
-                gemini_service = GeminiChatService()
+                gemini_service = get_gemini_service()
                 
-                # Generate title if not provided
+                # Generate title in the background if not provided
                 if not title:
-                    session.title = gemini_service.generate_chat_title(first_message)
-                    session.save()
+                    schedule_title(session, first_message)
                 
                 # Process first message
                 with transaction.atomic():
@@ -89,7 +94,7 @@ class ChatSessionListCreateView(generics.ListCreateAPIView):
                     )
                     
                     session.updated_at = timezone.now()
-                    session.save()
+                    session.save(update_fields=['updated_at'])
                     
             except Exception as e:
                 logger.error(f"Error processing first message: {str(e)}")
@@ -113,7 +118,7 @@ class ChatSessionDetailView(generics.RetrieveUpdateDestroyAPIView):
         return ChatSession.objects.filter(
             user=self.request.user,
             is_active=True
-        )
+        ).with_message_stats()
     
     def destroy(self, request, *args, **kwargs):
         session = self.get_object()
@@ -134,6 +139,7 @@ def send_message(request):
     
     user_message = serializer.validated_data['message']
     session_id = serializer.validated_data.get('session_id')
+    gemini_service = get_gemini_service()
     
     try:
         with transaction.atomic():
@@ -146,13 +152,15 @@ def send_message(request):
                     is_active=True
                 )
             else:
-                # Create new session
-                gemini_service = GeminiChatService()
-                title = gemini_service.generate_chat_title(user_message)
+                # Create new session; the title is generated in the background
                 session = ChatSession.objects.create(
                     user=request.user,
-                    title=title
+                    title=DEFAULT_TITLE
                 )
+                schedule_title(session, user_message)
+            
+            # Get recent conversation history (before the new message is saved)
+            history = session.get_recent_history() if session_id else []
             
             # Save user message
             user_msg = ChatMessage.objects.create(
@@ -161,22 +169,17 @@ def send_message(request):
                 content=user_message
             )
             
-            # Get conversation history
-            history = list(session.messages.values(
-                'content', 'message_type'
-            ).order_by('timestamp'))
-            
             # Get user preferences
             preferences, _ = UserChatPreferences.objects.get_or_create(
                 user=request.user
             )
             
             # Generate AI response
-            gemini_service = GeminiChatService()
             ai_response = gemini_service.generate_response(
                 user_message=user_message,
-                conversation_history=history[:-1],  # Exclude the just-added user message
-                system_prompt=preferences.bot_personality
+                conversation_history=history,
+                system_prompt=preferences.bot_personality,
+                conversation_summary=session.summary
             )
             
             # Save AI response
@@ -188,7 +191,9 @@ def send_message(request):
             
             # Update session timestamp
             session.updated_at = timezone.now()
-            session.save()
+            session.save(update_fields=['updated_at'])
+            
+            schedule_summary_refresh(session)
             
             # Return both messages
             return Response({
@@ -205,6 +210,103 @@ def send_message(request):
         )
 
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+@renderer_classes([JSONRenderer, EventStreamRenderer, NDJSONRenderer])
+def send_message_stream(request):
+    """
+    Streaming variant of send_message.
+    Emits the bot reply token by token as Server-Sent Events, or as JSON lines
+    when the client sends `Accept: application/x-ndjson`. The bot message is
+    saved once the stream completes.
+    """
+    serializer = SendMessageSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    user_message = serializer.validated_data['message']
+    session_id = serializer.validated_data.get('session_id')
+    
+    gemini_service = get_gemini_service()
+    
+    # Get or create session
+    if session_id:
+        session = get_object_or_404(
+            ChatSession, 
+            id=session_id, 
+            user=request.user, 
+            is_active=True
+        )
+    else:
+        session = ChatSession.objects.create(
+            user=request.user,
+            title=DEFAULT_TITLE
+        )
+        schedule_title(session, user_message)
+    
+    # Get recent conversation history (before the new message is saved)
+    history = session.get_recent_history() if session_id else []
+    
+    # Save user message
+    user_msg = ChatMessage.objects.create(
+        session=session,
+        message_type='user',
+        content=user_message
+    )
+    
+    # Get user preferences
+    preferences, _ = UserChatPreferences.objects.get_or_create(
+        user=request.user
+    )
+    
+    if getattr(request.accepted_renderer, 'format', None) == 'ndjson':
+        frame, content_type = ndjson_line, 'application/x-ndjson'
+    else:
+        frame, content_type = sse_event, 'text/event-stream'
+    
+    def event_stream():
+        yield frame('session', {
+            'session_id': str(session.id),
+            'user_message': ChatMessageSerializer(user_msg).data
+        })
+        
+        # Don't hold a DB connection open while waiting on the model
+        connection.close()
+        
+        chunks = []
+        ai_msg = None
+        try:
+            for text in gemini_service.stream_response(
+                user_message=user_message,
+                conversation_history=history,
+                system_prompt=preferences.bot_personality,
+                conversation_summary=session.summary
+            ):
+                chunks.append(text)
+                yield frame('token', {'text': text})
+        finally:
+            # Persist whatever was generated, even if the client disconnected
+            ai_response = "".join(chunks).strip()
+            if ai_response:
+                ai_msg = ChatMessage.objects.create(
+                    session=session,
+                    message_type='bot',
+                    content=ai_response
+                )
+                ChatSession.objects.filter(pk=session.pk).update(updated_at=timezone.now())
+                schedule_summary_refresh(session)
+        
+        yield frame('done', {
+            'bot_response': ChatMessageSerializer(ai_msg).data if ai_msg else None
+        })
+    
+    response = StreamingHttpResponse(event_stream(), content_type=content_type)
+    response['Cache-Control'] = 'no-cache'
+    # Disable proxy buffering (nginx) so tokens reach the client immediately
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
 class UserChatPreferencesView(generics.RetrieveUpdateAPIView):
     """
     GET: Get user's chat preferences
@@ -224,7 +326,9 @@ class UserChatPreferencesView(generics.RetrieveUpdateAPIView):
 @permission_classes([IsAuthenticated])
 def chat_session_messages(request, session_id):
     """
-    Get paginated messages for a specific chat session
+    Get paginated messages for a specific chat session.
+    Returns the newest `per_page` messages; pass the returned `before`
+    cursor to load older ones or `after` to fetch newer ones.
     """
     session = get_object_or_404(
         ChatSession, 
@@ -234,25 +338,40 @@ def chat_session_messages(request, session_id):
     )
     
     messages = session.messages.all()
+    per_page = get_per_page(request.GET.get('per_page'))
     
-    # Pagination
-    page = request.GET.get('page', 1)
-    per_page = int(request.GET.get('per_page', 50))
-    
-    paginator = Paginator(messages, per_page)
-    page_obj = paginator.get_page(page)
+    # Page numbers are still accepted for older clients
+    if 'page' in request.GET:
+        paginator = Paginator(messages, per_page)
+        page_obj = paginator.get_page(request.GET.get('page'))
+        
+        serializer = ChatMessageSerializer(page_obj.object_list, many=True)
+        
+        return Response({
+            'messages': serializer.data,
+            'pagination': {
+                'current_page': page_obj.number,
+                'total_pages': paginator.num_pages,
+                'has_next': page_obj.has_next(),
+                'has_previous': page_obj.has_previous(),
+                'total_messages': paginator.count
+            }
+        })
     
-    serializer = ChatMessageSerializer(page_obj.object_list, many=True)
+    # Keyset pagination on (timestamp, id) with ?before= / ?after= cursors
+    try:
+        page, pagination = paginate_messages(
+            messages,
+            per_page,
+            before=request.GET.get('before'),
+            after=request.GET.get('after')
+        )
+    except InvalidCursor as e:
+        return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
     
     return Response({
-        'messages': serializer.data,
-        'pagination': {
-            'current_page': page_obj.number,
-            'total_pages': paginator.num_pages,
-            'has_next': page_obj.has_next(),
-            'has_previous': page_obj.has_previous(),
-            'total_messages': paginator.count
-        }
+        'messages': ChatMessageSerializer(page, many=True).data,
+        'pagination': pagination
     })
 
 
@@ -279,20 +398,37 @@ def chat_summary(request, session_id):
         is_active=True
     )
     
-    messages = list(session.messages.values('content', 'message_type'))
-    
-    if not messages:
+    if not session.messages.exists():
         return Response({'summary': 'No messages in this conversation yet.'})
     
     try:
-        gemini_service = GeminiChatService()
-        summary = gemini_service.get_conversation_summary(messages)
+        # Served from the stored summary unless enough new messages arrived
+        summary = refresh_summary(session)
         
-        return Response({'summary': summary})
+        return Response({'summary': summary or "No summary available"})
         
     except Exception as e:
         logger.error(f"Error generating summary: {str(e)}")
         return Response(
             {'error': 'Failed to generate summary'}, 
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+        )
+
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAuthenticated])
+def response_cache_stats(request):
+    """
+    GET: Hit/miss counters of the chatbot response cache (admin only)
+    DELETE: Reset the counters
+    """
+    if request.user.role != 'admin':
+        return Response({'error': 'Admin access required'}, status=status.HTTP_403_FORBIDDEN)
+    
+    response_cache = get_gemini_service().response_cache
+    if not response_cache:
+        return Response({'enabled': False})
+    
+    if request.method == 'DELETE':
+        response_cache.reset_stats()
+    
+    return Response({'enabled': True, **response_cache.stats()})
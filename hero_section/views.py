@@ -7,10 +7,12 @@ from rest_framework.permissions import AllowAny
 from django.http import JsonResponse
 from .models import HeroSection, FeatureCard
 from .serializers import HeroSectionSerializer, FeatureCardSerializer
+from taleemEdge.http_cache import cache_response
 
 @api_view(['GET'])
 @permission_classes([AllowAny]) 
 @authentication_classes([])  
+@cache_response('hero_section.HeroSection')
 def hero_section_api(request):
     """API endpoint to get hero section data"""
     try:
@@ -48,6 +50,7 @@ def hero_section_api(request):
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
+@cache_response('hero_section.FeatureCard')
 def feature_cards_api(request):
     """API endpoint to get feature cards"""
     try:
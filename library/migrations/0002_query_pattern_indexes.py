@@ -0,0 +1,38 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("library", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(
+                fields=["status", "category"], name="book_status_category_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="book",
+            index=models.Index(fields=["created_at"], name="book_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="readingprogress",
+            index=models.Index(
+                fields=["user", "is_completed"], name="reading_user_completed_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="studentbookactivity",
+            index=models.Index(
+                fields=["user", "activity_type", "-timestamp"],
+                name="book_activity_user_type_idx",
+            ),
+        ),
+    ]
@@ -3,6 +3,29 @@ from django.db import models
 from django.conf import settings
 
 User= settings.AUTH_USER_MODEL
+
+class BookQuerySet(models.QuerySet):
+    def with_user_state(self, user):
+        """
+        Annotate per-user read/download flags and prefetch the user's
+        reading progress, so BookSerializer needs no query per book
+        """
+        if not user or not user.is_authenticated:
+            return self
+        
+        return self.annotate(
+            user_has_read=models.Exists(StudentBookActivity.objects.filter(
+                user=user, book=models.OuterRef('pk'), activity_type='read'
+            )),
+            user_has_downloaded=models.Exists(StudentBookActivity.objects.filter(
+                user=user, book=models.OuterRef('pk'), activity_type='download'
+            )),
+        ).prefetch_related(models.Prefetch(
+            'readingprogress_set',
+            queryset=ReadingProgress.objects.filter(user=user),
+            to_attr='user_progress'
+        ))
+
 class Book(models.Model):
     STATUS_CHOICES = [
         ('available', 'Available'),
@@ -39,11 +62,17 @@ class Book(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = BookQuerySet.as_manager()
+    
     def __str__(self):
         return self.title
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['status', 'category'], name='book_status_category_idx'),
+            models.Index(fields=['created_at'], name='book_created_idx'),
+        ]
 
 class StudentBookActivity(models.Model):
     ACTIVITY_TYPES = [
@@ -59,6 +88,9 @@ class StudentBookActivity(models.Model):
     class Meta:
         unique_together = ['user', 'book', 'activity_type']
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['user', 'activity_type', '-timestamp'], name='book_activity_user_type_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} {self.activity_type} {self.book.title}"
@@ -75,6 +107,9 @@ class ReadingProgress(models.Model):
     class Meta:
         unique_together = ['user', 'book']
         ordering = ['-last_read_at']
+        indexes = [
+            models.Index(fields=['user', 'is_completed'], name='reading_user_completed_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.book.title} ({self.progress_percentage}%)"
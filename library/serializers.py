@@ -16,6 +16,8 @@ class BookSerializer(serializers.ModelSerializer):
                  'is_downloaded', 'reading_progress']
     
     def get_is_read(self, obj):
+        if hasattr(obj, 'user_has_read'):
+            return obj.user_has_read
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return StudentBookActivity.objects.filter(
@@ -26,6 +28,8 @@ class BookSerializer(serializers.ModelSerializer):
         return False
     
     def get_is_downloaded(self, obj):
+        if hasattr(obj, 'user_has_downloaded'):
+            return obj.user_has_downloaded
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             return StudentBookActivity.objects.filter(
@@ -36,19 +40,29 @@ class BookSerializer(serializers.ModelSerializer):
         return False
     
     def get_reading_progress(self, obj):
+        # Prefetched by Book.objects.with_user_state()
+        if hasattr(obj, 'user_progress'):
+            progress = obj.user_progress[0] if obj.user_progress else None
+            return self._progress_data(progress)
+        
         request = self.context.get('request')
         if request and request.user.is_authenticated:
             try:
                 progress = ReadingProgress.objects.get(user=request.user, book=obj)
-                return {
-                    'percentage': progress.progress_percentage,
-                    'last_page': progress.last_page_read,
-                    'is_completed': progress.is_completed,
-                    'last_read_at': progress.last_read_at
-                }
+                return self._progress_data(progress)
             except ReadingProgress.DoesNotExist:
                 return None
         return None
+    
+    def _progress_data(self, progress):
+        if progress is None:
+            return None
+        return {
+            'percentage': progress.progress_percentage,
+            'last_page': progress.last_page_read,
+            'is_completed': progress.is_completed,
+            'last_read_at': progress.last_read_at
+        }
 
 class StudentBookActivitySerializer(serializers.ModelSerializer):
     book_title = serializers.CharField(source='book.title', read_only=True)
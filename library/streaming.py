@@ -0,0 +1,169 @@
+# library/streaming.py
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header, http_date, parse_http_date_safe, quote_etag
+
+CHUNK_SIZE = 64 * 1024
+RANGE_RE = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+
+def _file_stats(field_file):
+    """Size and modification time (as a timestamp) of a stored file"""
+    storage = field_file.storage
+    size = storage.size(field_file.name)
+    try:
+        modified = int(storage.get_modified_time(field_file.name).timestamp())
+    except (NotImplementedError, AttributeError):
+        modified = None
+    return size, modified
+
+
+def _make_etag(field_file, size, modified):
+    return quote_etag(f"{os.path.basename(field_file.name)}-{size}-{modified or 0}")
+
+
+def parse_range(header, size):
+    """
+    Parse a single 'bytes=start-end' Range header.
+    Returns (start, end) inclusive, None if the header should be ignored,
+    or False if the range cannot be satisfied.
+    """
+    match = RANGE_RE.match(header.strip()) if header else None
+    if not match:
+        return None
+
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        # Suffix range: the last N bytes
+        length = int(end)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+
+    start = int(start)
+    end = int(end) if end else size - 1
+    if start >= size or end < start:
+        return False
+    return start, min(end, size - 1)
+
+
+def _if_range_matches(request, etag, modified):
+    if_range = request.META.get('HTTP_IF_RANGE')
+    if not if_range:
+        return True
+    if if_range.startswith(('"', 'W/')):
+        return if_range == etag
+    return modified is not None and parse_http_date_safe(if_range) == modified
+
+
+def _iter_range(file, start, length):
+    try:
+        file.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        file.close()
+
+
+def _offload_response(field_file):
+    """Let the front web server send the file (nginx X-Accel-Redirect / X-Sendfile)"""
+    mode = getattr(settings, 'LIBRARY_FILE_OFFLOAD', None)
+    if mode == 'x-accel-redirect':
+        response = HttpResponse()
+        prefix = getattr(settings, 'LIBRARY_X_ACCEL_PREFIX', '/protected-media/')
+        response['X-Accel-Redirect'] = prefix.rstrip('/') + '/' + field_file.name.lstrip('/')
+        return response
+    if mode == 'x-sendfile':
+        response = HttpResponse()
+        response['X-Sendfile'] = field_file.path
+        return response
+    return None
+
+
+def serve_file(request, field_file, filename, as_attachment=False, content_type=None):
+    """
+    Stream a FileField to the client without loading it into memory.
+    Supports ETag/Last-Modified (304), single byte ranges (206/416)
+    and optional X-Accel-Redirect / X-Sendfile offloading.
+    """
+    content_type = content_type or mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+    size, modified = _file_stats(field_file)
+    etag = _make_etag(field_file, size, modified)
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=modified)
+    if not_modified is not None:
+        return not_modified
+
+    response = _offload_response(field_file)
+    if response is None:
+        byte_range = None
+        if _if_range_matches(request, etag, modified):
+            byte_range = parse_range(request.META.get('HTTP_RANGE'), size)
+
+        if byte_range is False:
+            response = HttpResponse(status=416)
+            response['Content-Range'] = f'bytes */{size}'
+            return response
+        if byte_range:
+            start, end = byte_range
+            length = end - start + 1
+            response = StreamingHttpResponse(
+                _iter_range(field_file.storage.open(field_file.name, 'rb'), start, length),
+                status=206,
+                content_type=content_type,
+            )
+            response['Content-Length'] = str(length)
+            response['Content-Range'] = f'bytes {start}-{end}/{size}'
+        else:
+            response = FileResponse(
+                field_file.storage.open(field_file.name, 'rb'),
+                content_type=content_type,
+            )
+            response.block_size = CHUNK_SIZE
+            response['Content-Length'] = str(size)
+
+    response['Content-Type'] = content_type
+    # Quotes, semicolons and non-ASCII in titles are escaped (filename*= for the latter)
+    response['Content-Disposition'] = content_disposition_header(as_attachment, filename)
+    response['Accept-Ranges'] = 'bytes'
+    response['ETag'] = etag
+    if modified is not None:
+        response['Last-Modified'] = http_date(modified)
+    return response
+
+
+def is_initial_request(request):
+    """False for follow-up Range requests, so counters are bumped once per download"""
+    byte_range = request.META.get('HTTP_RANGE')
+    if not byte_range:
+        return True
+    match = RANGE_RE.match(byte_range.strip())
+    return not match or match.group(1) == '0'
+
+
+def starts_download(request, response):
+    """
+    True if serve_file()'s response begins a download: the whole file or a
+    range from byte 0. Revalidations (304), unsatisfiable ranges (416) and
+    follow-up Range requests are not counted.
+    """
+    if response.status_code == 206:
+        return response['Content-Range'].startswith('bytes 0-')
+    if response.status_code != 200:
+        return False
+    if response.has_header('X-Accel-Redirect') or response.has_header('X-Sendfile'):
+        # The web server answers the Range header itself
+        return is_initial_request(request)
+    return True
@@ -1,3 +1,121 @@
-from django.test import TestCase
+import shutil
+import tempfile
 
-# Create your tests here.
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from authentication.models import PlatformActivity, User
+from .models import Book, StudentBookActivity
+from .streaming import is_initial_request, parse_range, serve_file, starts_download
+
+CONTENT = bytes(range(256)) * 4
+
+
+class ParseRangeTests(SimpleTestCase):
+    def test_ranges(self):
+        self.assertEqual(parse_range('bytes=0-99', 1000), (0, 99))
+        self.assertEqual(parse_range('bytes=900-', 1000), (900, 999))
+        self.assertEqual(parse_range('bytes=-100', 1000), (900, 999))
+        self.assertEqual(parse_range('bytes=-5000', 1000), (0, 999))
+        self.assertEqual(parse_range('bytes=990-5000', 1000), (990, 999))
+
+    def test_ignored_and_unsatisfiable_ranges(self):
+        for header in [None, '', 'bytes=-', 'items=0-10', 'bytes=0-1,5-6']:
+            self.assertIsNone(parse_range(header, 1000), header)
+        for header in ['bytes=1000-', 'bytes=50-10', 'bytes=-0']:
+            self.assertIs(parse_range(header, 1000), False, header)
+
+    def test_is_initial_request(self):
+        factory = RequestFactory()
+        self.assertTrue(is_initial_request(factory.get('/')))
+        self.assertTrue(is_initial_request(factory.get('/', HTTP_RANGE='bytes=0-')))
+        self.assertFalse(is_initial_request(factory.get('/', HTTP_RANGE='bytes=100-')))
+
+
+class LibraryFileTestCase(TestCase):
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media = override_settings(MEDIA_ROOT=media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.book = Book.objects.create(
+            title='Physics', author='Author', description='Description', category='physics', pages=10,
+            publish_year=2020, isbn='isbn-1', pdf_file=SimpleUploadedFile('physics.pdf', CONTENT),
+        )
+
+
+class ServeFileTests(LibraryFileTestCase):
+    def serve(self, filename='Physics.pdf', **headers):
+        request = RequestFactory().get('/', **headers)
+        return serve_file(request, self.book.pdf_file, filename, as_attachment=True, content_type='application/pdf')
+
+    def test_full_file(self):
+        response = self.serve()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b''.join(response.streaming_content), CONTENT)
+        self.assertEqual(response['Content-Length'], str(len(CONTENT)))
+        self.assertEqual(response['Accept-Ranges'], 'bytes')
+        self.assertEqual(response['Content-Disposition'], 'attachment; filename="Physics.pdf"')
+        self.assertTrue(starts_download(RequestFactory().get('/'), response))
+
+    def test_byte_range(self):
+        response = self.serve(HTTP_RANGE='bytes=100-199')
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(b''.join(response.streaming_content), CONTENT[100:200])
+        self.assertEqual(response['Content-Range'], f'bytes 100-199/{len(CONTENT)}')
+        self.assertFalse(starts_download(RequestFactory().get('/'), response))
+
+    def test_unsatisfiable_range(self):
+        response = self.serve(HTTP_RANGE=f'bytes={len(CONTENT)}-')
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response['Content-Range'], f'bytes */{len(CONTENT)}')
+
+    def test_if_range_mismatch_sends_the_whole_file(self):
+        response = self.serve(HTTP_RANGE='bytes=100-199', HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+
+        etag = self.serve()['ETag']
+        self.assertEqual(self.serve(HTTP_RANGE='bytes=100-199', HTTP_IF_RANGE=etag).status_code, 206)
+
+    def test_revalidation_is_not_modified(self):
+        first = self.serve()
+        response = self.serve(HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(starts_download(RequestFactory().get('/'), response))
+        self.assertEqual(self.serve(HTTP_IF_MODIFIED_SINCE=first['Last-Modified']).status_code, 304)
+
+    def test_filename_is_escaped(self):
+        disposition = self.serve('Quotes "and"; semicolons\r\nX-Injected: 1 — ürdu.pdf')['Content-Disposition']
+        self.assertNotIn('\n', disposition)
+        self.assertTrue(disposition.startswith("attachment; filename*=utf-8''"))
+        self.assertNotIn('"and"', disposition)
+
+
+class BookDownloadTests(LibraryFileTestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user(
+            username='student', email='student@example.com', password='x', full_name='Student'))
+        self.url = f'/library/books/{self.book.pk}/download/'
+
+    def download_count(self):
+        self.book.refresh_from_db()
+        return self.book.download_count
+
+    def test_download_is_counted_once(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.download_count(), 1)
+        self.assertEqual(StudentBookActivity.objects.filter(activity_type='download').count(), 1)
+        self.assertEqual(PlatformActivity.objects.filter(activity_type='book_download').count(), 1)
+
+        # Follow-up range and revalidation requests
+        self.assertEqual(self.client.get(self.url, HTTP_RANGE='bytes=512-').status_code, 206)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=response['ETag']).status_code, 304)
+        self.assertEqual(self.client.get(self.url, HTTP_RANGE='bytes=5000-').status_code, 416)
+        self.assertEqual(self.download_count(), 1)
+        self.assertEqual(PlatformActivity.objects.filter(activity_type='book_download').count(), 1)
@@ -10,6 +10,7 @@ urlpatterns = [
     # Student Book Access URLs
     path('books/<int:pk>/read/', views.BookReadView.as_view(), name='book-read'),
     path('books/<int:pk>/download/', views.BookDownloadView.as_view(), name='book-download'),
+    path('books/<int:pk>/file/', views.BookFileView.as_view(), name='book-file'),
     path('books/<int:pk>/progress/', views.UpdateReadingProgressView.as_view(), name='update-reading-progress'),
     
     # Student Dashboard and Activities
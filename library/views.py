@@ -8,26 +8,25 @@ from django.contrib.auth import authenticate
 from django.db.models import Count, Q
 from django.utils import timezone
 from django.http import HttpResponse, Http404
+from django.urls import reverse
 from datetime import datetime, timedelta
 from .models import *
 from .serializers import *
 import calendar
 from authentication.models import PlatformActivity
+from authentication.counters import increment
+from .streaming import serve_file, starts_download
+from taleemEdge.pagination import CreatedAtCursorPagination
+from search.backends import search_queryset
+from taleemEdge.http_cache import cache_response
+from django.utils.decorators import method_decorator
 
 class BookListCreateView(generics.ListCreateAPIView):
     serializer_class = BookSerializer
+    pagination_class = CreatedAtCursorPagination
     
     def get_queryset(self):
-        queryset = Book.objects.filter(status='available')
-        
-        # Search functionality
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(author__icontains=search) |
-                Q(description__icontains=search)
-            )
+        queryset = Book.objects.filter(status='available').with_user_state(self.request.user)
         
         # Category filter
         category = self.request.query_params.get('category', None)
@@ -39,6 +38,11 @@ class BookListCreateView(generics.ListCreateAPIView):
         if language:
             queryset = queryset.filter(language__icontains=language)
         
+        # Full-text search, ranked by relevance
+        search = self.request.query_params.get('search', None)
+        if search:
+            queryset = search_queryset(queryset, 'books', search)
+        
         return queryset
     
     def get_permissions(self):
@@ -52,9 +56,11 @@ class BookListCreateView(generics.ListCreateAPIView):
         return super().create(request, *args, **kwargs)
 
 class BookDetailView(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Book.objects.all()
     serializer_class = BookSerializer
     
+    def get_queryset(self):
+        return Book.objects.with_user_state(self.request.user)
+    
     def get_permissions(self):
         if self.request.method in ['PUT', 'PATCH', 'DELETE']:
             return [IsAuthenticated()]
@@ -90,8 +96,7 @@ class BookReadView(APIView):
         )
         
         # Update book read count
-        book.read_count += 1
-        book.save()
+        increment(book, 'read_count')
         
         # Create or update reading progress
         reading_progress, created = ReadingProgress.objects.get_or_create(
@@ -103,6 +108,8 @@ class BookReadView(APIView):
         return Response({
             'message': 'Book opened for reading',
             'pdf_url': request.build_absolute_uri(book.pdf_file.url),
+            # Range-capable URL so the reader can fetch pages lazily
+            'stream_url': request.build_absolute_uri(reverse('book-file', args=[book.pk])),
             'book_details': BookSerializer(book, context={'request': request}).data
         })
 
@@ -118,28 +125,47 @@ class BookDownloadView(APIView):
         if not book.pdf_file:
             return Response({'error': 'PDF file not available'}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Record download activity
-        activity, created = StudentBookActivity.objects.get_or_create(
-            user=request.user,
-            book=book,
-            activity_type='download'
-        )
-         # Create activity log
-        PlatformActivity.objects.create(
-            activity_type='book_download',
-            user_name=request.user.full_name,
-            description=f"New user book download with email {request.user.email}"
-        )
+        # Stream the file instead of reading it into memory
+        response = serve_file(request, book.pdf_file, f"{book.title}.pdf",
+                              as_attachment=True, content_type='application/pdf')
         
-        # Update book download count
-        book.download_count += 1
-        book.save()
+        # Only count responses that start sending the file: not 304 revalidations
+        # or follow-up Range requests
+        if starts_download(request, response):
+            # Record download activity
+            activity, created = StudentBookActivity.objects.get_or_create(
+                user=request.user,
+                book=book,
+                activity_type='download'
+            )
+            # Create activity log
+            PlatformActivity.objects.create(
+                activity_type='book_download',
+                user_name=request.user.full_name,
+                description=f"New user book download with email {request.user.email}"
+            )
+            
+            # Update book download count
+            increment(book, 'download_count')
         
-        # Return file for download
-        response = HttpResponse(book.pdf_file.read(), content_type='application/pdf')
-        response['Content-Disposition'] = f'attachment; filename="{book.title}.pdf"'
         return response
 
+class BookFileView(APIView):
+    """Inline, range-capable PDF stream for the in-browser reader"""
+    permission_classes = [IsAuthenticated]
+    
+    def get(self, request, pk):
+        try:
+            book = Book.objects.get(pk=pk, status='available')
+        except Book.DoesNotExist:
+            return Response({'error': 'Book not found'}, status=status.HTTP_404_NOT_FOUND)
+        
+        if not book.pdf_file:
+            return Response({'error': 'PDF file not available'}, status=status.HTTP_400_BAD_REQUEST)
+        
+        return serve_file(request, book.pdf_file, f"{book.title}.pdf",
+                          content_type='application/pdf')
+
 class UpdateReadingProgressView(APIView):
     permission_classes = [IsAuthenticated]
     
@@ -219,6 +245,7 @@ class StudentDashboardView(APIView):
         serializer = StudentDashboardSerializer(dashboard_data)
         return Response(serializer.data)
 
+@method_decorator(cache_response('library.Book'), name='get')
 class BookCategoriesView(APIView):
     def get(self, request):
         categories = Book.CATEGORY_CHOICES
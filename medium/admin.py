@@ -1,12 +1,13 @@
 # admin.py
 from django.contrib import admin
-from .models import BlogPost, Category
+from .models import BlogPost, Category, Tag
 
 @admin.register(BlogPost)
 class BlogPostAdmin(admin.ModelAdmin):
     list_display = ['title', 'author', 'status', 'views', 'created_at']
     list_filter = ['status', 'author', 'created_at']
-    search_fields = ['title', 'author', 'tags']
+    search_fields = ['title', 'author', 'tags__name']
+    filter_horizontal = ['tags']
     readonly_fields = ['views', 'created_at', 'updated_at']
     list_per_page = 20
 
@@ -14,3 +15,8 @@ class BlogPostAdmin(admin.ModelAdmin):
 class CategoryAdmin(admin.ModelAdmin):
     list_display = ['name', 'slug', 'created_at']
     prepopulated_fields = {'slug': ('name',)}
+
+@admin.register(Tag)
+class TagAdmin(admin.ModelAdmin):
+    list_display = ['name', 'created_at']
+    search_fields = ['name']
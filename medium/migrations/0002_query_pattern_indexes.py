@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("medium", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                fields=["status", "-views"], name="blog_status_views_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,78 @@
+from django.db import migrations, models
+
+
+# Tag.name max_length; the old field held up to 500 characters of tags
+TAG_MAX_LENGTH = 50
+
+
+def split_tags(value):
+    names = []
+    for name in (value or "").split(','):
+        name = " ".join(name.split()).lower()[:TAG_MAX_LENGTH].rstrip()
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def copy_tags_to_table(apps, schema_editor):
+    BlogPost = apps.get_model('medium', 'BlogPost')
+    Tag = apps.get_model('medium', 'Tag')
+    Through = BlogPost.tags.through
+
+    posts = {pk: split_tags(text) for pk, text in BlogPost.objects.values_list('pk', 'tags_text')}
+    names = {name for post_names in posts.values() for name in post_names}
+    Tag.objects.bulk_create([Tag(name=name) for name in sorted(names)], ignore_conflicts=True)
+    tag_ids = dict(Tag.objects.values_list('name', 'pk'))
+    Through.objects.bulk_create([
+        Through(blogpost_id=pk, tag_id=tag_ids[name])
+        for pk, post_names in posts.items() for name in post_names
+    ], batch_size=1000)
+
+
+def copy_tags_to_text(apps, schema_editor):
+    BlogPost = apps.get_model('medium', 'BlogPost')
+    for post in BlogPost.objects.prefetch_related('tags'):
+        post.tags_text = ", ".join(tag.name for tag in post.tags.all())
+        post.save(update_fields=['tags_text'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("medium", "0002_query_pattern_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Tag",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                ("name", models.CharField(max_length=50, unique=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                "ordering": ["name"],
+            },
+        ),
+        migrations.RenameField(
+            model_name="blogpost",
+            old_name="tags",
+            new_name="tags_text",
+        ),
+        # The old column gets a default so reversing the RemoveField works on a populated table
+        migrations.AlterField(
+            model_name="blogpost",
+            name="tags_text",
+            field=models.CharField(blank=True, default="", max_length=500),
+        ),
+        migrations.AddField(
+            model_name="blogpost",
+            name="tags",
+            field=models.ManyToManyField(related_name="posts", to="medium.tag"),
+        ),
+        migrations.RunPython(copy_tags_to_table, copy_tags_to_text),
+        migrations.RemoveField(
+            model_name="blogpost",
+            name="tags_text",
+        ),
+    ]
@@ -4,6 +4,26 @@ from django.utils import timezone
 from authentication.models import User
 from django.conf import settings
 
+class Tag(models.Model):
+    name = models.CharField(max_length=50, unique=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    
+    class Meta:
+        ordering = ['name']
+    
+    def __str__(self):
+        return self.name
+    
+    def save(self, *args, **kwargs):
+        self.name = self.normalize(self.name)
+        super().save(*args, **kwargs)
+    
+    @staticmethod
+    def normalize(name):
+        """Tags are matched exactly, so store them lowercased with single spaces, cut to fit the column"""
+        name = " ".join(str(name).split()).lower()
+        return name[:Tag._meta.get_field('name').max_length].rstrip()
+
 class BlogPost(models.Model):
     STATUS_CHOICES = [
         ('draft', 'Draft'),
@@ -17,7 +37,7 @@ class BlogPost(models.Model):
     read_time = models.CharField(max_length=20, help_text="e.g., '8 min read'")
     medium_url = models.URLField(max_length=500, blank=True, null=True)
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='draft')
-    tags = models.CharField(max_length=500, help_text="Comma-separated tags")
+    tags = models.ManyToManyField(Tag, related_name='posts')
     views = models.PositiveIntegerField(default=0)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -25,6 +45,10 @@ class BlogPost(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Published posts by popularity
+            models.Index(fields=['status', '-views'], name='blog_status_views_idx'),
+        ]
     
     def __str__(self):
         return self.title
@@ -35,8 +59,14 @@ class BlogPost(models.Model):
         super().save(*args, **kwargs)
     
     def get_tags_list(self):
-        """Return tags as a list"""
-        return [tag.strip() for tag in self.tags.split(',') if tag.strip()]
+        """Return tag names as a list (uses prefetch_related('tags') when present)"""
+        return [tag.name for tag in self.tags.all()]
+    
+    def set_tags(self, names):
+        """Replace the post's tags, creating any that don't exist yet"""
+        names = list(dict.fromkeys(Tag.normalize(name) for name in names if str(name).strip()))
+        Tag.objects.bulk_create([Tag(name=name) for name in names], ignore_conflicts=True)
+        self.tags.set(Tag.objects.filter(name__in=names))
 
 class Category(models.Model):
     name = models.CharField(max_length=100, unique=True)
@@ -1,8 +1,36 @@
 # serializers.py
 from rest_framework import serializers
-from .models import BlogPost, Category
+from taleemEdge.fields import CommaSeparatedListField
+from .models import BlogPost, Category, Tag
 
-class BlogPostSerializer(serializers.ModelSerializer):
+
+class TagsField(CommaSeparatedListField):
+    """Post tags as "ai, machine learning"; reads the prefetched Tag rows"""
+    child = serializers.CharField(max_length=Tag._meta.get_field('name').max_length)
+    
+    def to_representation(self, value):
+        return super().to_representation([tag.name for tag in value.all()])
+
+
+class TaggedPostSerializerMixin:
+    """Saves the validated `tags` list through BlogPost.set_tags()"""
+    
+    def create(self, validated_data):
+        tags = validated_data.pop('tags', [])
+        post = super().create(validated_data)
+        post.set_tags(tags)
+        return post
+    
+    def update(self, instance, validated_data):
+        tags = validated_data.pop('tags', None)
+        post = super().update(instance, validated_data)
+        if tags is not None:
+            post.set_tags(tags)
+        return post
+
+
+class BlogPostSerializer(TaggedPostSerializerMixin, serializers.ModelSerializer):
+    tags = TagsField(allow_empty=False)
     tags_list = serializers.SerializerMethodField()
     
     class Meta:
@@ -17,7 +45,9 @@ class BlogPostSerializer(serializers.ModelSerializer):
     def get_tags_list(self, obj):
         return obj.get_tags_list()
 
-class BlogPostCreateSerializer(serializers.ModelSerializer):
+class BlogPostCreateSerializer(TaggedPostSerializerMixin, serializers.ModelSerializer):
+    tags = TagsField(allow_empty=False)
+    
     class Meta:
         model = BlogPost
         fields = [
@@ -26,6 +56,7 @@ class BlogPostCreateSerializer(serializers.ModelSerializer):
         ]
 
 class BlogPostListSerializer(serializers.ModelSerializer):
+    tags = TagsField(read_only=True)
     tags_list = serializers.SerializerMethodField()
     
     class Meta:
@@ -43,4 +74,11 @@ class CategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ['id', 'name', 'slug', 'created_at']
-        read_only_fields = ['id', 'created_at']
\ No newline at end of file
+        read_only_fields = ['id', 'created_at']
+
+class TagCloudSerializer(serializers.ModelSerializer):
+    post_count = serializers.IntegerField(read_only=True)
+    
+    class Meta:
+        model = Tag
+        fields = ['id', 'name', 'post_count']
@@ -1,3 +1,156 @@
-from django.test import TestCase
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from authentication.models import User
+from search.backends import BasicSearchBackend, search_queryset
+from taleemEdge.http_cache import get_cache, get_versions
+from .models import BlogPost, Tag
+from .serializers import BlogPostCreateSerializer
+
+
+def make_post(title, tags=(), **kwargs):
+    post = BlogPost.objects.create(title=title, author='Author', excerpt='Excerpt', read_time='5 min read',
+                                   status='published', **kwargs)
+    post.set_tags(tags)
+    return post
+
+
+class TagSearchTests(TestCase):
+    def search(self, query):
+        return list(search_queryset(BlogPost.objects.all(), 'blog', query).values_list('title', flat=True))
+
+    def test_posts_are_found_by_tag_name(self):
+        make_post('Getting started', tags=['Machine Learning'])
+        make_post('Learning to cook', content='Kitchen basics')
+        make_post('Unrelated')
+        self.assertEqual(self.search('machine'), ['Getting started'])
+        # A tag match ranks with the title, above a match in the body
+        make_post('Notes', content='Some machine code')
+        self.assertEqual(self.search('machine'), ['Getting started', 'Notes'])
+
+    def test_index_follows_tag_changes(self):
+        post = make_post('Getting started', tags=['python'])
+        post.set_tags(['django'])
+        self.assertEqual(self.search('python'), [])
+        self.assertEqual(self.search('django'), ['Getting started'])
+
+        tag = Tag.objects.get(name='django')
+        tag.name = 'flask'
+        tag.save()
+        self.assertEqual(self.search('flask'), ['Getting started'])
+
+        tag.posts.clear()
+        self.assertEqual(self.search('flask'), [])
+
+    def test_basic_backend_matches_tags_without_repeating_posts(self):
+        make_post('Getting started', tags=['python', 'python web'])
+        matches = BasicSearchBackend().search(BlogPost.objects.all(), 'blog', 'python')
+        self.assertEqual(list(matches.values_list('title', flat=True)), ['Getting started'])
+
+    def test_deleting_a_tag_removes_it_from_the_index(self):
+        make_post('Getting started', tags=['python'])
+        Tag.objects.get(name='python').delete()
+        self.assertEqual(self.search('python'), [])
+
+
+class TagNameTests(TestCase):
+    def test_names_are_normalized_and_cut_to_the_column(self):
+        self.assertEqual(Tag.normalize('  Machine   LEARNING '), 'machine learning')
+        self.assertEqual(Tag.normalize('x' * 49 + ' yz'), 'x' * 49)
+        self.assertEqual(Tag.objects.create(name='a' * 80).name, 'a' * 50)
+
+    def test_serializer_rejects_tags_longer_than_the_column(self):
+        serializer = BlogPostCreateSerializer(data={
+            'title': 'Post', 'author': 'Author', 'excerpt': 'Excerpt', 'read_time': '5 min read',
+            'tags': 'short, ' + 'x' * 51,
+        })
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('tags', serializer.errors)
+
+
+class CachedBlogViewTests(TestCase):
+    def setUp(self):
+        get_cache().clear()
+
+    def test_saving_a_post_bumps_its_version(self):
+        before = get_versions(['medium.BlogPost', 'medium.Tag'])
+        post = make_post('Getting started')
+        after = get_versions(['medium.BlogPost', 'medium.Tag'])
+        self.assertNotEqual(after[0], before[0])
+        self.assertEqual(after[1], before[1])
+
+        post.delete()
+        self.assertNotEqual(get_versions(['medium.BlogPost'])[0], after[0])
+
+    def test_featured_posts_are_cached_until_a_post_or_tag_changes(self):
+        make_post('Getting started', tags=['python'])
+        first = self.client.get('/blog/featured/')
+        self.assertEqual(first.json()[0]['tags'], 'python')
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get('/blog/featured/').json(), first.json())
+        self.assertEqual(self.client.get('/blog/featured/', HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+
+        tag = Tag.objects.get(name='python')
+        tag.name = 'django'
+        tag.save()
+        self.assertEqual(self.client.get('/blog/featured/').json()[0]['tags'], 'django')
+
+
+class BlogPostListPaginationTests(TestCase):
+    def setUp(self):
+        posts = [make_post(f'Post {number}') for number in range(5)]
+        # Several posts share a timestamp; the cursor must not skip or repeat them
+        BlogPost.objects.filter(pk__in=[post.pk for post in posts[1:4]]).update(created_at=posts[1].created_at)
+        self.client = APIClient()
+        self.client.force_authenticate(User.objects.create_user(
+            username='student', email='student@example.com', password='x'))
+
+    def test_cursor_pages_cover_every_post_once(self):
+        seen, url = [], '/blog/posts/?page_size=2'
+        while url:
+            body = self.client.get(url).json()
+            self.assertNotIn('count', body)
+            seen.extend(post['id'] for post in body['results'])
+            url = body['next']
+        self.assertEqual(sorted(seen), sorted(BlogPost.objects.values_list('pk', flat=True)))
+        self.assertEqual(len(seen), 5)
+
+    def test_page_numbers_and_search_use_page_number_pagination(self):
+        self.assertEqual(self.client.get('/blog/posts/', {'page': 1}).json()['count'], 5)
+        self.assertEqual(self.client.get('/blog/posts/', {'search': 'post'}).json()['count'], 5)
+
+
+class TagMigrationTests(TransactionTestCase):
+    before = [('medium', '0002_query_pattern_indexes')]
+    after = [('medium', '0003_tags')]
+
+    def migrate(self, targets):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(targets)
+        return executor.loader.project_state(targets).apps
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_tag_strings_become_tag_rows(self):
+        old_apps = self.migrate(self.before)
+        OldPost = old_apps.get_model('medium', 'BlogPost')
+        defaults = dict(author='Author', excerpt='Excerpt', read_time='5 min read')
+        first = OldPost.objects.create(title='First', tags='AI,  Machine  Learning, ai,, ', **defaults)
+        second = OldPost.objects.create(title='Second', tags='machine learning, ' + 'y' * 60, **defaults)
+        OldPost.objects.create(title='Untagged', tags='', **defaults)
+
+        new_apps = self.migrate(self.after)
+        Post = new_apps.get_model('medium', 'BlogPost')
+        Tag = new_apps.get_model('medium', 'Tag')
+        self.assertEqual(sorted(Tag.objects.values_list('name', flat=True)),
+                         ['ai', 'machine learning', 'y' * 50])
+        self.assertEqual(sorted(Post.objects.get(pk=first.pk).tags.values_list('name', flat=True)),
+                         ['ai', 'machine learning'])
+        self.assertEqual(sorted(Post.objects.get(pk=second.pk).tags.values_list('name', flat=True)),
+                         ['machine learning', 'y' * 50])
+        self.assertFalse(Post.objects.get(title='Untagged').tags.exists())
@@ -24,6 +24,7 @@ urlpatterns = [
     # Public endpoints
     path('stats/', views.blog_stats, name='blog-stats'),
     path('featured/', views.featured_posts, name='featured-posts'),
+    path('tags/', views.tag_cloud, name='tag-cloud'),
     path('tags/<str:tag_name>/', views.posts_by_tag, name='posts-by-tag'),
     
     # User role endpoint
@@ -4,46 +4,51 @@ from rest_framework.decorators import api_view,permission_classes
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django_filters.rest_framework import DjangoFilterBackend
-from django.db.models import Q
-from .models import BlogPost, Category
+from django.db.models import Count, Q
+from .models import BlogPost, Category, Tag
 from .serializers import (
     BlogPostSerializer, BlogPostCreateSerializer, 
-    BlogPostListSerializer, CategorySerializer
+    BlogPostListSerializer, CategorySerializer, TagCloudSerializer
 )
 from .permissions import is_admin_user,is_student_user
+from authentication.counters import increment
+from search.filters import FullTextSearchFilter
+from taleemEdge.http_cache import cache_response
+from taleemEdge.pagination import CreatedAtCursorPagination
 
 class BlogPostListView(generics.ListAPIView):
     """Get all blog posts with filtering and search"""
-    queryset = BlogPost.objects.all()
+    queryset = BlogPost.objects.prefetch_related('tags')
     serializer_class = BlogPostListSerializer
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter, FullTextSearchFilter]
     filterset_fields = ['status', 'author']
-    search_fields = ['title', 'author', 'tags', 'excerpt']
+    search_type = 'blog'
     ordering_fields = ['created_at', 'views', 'title']
-    ordering = ['-created_at']
+    # The cursor pages on the OrderingFilter's ordering; id breaks created_at ties
+    ordering = ['-created_at', '-id']
+    pagination_class = CreatedAtCursorPagination
     
     def get_queryset(self):
         queryset = super().get_queryset()
         
-        # Filter by tags
+        # Filter by tags (posts must have every tag; exact match)
         tags = self.request.query_params.get('tags', None)
         if tags:
-            tag_list = [tag.strip() for tag in tags.split(',')]
+            tag_list = [Tag.normalize(tag) for tag in tags.split(',') if tag.strip()]
             for tag in tag_list:
-                queryset = queryset.filter(tags__icontains=tag)
+                queryset = queryset.filter(tags__name=tag)
         
         return queryset
 
 class BlogPostDetailView(generics.RetrieveAPIView):
     """Get single blog post by ID"""
-    queryset = BlogPost.objects.all()
+    queryset = BlogPost.objects.prefetch_related('tags')
     serializer_class = BlogPostSerializer
     
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
         # Increment views
-        instance.views += 1
-        instance.save(update_fields=['views'])
+        increment(instance, 'views')
         serializer = self.get_serializer(instance)
         return Response(serializer.data)
 
@@ -93,6 +98,7 @@ class CategoryDetailView(generics.RetrieveUpdateDestroyAPIView):
 # Custom API Views
 @api_view(['GET'])
 @permission_classes([AllowAny])
+@cache_response('medium.BlogPost', skip=lambda request: is_admin_user(request.user))
 def blog_stats(request):
     """Get blog statistics"""
     user = request.user
@@ -119,9 +125,10 @@ def blog_stats(request):
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
+@cache_response('medium.BlogPost', 'medium.Tag')
 def featured_posts(request):
     """Get featured posts (most viewed published posts)"""
-    posts = BlogPost.objects.filter(status='published').order_by('-views')[:3]
+    posts = BlogPost.objects.filter(status='published').prefetch_related('tags').order_by('-views')[:3]
     serializer = BlogPostListSerializer(posts, many=True)
     return Response(serializer.data)
 
@@ -130,12 +137,27 @@ def featured_posts(request):
 def posts_by_tag(request, tag_name):
     """Get published posts by specific tag"""
     posts = BlogPost.objects.filter(
-        tags__icontains=tag_name,
+        tags__name=Tag.normalize(tag_name),
         status='published'
-    ).order_by('-created_at')
+    ).prefetch_related('tags').order_by('-created_at')
     serializer = BlogPostListSerializer(posts, many=True)
     return Response(serializer.data)
 
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def tag_cloud(request):
+    """Get tags of published posts with their post counts, most used first"""
+    try:
+        limit = min(int(request.query_params.get('limit', 50)), 200)
+    except ValueError:
+        return Response({'error': 'limit must be a number'}, status=status.HTTP_400_BAD_REQUEST)
+    
+    tags = Tag.objects.filter(posts__status='published').annotate(
+        post_count=Count('posts')
+    ).order_by('-post_count', 'name')[:max(limit, 1)]
+    serializer = TagCloudSerializer(tags, many=True)
+    return Response(serializer.data)
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def increment_views(request, pk):
@@ -149,8 +171,7 @@ def increment_views(request, pk):
             # Students and public can only access published posts
             post = BlogPost.objects.get(pk=pk, status='published')
             
-        post.views += 1
-        post.save(update_fields=['views'])
+        increment(post, 'views')
         return Response({'message': 'Views incremented', 'views': post.views})
     except BlogPost.DoesNotExist:
         return Response({'error': 'Post not found'}, status=status.HTTP_404_NOT_FOUND)
@@ -1,4 +1,11 @@
 from django.contrib import admin
+from django.db import models
+from taleemEdge.fields import CommaSeparatedFormField
 from .models import Mentor
 # Register your models here.
-admin.site.register(Mentor)
+
+
+@admin.register(Mentor)
+class MentorAdmin(admin.ModelAdmin):
+    # Expertise, specializations and languages are edited as "a, b, c"
+    formfield_overrides = {models.JSONField: {'form_class': CommaSeparatedFormField}}
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("mentore", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="mentor",
+            index=models.Index(fields=["created_at"], name="mentor_created_idx"),
+        ),
+    ]
@@ -0,0 +1,66 @@
+from django.db import migrations, models
+
+LIST_FIELDS = ['expertise_areas', 'specializations', 'languages']
+
+
+def split_values(value):
+    values = []
+    for item in (value or "").split(','):
+        item = item.strip()
+        if item and item not in values:
+            values.append(item)
+    return values
+
+
+def text_to_lists(apps, schema_editor):
+    Mentor = apps.get_model('mentore', 'Mentor')
+    objects = list(Mentor.objects.all())
+    for obj in objects:
+        for field in LIST_FIELDS:
+            setattr(obj, field, split_values(getattr(obj, f'{field}_text')))
+    Mentor.objects.bulk_update(objects, LIST_FIELDS, batch_size=1000)
+
+
+def lists_to_text(apps, schema_editor):
+    Mentor = apps.get_model('mentore', 'Mentor')
+    objects = list(Mentor.objects.all())
+    for obj in objects:
+        for field in LIST_FIELDS:
+            setattr(obj, f'{field}_text', ", ".join(getattr(obj, field)))
+    Mentor.objects.bulk_update(objects, [f'{field}_text' for field in LIST_FIELDS], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("mentore", "0002_query_pattern_indexes"),
+    ]
+
+    operations = [
+        *[
+            migrations.RenameField(model_name="mentor", old_name=field, new_name=f"{field}_text")
+            for field in LIST_FIELDS
+        ],
+        *[
+            # Old columns get a default so reversing the RemoveFields works on populated tables
+            migrations.AlterField(
+                model_name="mentor",
+                name=f"{field}_text",
+                field=models.TextField(blank=True, default=""),
+            )
+            for field in LIST_FIELDS
+        ],
+        *[
+            migrations.AddField(
+                model_name="mentor",
+                name=field,
+                field=models.JSONField(default=list, help_text="List of values"),
+            )
+            for field in LIST_FIELDS
+        ],
+        migrations.RunPython(text_to_lists, lists_to_text),
+        *[
+            migrations.RemoveField(model_name="mentor", name=f"{field}_text")
+            for field in LIST_FIELDS
+        ],
+    ]
@@ -16,13 +16,18 @@ class Mentor(models.Model):
     bio = models.TextField()
     location = models.CharField(max_length=255)
     availability = models.CharField(max_length=255)
-    expertise_areas = models.TextField(help_text="Comma-separated values")
-    specializations = models.TextField(help_text="Comma-separated values")
-    languages = models.TextField(help_text="Comma-separated values")
+    expertise_areas = models.JSONField(default=list, help_text="List of values")
+    specializations = models.JSONField(default=list, help_text="List of values")
+    languages = models.JSONField(default=list, help_text="List of values")
     linkedin_profile = models.URLField(blank=True)
     profile_picture = models.ImageField(upload_to='mentors/', blank=True, null=True)  # ✅ New
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
     created_at = models.DateTimeField(auto_now_add=True)
     
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at'], name='mentor_created_idx'),
+        ]
+    
     def __str__(self):
         return self.full_name
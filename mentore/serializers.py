@@ -1,9 +1,13 @@
 # serializers.py
 from rest_framework import serializers
+from taleemEdge.fields import CommaSeparatedListField
 from .models import *
 
 
 class MentorSerializer(serializers.ModelSerializer):
+    expertise_areas = CommaSeparatedListField(allow_empty=False)
+    specializations = CommaSeparatedListField(allow_empty=False)
+    languages = CommaSeparatedListField(allow_empty=False)
     expertise_areas_list = serializers.SerializerMethodField()
     specializations_list = serializers.SerializerMethodField()
     languages_list = serializers.SerializerMethodField()
@@ -14,13 +18,13 @@ class MentorSerializer(serializers.ModelSerializer):
         fields = '__all__'
     
     def get_expertise_areas_list(self, obj):
-        return [area.strip() for area in obj.expertise_areas.split(',') if area.strip()]
+        return obj.expertise_areas
     
     def get_specializations_list(self, obj):
-        return [spec.strip() for spec in obj.specializations.split(',') if spec.strip()]
+        return obj.specializations
     
     def get_languages_list(self, obj):
-        return [lang.strip() for lang in obj.languages.split(',') if lang.strip()]
+        return obj.languages
     
     def get_profile_picture_url(self, obj):
         if obj.profile_picture:
@@ -1,3 +1,34 @@
+from django.contrib.admin.sites import AdminSite
 from django.test import TestCase
 
-# Create your tests here.
+from .admin import MentorAdmin
+from .models import Mentor
+
+
+class MentorAdminFormTests(TestCase):
+    def form_class(self):
+        return MentorAdmin(Mentor, AdminSite()).get_form(request=None)
+
+    def test_list_fields_are_edited_as_comma_separated_text(self):
+        mentor = Mentor.objects.create(
+            full_name='Mentor', email='mentor@example.com', job_title='Engineer', years_of_experience=5,
+            bio='Bio', location='Lahore', availability='Weekends', expertise_areas=['Python', 'Data'],
+            specializations=['Web'], languages=['English'],
+        )
+        form = self.form_class()(instance=mentor)
+        self.assertEqual(form['expertise_areas'].value(), 'Python, Data')
+        # Re-submitting the rendered text is not a change
+        self.assertFalse(form.fields['expertise_areas'].has_changed(mentor.expertise_areas, 'Python, Data'))
+
+    def test_comma_separated_input_is_saved_as_a_list(self):
+        form = self.form_class()(data={
+            'full_name': 'Mentor', 'email': 'mentor@example.com', 'job_title': 'Engineer',
+            'years_of_experience': 5, 'bio': 'Bio', 'location': 'Lahore', 'availability': 'Weekends',
+            'expertise_areas': 'Python,  Data, , Python', 'specializations': 'Web', 'languages': 'English, Urdu',
+            'status': 'pending',
+        })
+        self.assertTrue(form.is_valid(), form.errors)
+        mentor = form.save()
+        mentor.refresh_from_db()
+        self.assertEqual(mentor.expertise_areas, ['Python', 'Data'])
+        self.assertEqual(mentor.languages, ['English', 'Urdu'])
@@ -7,6 +7,9 @@ from rest_framework.permissions import IsAuthenticated, AllowAny
 from .models import *
 from .serializers import *
 from authentication.models import PlatformActivity
+from authentication.rollups import expire_snapshots
+from taleemEdge.pagination import CreatedAtCursorPagination
+from search.filters import FullTextSearchFilter
 
 
 class MentorListCreateView(generics.ListCreateAPIView):
@@ -53,6 +56,8 @@ def bulk_approve_mentors(request):
     updated_count = Mentor.objects.filter(
         id__in=mentor_ids
     ).update(status='approved' if action == 'approve' else 'rejected')
+    # update() skips the signals that expire the dashboard's approved/pending counts
+    expire_snapshots('mentors')
     
     return Response({
         'message': f'Successfully {action}d {updated_count} mentors',
@@ -64,8 +69,9 @@ def bulk_approve_mentors(request):
 class StudentMentorListView(generics.ListAPIView):
     serializer_class = MentorSerializer
     permission_classes = [AllowAny]
-    filter_backends = [filters.SearchFilter]
-    search_fields = ['full_name', 'job_title', 'company', 'expertise_areas', 'specializations', 'languages']
+    pagination_class = CreatedAtCursorPagination
+    filter_backends = [FullTextSearchFilter]
+    search_type = 'mentors'
 
     def get_queryset(self):
         return Mentor.objects.filter(status='approved')
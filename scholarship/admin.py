@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.db import models
+from taleemEdge.fields import CommaSeparatedFormField
 from .models import Scholarship, ScholarshipApplication, Notification
 
 
@@ -9,6 +11,8 @@ class ScholarshipAdmin(admin.ModelAdmin):
     list_filter = ['status', 'academic_level', 'category', 'country', 'created_at']
     search_fields = ['title', 'provider', 'category', 'country']
     readonly_fields = ['created_at', 'total_applications']
+    # Criteria, requirements and benefits are edited as "a, b, c"
+    formfield_overrides = {models.JSONField: {'form_class': CommaSeparatedFormField}}
     
     fieldsets = (
         ('Basic Information', {
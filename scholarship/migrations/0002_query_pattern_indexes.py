@@ -0,0 +1,39 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("scholarship", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                fields=["user", "-created_at"], name="notif_user_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="notification",
+            index=models.Index(
+                condition=models.Q(("is_read", False)),
+                fields=["user", "-created_at"],
+                name="notif_user_unread_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="scholarship",
+            index=models.Index(fields=["created_at"], name="scholarship_created_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="scholarshipapplication",
+            index=models.Index(
+                fields=["student", "status"], name="sch_app_student_status_idx"
+            ),
+        ),
+    ]
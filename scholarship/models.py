@@ -1,6 +1,23 @@
 from django.db import models
 from authentication.models import User
-from django.db.models import Count
+from django.db.models import Count, OuterRef, Subquery
+
+
+class ScholarshipQuerySet(models.QuerySet):
+    def with_application_stats(self):
+        """Annotate application counts so total_applications/is_full need no extra query"""
+        return self.annotate(application_count=Count('applications', distinct=True))
+    
+    def with_user_application(self, user):
+        """Annotate the given student's application status (None if not applied)"""
+        return self.annotate(
+            user_application_status=Subquery(
+                ScholarshipApplication.objects.filter(
+                    scholarship=OuterRef('pk'), student=user
+                ).values('status')[:1]
+            )
+        )
+
 
 class Scholarship(models.Model):
     STATUS_CHOICES = [
@@ -27,14 +44,24 @@ class Scholarship(models.Model):
     academic_level = models.CharField(max_length=20, choices=ACADEMIC_LEVELS)
     country = models.CharField(max_length=100)
     application_url = models.URLField()
-    eligibility_criteria = models.TextField(help_text="Comma-separated values")
-    requirements = models.TextField(help_text="Comma-separated values")
-    benefits = models.TextField(help_text="Comma-separated values")
+    eligibility_criteria = models.JSONField(default=list, help_text="List of values")
+    requirements = models.JSONField(default=list, help_text="List of values")
+    benefits = models.JSONField(default=list, help_text="List of values")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='upcoming')
     created_at = models.DateTimeField(auto_now_add=True)
     
+    objects = ScholarshipQuerySet.as_manager()
+    
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at'], name='scholarship_created_idx'),
+        ]
+    
     @property
     def total_applications(self):
+        # Prefer the value annotated by with_application_stats()
+        if hasattr(self, 'application_count'):
+            return self.application_count
         return self.applications.count()
     
     @property
@@ -64,6 +91,9 @@ class ScholarshipApplication(models.Model):
     
     class Meta:
         unique_together = ['scholarship', 'student']  # Student can only apply once per scholarship
+        indexes = [
+            models.Index(fields=['student', 'status'], name='sch_app_student_status_idx'),
+        ]
     
     def __str__(self):
         return f"{self.student.username} - {self.scholarship.title}"
@@ -87,6 +117,13 @@ class Notification(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Notification list per user, newest first
+            models.Index(fields=['user', '-created_at'], name='notif_user_created_idx'),
+            # Unread counts and mark-all-read; partial so it only holds unread rows
+            models.Index(fields=['user', '-created_at'], condition=models.Q(is_read=False),
+                         name='notif_user_unread_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.title}"
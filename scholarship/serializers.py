@@ -2,6 +2,7 @@ from rest_framework import serializers
 from authentication.models import User
 from .models import *
 from authentication.serializers import UserSerializer
+from taleemEdge.fields import CommaSeparatedListField
 
 # class UserSerializer(serializers.ModelSerializer):
 #     class Meta:
@@ -10,6 +11,9 @@ from authentication.serializers import UserSerializer
 
 
 class ScholarshipSerializer(serializers.ModelSerializer):
+    eligibility_criteria = CommaSeparatedListField(allow_empty=False)
+    requirements = CommaSeparatedListField(allow_empty=False)
+    benefits = CommaSeparatedListField(allow_empty=False)
     eligibility_criteria_list = serializers.SerializerMethodField()
     requirements_list = serializers.SerializerMethodField()
     benefits_list = serializers.SerializerMethodField()
@@ -21,13 +25,13 @@ class ScholarshipSerializer(serializers.ModelSerializer):
         fields = '__all__'
     
     def get_eligibility_criteria_list(self, obj):
-        return [criteria.strip() for criteria in obj.eligibility_criteria.split(',') if criteria.strip()]
+        return obj.eligibility_criteria
     
     def get_requirements_list(self, obj):
-        return [req.strip() for req in obj.requirements.split(',') if req.strip()]
+        return obj.requirements
     
     def get_benefits_list(self, obj):
-        return [benefit.strip() for benefit in obj.benefits.split(',') if benefit.strip()]
+        return obj.benefits
 
 
 class ScholarshipListSerializer(serializers.ModelSerializer):
@@ -89,12 +93,17 @@ class StudentDashboardSerializer(serializers.ModelSerializer):
                  'max_applicants']
     
     def get_has_applied(self, obj):
+        # Annotated by Scholarship.objects.with_user_application()
+        if hasattr(obj, 'user_application_status'):
+            return obj.user_application_status is not None
         user = self.context['request'].user
         return ScholarshipApplication.objects.filter(
             scholarship=obj, student=user
         ).exists()
     
     def get_application_status(self, obj):
+        if hasattr(obj, 'user_application_status'):
+            return obj.user_application_status
         user = self.context['request'].user
         application = ScholarshipApplication.objects.filter(
             scholarship=obj, student=user
@@ -1,4 +1,8 @@
-from .models import Notification
+from django.conf import settings
+
+from authentication.models import User
+from taleemEdge.background import defer
+from .models import Notification, ScholarshipApplication
 
 
 def send_notification(user, title, message, notification_type, scholarship=None, application=None):
@@ -30,23 +34,65 @@ def get_user_unread_notifications_count(user):
     return Notification.objects.filter(user=user, is_read=False).count()
 
 
-def notify_admins_new_application(application):
+def send_bulk_notifications(users, title, message, notification_type, scholarship=None,
+                            application=None, batch_size=500):
     """
-    Notify all admin users about a new scholarship application
+    Create the same notification for many users with batched bulk INSERTs
+    instead of one INSERT per user. Returns the number of notifications created.
     """
-    from django.contrib.auth.models import User
+    created = 0
+    batch = []
+    for user_id in users.values_list('id', flat=True).iterator():
+        batch.append(Notification(
+            user_id=user_id,
+            title=title,
+            message=message,
+            notification_type=notification_type,
+            scholarship=scholarship,
+            application=application
+        ))
+        if len(batch) >= batch_size:
+            Notification.objects.bulk_create(batch)
+            created += len(batch)
+            batch = []
     
-    admin_users = User.objects.filter(profile__role='admin')
+    if batch:
+        Notification.objects.bulk_create(batch)
+        created += len(batch)
     
-    for admin in admin_users:
-        send_notification(
-            user=admin,
-            title="New Scholarship Application",
-            message=f"New application received for '{application.scholarship.title}' from {application.student.get_full_name() or application.student.username}",
-            notification_type='scholarship_application',
-            scholarship=application.scholarship,
-            application=application
-        )
+    return created
+
+
+def _fan_out_new_application(application_id):
+    application = ScholarshipApplication.objects.select_related(
+        'scholarship', 'student'
+    ).get(pk=application_id)
+    student = application.student
+    
+    return send_bulk_notifications(
+        users=User.objects.filter(role='admin'),
+        title="New Scholarship Application",
+        message=f"{student.full_name or student.username} applied for '{application.scholarship.title}'",
+        notification_type='scholarship_application',
+        scholarship=application.scholarship,
+        application=application
+    )
+
+
+def notify_admins_new_application(application, defer_fan_out=None):
+    """
+    Notify all admin users about a new scholarship application.
+    By default (NOTIFICATION_FANOUT_ASYNC) the fan-out runs on a background
+    worker after the transaction commits, so apply latency doesn't grow
+    with the number of admins.
+    """
+    if defer_fan_out is None:
+        defer_fan_out = getattr(settings, 'NOTIFICATION_FANOUT_ASYNC', True)
+    
+    if defer_fan_out:
+        defer(_fan_out_new_application, application.pk)
+        return None
+    return _fan_out_new_application(application.pk)
 
 
 def notify_student_status_update(application, old_status):
@@ -3,11 +3,14 @@ from rest_framework.response import Response
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from authentication.models import User
-from django.db.models import Count, Q
+from django.db.models import Count, Q, Prefetch
 from django.utils import timezone
 from .models import *
 from .serializers import *
-from .utils import send_notification
+from .utils import send_notification, notify_admins_new_application
+from taleemEdge.pagination import CreatedAtCursorPagination
+from taleemEdge.http_cache import cache_response
+from django.utils.decorators import method_decorator
 
 
 class IsAdminUser(permissions.BasePermission):
@@ -35,9 +38,10 @@ class IsStudentUser(permissions.BasePermission):
 class AdminScholarshipListCreateView(generics.ListCreateAPIView):
     """Admin can view all scholarships with stats and create new ones"""
     permission_classes = [IsAdminUser]
+    pagination_class = CreatedAtCursorPagination
     
     def get_queryset(self):
-        return Scholarship.objects.all().order_by('-created_at')
+        return Scholarship.objects.with_application_stats().order_by('-created_at')
     
     def get_serializer_class(self):
         if self.request.method == 'GET':
@@ -46,26 +50,35 @@ class AdminScholarshipListCreateView(generics.ListCreateAPIView):
     
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
-        serializer = self.get_serializer(queryset, many=True)
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
         
         # Add summary stats
+        status_counts = Scholarship.objects.aggregate(
+            total=Count('id'),
+            active=Count('id', filter=Q(status='active')),
+            upcoming=Count('id', filter=Q(status='upcoming')),
+            closed=Count('id', filter=Q(status='closed')),
+        )
         stats = {
-            'total_scholarships': queryset.count(),
-            'active_scholarships': queryset.filter(status='active').count(),
-            'upcoming_scholarships': queryset.filter(status='upcoming').count(),
-            'closed_scholarships': queryset.filter(status='closed').count(),
+            'total_scholarships': status_counts['total'],
+            'active_scholarships': status_counts['active'],
+            'upcoming_scholarships': status_counts['upcoming'],
+            'closed_scholarships': status_counts['closed'],
             'total_applications': ScholarshipApplication.objects.count(),
         }
         
         return Response({
             'scholarships': serializer.data,
-            'stats': stats
+            'stats': stats,
+            'next': self.paginator.get_next_link(),
+            'previous': self.paginator.get_previous_link(),
         })
 
 
 class AdminScholarshipDetailView(generics.RetrieveUpdateDestroyAPIView):
     """Admin can view, update, delete specific scholarship with application details"""
-    queryset = Scholarship.objects.all()
+    queryset = Scholarship.objects.with_application_stats()
     serializer_class = ScholarshipSerializer
     permission_classes = [IsAdminUser]
     
@@ -96,7 +109,9 @@ class AdminDashboardView(generics.GenericAPIView):
     def get(self, request):
         # Recent applications (last 10)
         recent_applications = ScholarshipApplication.objects.select_related(
-            'student', 'scholarship'
+            'student'
+        ).prefetch_related(
+            Prefetch('scholarship', queryset=Scholarship.objects.with_application_stats())
         ).order_by('-applied_at')[:10]
         
         stats = {
@@ -117,7 +132,9 @@ class AdminApplicationsListView(generics.ListAPIView):
     
     def get_queryset(self):
         queryset = ScholarshipApplication.objects.select_related(
-            'student', 'scholarship'
+            'student'
+        ).prefetch_related(
+            Prefetch('scholarship', queryset=Scholarship.objects.with_application_stats())
         ).order_by('-applied_at')
         
         # Filter by status if provided
@@ -168,24 +185,30 @@ class StudentScholarshipListView(generics.ListAPIView):
     def get_queryset(self):
         return Scholarship.objects.filter(
             Q(status='active') | Q(status='upcoming')
-        ).order_by('-created_at')
+        ).with_application_stats().with_user_application(self.request.user).order_by('-created_at')
     
     def list(self, request, *args, **kwargs):
         queryset = self.get_queryset()
         serializer = self.get_serializer(queryset, many=True, context={'request': request})
+        scholarships = serializer.data
         
-        # Get student's application stats
-        user_applications = ScholarshipApplication.objects.filter(student=request.user)
+        # Get student's application stats in a single conditional aggregate
+        user_stats = ScholarshipApplication.objects.filter(student=request.user).aggregate(
+            total=Count('id'),
+            pending=Count('id', filter=Q(status='pending')),
+            approved=Count('id', filter=Q(status='approved')),
+        )
         
         stats = {
+            # queryset is already evaluated by the serializer, so this uses the cache
             'total_available_scholarships': queryset.count(),
-            'user_total_applications': user_applications.count(),
-            'user_pending_applications': user_applications.filter(status='pending').count(),
-            'user_approved_applications': user_applications.filter(status='approved').count(),
+            'user_total_applications': user_stats['total'],
+            'user_pending_applications': user_stats['pending'],
+            'user_approved_applications': user_stats['approved'],
         }
         
         return Response({
-            'scholarships': serializer.data,
+            'scholarships': scholarships,
             'stats': stats
         })
 
@@ -198,7 +221,7 @@ class StudentScholarshipDetailView(generics.RetrieveAPIView):
     def get_queryset(self):
         return Scholarship.objects.filter(
             Q(status='active') | Q(status='upcoming')
-        )
+        ).with_application_stats()
     
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -232,17 +255,8 @@ class StudentApplyScholarshipView(generics.CreateAPIView):
     def perform_create(self, serializer):
         application = serializer.save(student=self.request.user)
         
-        # Send notification to all admins
-        admin_users = User.objects.filter(role='admin')
-        for admin in admin_users:
-            send_notification(
-                user=admin,
-                title="New Scholarship Application",
-                message=f"{self.request.user.get_full_name() or self.request.user.username} applied for '{application.scholarship.title}'",
-                notification_type='scholarship_application',
-                scholarship=application.scholarship,
-                application=application
-            )
+        # Notify all admins (bulk INSERT, deferred to a background worker)
+        notify_admins_new_application(application)
         
         return application
 
@@ -255,7 +269,9 @@ class StudentApplicationsListView(generics.ListAPIView):
     def get_queryset(self):
         return ScholarshipApplication.objects.filter(
             student=self.request.user
-        ).select_related('scholarship').order_by('-applied_at')
+        ).prefetch_related(
+            Prefetch('scholarship', queryset=Scholarship.objects.with_application_stats())
+        ).order_by('-applied_at')
 
 
 # SHARED VIEWS
@@ -263,6 +279,7 @@ class NotificationListView(generics.ListAPIView):
     """Users can view their notifications"""
     serializer_class = NotificationSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
     
     def get_queryset(self):
         return Notification.objects.filter(user=self.request.user)
@@ -295,13 +312,16 @@ def mark_all_notifications_read(request):
 
 
 # PUBLIC VIEWS (for non-authenticated users to browse)
+# Applications change total_applications / is_full
+@method_decorator(cache_response('scholarship.Scholarship', 'scholarship.ScholarshipApplication'), name='get')
 class PublicScholarshipListView(generics.ListAPIView):
     """Public view of active scholarships"""
     serializer_class = ScholarshipListSerializer
     permission_classes = [AllowAny]
+    pagination_class = CreatedAtCursorPagination
     
     def get_queryset(self):
-        return Scholarship.objects.filter(status='active').order_by('-created_at')
+        return Scholarship.objects.filter(status='active').with_application_stats().order_by('-created_at')
 
 
 class PublicScholarshipDetailView(generics.RetrieveAPIView):
@@ -310,4 +330,4 @@ class PublicScholarshipDetailView(generics.RetrieveAPIView):
     permission_classes = [AllowAny]
     
     def get_queryset(self):
-        return Scholarship.objects.filter(status='active')
\ No newline at end of file
+        return Scholarship.objects.filter(status='active').with_application_stats()
@@ -0,0 +1,263 @@
+# backends.py
+"""
+Full-text search backends.
+
+    search_queryset(Book.objects.filter(status='available'), 'books', 'linear algebra')
+
+returns the queryset narrowed to matches, annotated with `search_rank`
+(higher is better) and ordered by it. The backend follows the database:
+
+- PostgreSQL: weighted SearchVector matched against a websearch query,
+  served by the GIN expression indexes created in search/migrations.
+- SQLite: an FTS5 table (`search_index`) kept in sync by post_save / m2m_changed /
+  post_delete signals and ranked with bm25.
+- Anything else, or SQLite without FTS5: the old icontains OR-chain.
+
+Set SEARCH_BACKEND to a dotted path to force a particular class.
+"""
+import re
+from functools import reduce
+from operator import add
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, FloatField, OuterRef, Q, Subquery, TextField, Value, When
+from django.utils.module_loading import import_string
+
+from .registry import SEARCH_TYPES, document_for, get_spec, split_path
+
+RANK = 'search_rank'
+
+
+def _config():
+    return getattr(settings, 'SEARCH_CONFIG', 'english')
+
+
+def _max_candidates():
+    return getattr(settings, 'SEARCH_MAX_CANDIDATES', 1000)
+
+
+class BaseSearchBackend:
+    def search(self, queryset, doc_type, query, order_by_rank=True):
+        raise NotImplementedError
+
+    def index_object(self, doc_type, instance):
+        """Called after an indexed model is saved; nothing to do unless the index is a separate table"""
+
+    def remove_object(self, doc_type, pk):
+        pass
+
+    def rebuild(self, doc_types=None):
+        return 0
+
+    def _no_matches(self, queryset):
+        # Keep the rank annotation so callers can still order or select by it
+        return queryset.annotate(**{RANK: Value(0.0, output_field=FloatField())}).none()
+
+    def _ranked(self, queryset, order_by_rank):
+        return queryset.order_by(f'-{RANK}', '-pk') if order_by_rank else queryset
+
+
+class BasicSearchBackend(BaseSearchBackend):
+    """Substring match on every indexed field; no ranking"""
+
+    def search(self, queryset, doc_type, query, order_by_rank=True):
+        spec = get_spec(doc_type)
+        condition = Q()
+        for field in spec['fields']:
+            condition |= Q(**{f'{field}__icontains': query})
+        for path in spec.get('related', {}):
+            # A subquery, so a row matching several related objects isn't repeated
+            matching = queryset.model._default_manager.filter(**{f'{path}__icontains': query})
+            condition |= Q(pk__in=matching.values('pk'))
+        # All matches rank equally, so keep the caller's ordering
+        return queryset.filter(condition).annotate(**{RANK: Value(0.0, output_field=FloatField())})
+
+
+def search_vector(doc_type):
+    """Weighted tsvector expression; the GIN indexes are built from the same expression"""
+    from django.contrib.postgres.search import SearchVector
+
+    return reduce(add, [
+        SearchVector(field, weight=weight, config=_config())
+        for field, weight in get_spec(doc_type)['fields'].items()
+    ])
+
+
+def related_vector(doc_type, model):
+    """
+    Weighted tsvector of the type's `related` text, one row per object:
+    the related values are aggregated in a subquery over the through table.
+    None when the type has no related text.
+    """
+    from django.contrib.postgres.aggregates import StringAgg
+    from django.contrib.postgres.search import SearchVector
+
+    vectors = []
+    for path, weight in get_spec(doc_type).get('related', {}).items():
+        relation, field = split_path(path)
+        m2m = model._meta.get_field(relation)
+        source, target = m2m.m2m_field_name(), m2m.m2m_reverse_field_name()
+        text = m2m.remote_field.through._default_manager.filter(
+            **{source: OuterRef('pk')}
+        ).order_by().values(source).annotate(text=StringAgg(f'{target}__{field}', ' ')).values('text')
+        vectors.append(SearchVector(Subquery(text, output_field=TextField()), weight=weight, config=_config()))
+    return reduce(add, vectors) if vectors else None
+
+
+class PostgresSearchBackend(BaseSearchBackend):
+    def search(self, queryset, doc_type, query, order_by_rank=True):
+        from django.contrib.postgres.search import SearchQuery, SearchRank
+
+        vector = search_vector(doc_type)
+        related = related_vector(doc_type, queryset.model)
+        if related is not None:
+            # Related text lives in other tables, so the GIN expression index
+            # can't cover it; such types are matched against the whole vector
+            vector = vector + related
+        search_query = SearchQuery(query, search_type='websearch', config=_config())
+        queryset = queryset.annotate(
+            search_document=vector
+        ).filter(
+            search_document=search_query
+        ).annotate(**{RANK: SearchRank(vector, search_query)})
+        return self._ranked(queryset, order_by_rank)
+
+
+_token = re.compile(r'\w+', re.UNICODE)
+
+
+def fts_query(query):
+    """
+    Turn user input into a safe FTS5 MATCH expression: every word must
+    match, and the last one is a prefix so partially typed words work
+    """
+    tokens = _token.findall(query)
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return " ".join(terms)
+
+
+class SQLiteFTSBackend(BaseSearchBackend):
+    table = 'search_index'
+    # Row ids are pk * TYPE_SLOTS + type id, so each document has a fixed rowid
+    TYPE_SLOTS = 16
+    # bm25 column weights: doc_type, title, body
+    weights = (0.0, 10.0, 1.0)
+
+    def __init__(self):
+        self._available = False
+
+    def available(self):
+        # Only a positive answer is cached, so the table is picked up once migrated
+        if not self._available:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [self.table]
+                )
+                self._available = cursor.fetchone() is not None
+        return self._available
+
+    def _rowid(self, doc_type, pk):
+        return pk * self.TYPE_SLOTS + get_spec(doc_type)['id']
+
+    def search(self, queryset, doc_type, query, order_by_rank=True):
+        if not self.available():
+            return BasicSearchBackend().search(queryset, doc_type, query, order_by_rank)
+
+        match = fts_query(query)
+        if not match:
+            return self._no_matches(queryset)
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"SELECT rowid, bm25({self.table}, %s, %s, %s) AS score FROM {self.table} "
+                f"WHERE {self.table} MATCH %s AND doc_type = %s ORDER BY score LIMIT %s",
+                [*self.weights, match, doc_type, _max_candidates()]
+            )
+            # bm25 is lower-is-better; flip it so higher ranks first like Postgres
+            ranks = {rowid // self.TYPE_SLOTS: -score for rowid, score in cursor.fetchall()}
+
+        if not ranks:
+            return self._no_matches(queryset)
+
+        queryset = queryset.filter(pk__in=list(ranks)).annotate(**{RANK: Case(
+            *[When(pk=pk, then=Value(rank)) for pk, rank in ranks.items()],
+            default=Value(0.0),
+            output_field=FloatField()
+        )})
+        return self._ranked(queryset, order_by_rank)
+
+    def index_object(self, doc_type, instance):
+        if not self.available():
+            return
+        title, body = document_for(doc_type, instance)
+        rowid = self._rowid(doc_type, instance.pk)
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [rowid])
+            cursor.execute(
+                f"INSERT INTO {self.table} (rowid, doc_type, title, body) VALUES (%s, %s, %s, %s)",
+                [rowid, doc_type, title, body]
+            )
+
+    def remove_object(self, doc_type, pk):
+        if not self.available():
+            return
+        with connection.cursor() as cursor:
+            cursor.execute(f"DELETE FROM {self.table} WHERE rowid = %s", [self._rowid(doc_type, pk)])
+
+    def rebuild(self, doc_types=None):
+        """Re-index every row of the given types (all by default); returns the row count"""
+        if not self.available():
+            return 0
+        indexed = 0
+        with connection.cursor() as cursor:
+            for doc_type in doc_types or SEARCH_TYPES:
+                spec = get_spec(doc_type)
+                cursor.execute(f"DELETE FROM {self.table} WHERE doc_type = %s", [doc_type])
+                model = apps.get_model(spec['model'])
+                objects = model._default_manager.only('pk', *spec['fields']).prefetch_related(
+                    *[split_path(path)[0] for path in spec.get('related', {})]
+                )
+                rows = [
+                    (self._rowid(doc_type, obj.pk), doc_type, *document_for(doc_type, obj))
+                    for obj in objects.iterator(chunk_size=2000)
+                ]
+                cursor.executemany(
+                    f"INSERT INTO {self.table} (rowid, doc_type, title, body) VALUES (%s, %s, %s, %s)",
+                    rows
+                )
+                indexed += len(rows)
+        return indexed
+
+
+_backend = None
+
+
+def get_search_backend():
+    global _backend
+    if _backend is None:
+        backend_path = getattr(settings, 'SEARCH_BACKEND', None)
+        if backend_path:
+            _backend = import_string(backend_path)()
+        elif connection.vendor == 'postgresql':
+            _backend = PostgresSearchBackend()
+        elif connection.vendor == 'sqlite':
+            _backend = SQLiteFTSBackend()
+        else:
+            _backend = BasicSearchBackend()
+    return _backend
+
+
+def search_queryset(queryset, doc_type, query, order_by_rank=True):
+    """Filter `queryset` to full-text matches for `query`, annotated with search_rank"""
+    return get_search_backend().search(queryset, doc_type, query, order_by_rank)
+
+
+def is_ranked(queryset):
+    """True if the queryset is ordered by search relevance"""
+    order_by = queryset.query.order_by
+    return bool(order_by) and order_by[0] == f'-{RANK}'
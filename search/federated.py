@@ -0,0 +1,156 @@
+# federated.py
+"""
+Federated search across every registered content type.
+
+Each type is searched on its own worker thread. Results are merged by a
+score normalized per type (the best hit of each type scores 1.0), so
+bm25 and ts_rank values from different indexes can be compared. Types
+that haven't answered within SEARCH_LATENCY_BUDGET seconds are left out
+and reported in `timed_out` instead of delaying the response; the ones
+still queued are cancelled so they don't hold up later requests.
+"""
+import html
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from django.apps import apps
+from django.conf import settings
+from django.db import connection
+
+from .backends import RANK, search_queryset
+from .registry import SEARCH_TYPES, field_text, get_spec
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'SEARCH_FANOUT_WORKERS', len(SEARCH_TYPES)),
+            thread_name_prefix='taleemedge-search',
+        )
+    return _executor
+
+
+def _check_worker_connection():
+    """
+    Each worker thread keeps one DB connection for its lifetime instead of
+    reconnecting per query; there's no request cycle to close it, so only a
+    connection broken by an error is replaced.
+    """
+    if connection.connection is not None and connection.errors_occurred:
+        if connection.is_usable():
+            connection.errors_occurred = False
+        else:
+            connection.close()
+
+
+def _search_type(doc_type, query, limit):
+    _check_worker_connection()
+    spec = get_spec(doc_type)
+    model = apps.get_model(spec['model'])
+    queryset = model._default_manager.filter(**spec['public'])
+    return list(search_queryset(queryset, doc_type, query).values('pk', RANK, *spec['fields'])[:limit])
+
+
+def term_pattern(terms):
+    """Matches any of the query terms at a word start, including longer words (prefix match)"""
+    return re.compile(r'\b(?:' + '|'.join(re.escape(term) for term in terms) + r')\w*', re.IGNORECASE)
+
+
+def highlight(text, pattern, length=160):
+    """HTML-escaped excerpt of `text` around the first match, with matches wrapped in <mark>"""
+    text = " ".join(str(text or "").split())
+
+    match = pattern.search(text)
+    start = max(0, match.start() - length // 3) if match and len(text) > length else 0
+    excerpt = text[start:start + length]
+
+    # Match on the raw text and escape each piece, so terms never match inside entities like &amp;
+    parts, end = [], 0
+    for term in pattern.finditer(excerpt):
+        parts.append(html.escape(excerpt[end:term.start()]))
+        parts.append(f"<mark>{html.escape(term.group(0))}</mark>")
+        end = term.end()
+    parts.append(html.escape(excerpt[end:]))
+    excerpt = "".join(parts)
+
+    if start > 0:
+        excerpt = "…" + excerpt
+    if start + length < len(text):
+        excerpt += "…"
+    return excerpt
+
+
+def _hits(doc_type, rows, pattern):
+    fields = get_spec(doc_type)['fields']
+    title_field = next(field for field, weight in fields.items() if weight == 'A')
+    body_fields = [field for field, weight in fields.items() if weight != 'A']
+
+    best = max((row[RANK] for row in rows), default=0)
+    hits = []
+    for position, row in enumerate(rows):
+        # Backends without ranking score every hit 0; fall back to list position
+        score = row[RANK] / best if best > 0 else 1 / (position + 1)
+
+        # Excerpt the first body field that mentions a term, else the longest one
+        # (the first can be something like a blog post's author)
+        bodies = [field_text(row[field]) for field in body_fields if row[field]]
+        body = next((text for text in bodies if pattern.search(text)), max(bodies, key=len, default=""))
+
+        hits.append({
+            'type': doc_type,
+            'id': row['pk'],
+            'title': highlight(field_text(row[title_field]), pattern, length=255),
+            'snippet': highlight(body, pattern),
+            'score': round(score, 4),
+        })
+    return hits
+
+
+def federated_search(query, doc_types=None, limit=None, budget=None):
+    if limit is None:
+        limit = getattr(settings, 'SEARCH_RESULTS_PER_TYPE', 5)
+    if budget is None:
+        budget = getattr(settings, 'SEARCH_LATENCY_BUDGET', 0.8)
+    doc_types = doc_types or list(SEARCH_TYPES)
+    pattern = term_pattern(re.findall(r'\w+', query) or [query])
+
+    started = time.monotonic()
+    futures = {
+        get_executor().submit(_search_type, doc_type, query, limit): doc_type
+        for doc_type in doc_types
+    }
+    done, not_done = wait(futures, timeout=budget)
+    for future in not_done:
+        # Searches still queued behind slow ones would only hold up later requests
+        future.cancel()
+
+    results, counts, failed = [], {}, []
+    # Walk the types in request order so equal scores merge deterministically
+    for future, doc_type in futures.items():
+        if future not in done:
+            continue
+        try:
+            hits = _hits(doc_type, future.result(), pattern)
+        except Exception:
+            logger.exception(f"Search in {doc_type} failed")
+            failed.append(doc_type)
+            continue
+        counts[doc_type] = len(hits)
+        results.extend(hits)
+
+    results.sort(key=lambda hit: hit['score'], reverse=True)
+    return {
+        'query': query,
+        'results': results,
+        'counts': counts,
+        'timed_out': sorted(futures[future] for future in not_done),
+        'failed': sorted(failed),
+        'took_ms': round((time.monotonic() - started) * 1000, 1),
+    }
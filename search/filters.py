@@ -0,0 +1,27 @@
+# filters.py
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.settings import api_settings
+
+from .backends import search_queryset
+
+
+class FullTextSearchFilter(BaseFilterBackend):
+    """
+    Drop-in replacement for SearchFilter backed by the full-text index.
+    The view names its content type with `search_type`. Results are
+    ordered by relevance unless the client asks for an explicit ?ordering=,
+    so list it after OrderingFilter.
+    """
+    search_param = api_settings.SEARCH_PARAM
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '').strip()
+        doc_type = getattr(view, 'search_type', None)
+        if not query or not doc_type:
+            return queryset
+        return search_queryset(
+            queryset,
+            doc_type,
+            query,
+            order_by_rank=api_settings.ORDERING_PARAM not in request.query_params
+        )
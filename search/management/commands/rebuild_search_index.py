@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from search.backends import get_search_backend
+from search.registry import SEARCH_TYPES
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search index (only needed for the SQLite FTS5 backend)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--type', action='append', choices=list(SEARCH_TYPES), dest='types',
+                            help="Limit the rebuild to one content type (can be repeated)")
+
+    def handle(self, *args, **options):
+        backend = get_search_backend()
+        indexed = backend.rebuild(options['types'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {indexed} document(s) with {type(backend).__name__}"
+        ))
@@ -0,0 +1,96 @@
+from functools import reduce
+from operator import add
+
+from django.conf import settings
+from django.db import migrations
+from django.db.utils import OperationalError
+
+# The searchable types as they stood when this migration was written:
+# doc_type -> (type id, model, {field: weight}). Frozen here so later edits to
+# search/registry.py don't change what this migration builds.
+SEARCH_TYPES = {
+    'books': (1, 'library.Book', {'title': 'A', 'author': 'A', 'description': 'B'}),
+    'blog': (2, 'medium.BlogPost', {'title': 'A', 'tags': 'A', 'author': 'B', 'excerpt': 'B', 'content': 'C'}),
+    'videos': (3, 'youtube_vedios.Video', {'title': 'A', 'category': 'B', 'description': 'B'}),
+    'workshops': (4, 'workshops.Workshop', {'title': 'A', 'instructor': 'B', 'category': 'B', 'description': 'C'}),
+    'mentors': (5, 'mentore.Mentor', {
+        'full_name': 'A', 'job_title': 'B', 'company': 'B', 'expertise_areas': 'B',
+        'specializations': 'B', 'languages': 'C', 'bio': 'C',
+    }),
+    'scholarships': (6, 'scholarship.Scholarship', {
+        'title': 'A', 'provider': 'B', 'category': 'B', 'description': 'C', 'eligibility_criteria': 'C',
+    }),
+}
+
+# SQLite row ids are pk * TYPE_SLOTS + type id
+TYPE_SLOTS = 16
+
+
+def search_index(doc_type):
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    # Must match the vector the Postgres backend queries, or the index goes unused
+    config = getattr(settings, 'SEARCH_CONFIG', 'english')
+    fields = SEARCH_TYPES[doc_type][2]
+    vector = reduce(add, [SearchVector(field, weight=weight, config=config) for field, weight in fields.items()])
+    return GinIndex(vector, name=f'{doc_type}_search_idx')
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'postgresql':
+        for doc_type, (type_id, model_label, fields) in SEARCH_TYPES.items():
+            model = apps.get_model(model_label)
+            schema_editor.add_index(model, search_index(doc_type))
+
+    elif vendor == 'sqlite':
+        try:
+            schema_editor.execute(
+                "CREATE VIRTUAL TABLE search_index USING fts5("
+                "doc_type UNINDEXED, title, body, tokenize = 'porter unicode61')"
+            )
+        except OperationalError:
+            # SQLite built without FTS5; searches fall back to icontains
+            return
+
+        rows = []
+        for doc_type, (type_id, model_label, fields) in SEARCH_TYPES.items():
+            model = apps.get_model(model_label)
+            for values in model._default_manager.values('pk', *fields).iterator():
+                title = [str(values[field]) for field, weight in fields.items() if weight == 'A' and values[field]]
+                body = [str(values[field]) for field, weight in fields.items() if weight != 'A' and values[field]]
+                rows.append((values['pk'] * TYPE_SLOTS + type_id, doc_type, " ".join(title), " ".join(body)))
+        with schema_editor.connection.cursor() as cursor:
+            cursor.executemany(
+                "INSERT INTO search_index (rowid, doc_type, title, body) VALUES (%s, %s, %s, %s)", rows
+            )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'postgresql':
+        for doc_type, (type_id, model_label, fields) in SEARCH_TYPES.items():
+            model = apps.get_model(model_label)
+            schema_editor.remove_index(model, search_index(doc_type))
+
+    elif vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS search_index")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("library", "0002_query_pattern_indexes"),
+        ("medium", "0002_query_pattern_indexes"),
+        ("mentore", "0002_query_pattern_indexes"),
+        ("scholarship", "0002_query_pattern_indexes"),
+        ("workshops", "0002_query_pattern_indexes"),
+        ("youtube_vedios", "0003_query_pattern_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
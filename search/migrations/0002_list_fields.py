@@ -0,0 +1,97 @@
+from functools import reduce
+from operator import add
+
+from django.conf import settings
+from django.db import migrations
+
+# Types whose indexed columns changed: BlogPost.tags became a Tag relation,
+# and the Mentor/Scholarship comma-separated fields became JSON lists.
+# doc_type -> (type id, model, {field: weight}), frozen as of this migration.
+CHANGED_TYPES = {
+    'blog': (2, 'medium.BlogPost', {'title': 'A', 'author': 'B', 'excerpt': 'B', 'content': 'C'}),
+    'mentors': (5, 'mentore.Mentor', {
+        'full_name': 'A', 'job_title': 'B', 'company': 'B', 'expertise_areas': 'B',
+        'specializations': 'B', 'languages': 'C', 'bio': 'C',
+    }),
+    'scholarships': (6, 'scholarship.Scholarship', {
+        'title': 'A', 'provider': 'B', 'category': 'B', 'description': 'C', 'eligibility_criteria': 'C',
+    }),
+}
+
+# Many-to-many text indexed with a type: doc_type -> (relation, field, weight).
+# Postgres can't put it in an expression index; only the SQLite rows hold it.
+RELATED = {
+    'blog': ('tags', 'name', 'A'),
+}
+
+# SQLite row ids are pk * TYPE_SLOTS + type id
+TYPE_SLOTS = 16
+
+
+def field_text(value):
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(item) for item in value)
+    return str(value or "")
+
+
+def rebuild_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+
+    if vendor == 'postgresql':
+        from django.contrib.postgres.indexes import GinIndex
+        from django.contrib.postgres.search import SearchVector
+
+        # Dropping a column drops the expression indexes built over it; recreate
+        # them over the current fields
+        config = getattr(settings, 'SEARCH_CONFIG', 'english')
+        for doc_type, (type_id, model_label, fields) in CHANGED_TYPES.items():
+            model = apps.get_model(model_label)
+            vector = reduce(add, [
+                SearchVector(field, weight=weight, config=config) for field, weight in fields.items()
+            ])
+            schema_editor.execute(f"DROP INDEX IF EXISTS {doc_type}_search_idx")
+            schema_editor.add_index(model, GinIndex(vector, name=f'{doc_type}_search_idx'))
+
+    elif vendor == 'sqlite':
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_index'")
+            if cursor.fetchone() is None:
+                # No FTS5 table (see 0001_initial); nothing to rebuild
+                return
+
+            for doc_type, (type_id, model_label, fields) in CHANGED_TYPES.items():
+                model = apps.get_model(model_label)
+                related = {}
+                if doc_type in RELATED:
+                    relation, related_field, related_weight = RELATED[doc_type]
+                    m2m = model._meta.get_field(relation)
+                    source, target = m2m.m2m_field_name(), m2m.m2m_reverse_field_name()
+                    links = m2m.remote_field.through._default_manager.order_by(f'{target}__{related_field}')
+                    for pk, value in links.values_list(source, f'{target}__{related_field}'):
+                        related.setdefault(pk, []).append(value)
+
+                rows = []
+                for values in model._default_manager.values('pk', *fields).iterator():
+                    title = [field_text(values[field]) for field, weight in fields.items() if weight == 'A' and values[field]]
+                    body = [field_text(values[field]) for field, weight in fields.items() if weight != 'A' and values[field]]
+                    if values['pk'] in related:
+                        (title if related_weight == 'A' else body).append(field_text(related[values['pk']]))
+                    rows.append((values['pk'] * TYPE_SLOTS + type_id, doc_type, " ".join(title), " ".join(body)))
+                cursor.execute("DELETE FROM search_index WHERE doc_type = %s", [doc_type])
+                cursor.executemany(
+                    "INSERT INTO search_index (rowid, doc_type, title, body) VALUES (%s, %s, %s, %s)", rows
+                )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0001_initial"),
+        ("medium", "0003_tags"),
+        ("mentore", "0003_list_fields"),
+        ("scholarship", "0003_list_fields"),
+    ]
+
+    operations = [
+        migrations.RunPython(rebuild_search_index, migrations.RunPython.noop),
+    ]
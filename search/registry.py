@@ -0,0 +1,92 @@
+# registry.py
+"""
+Searchable content types.
+
+Each type lists its model and the text fields to index with a weight:
+'A' fields (titles, names) rank above 'B' and 'C' fields (descriptions,
+bodies). Fields hold text or JSON lists of strings (see field_text).
+Text from many-to-many relations goes in `related` as
+'relation__field' paths (BlogPost.tags); it is indexed but not returned
+by the unified search. `public` filters the rows anonymous users may see
+in the unified /search/ endpoint. `id` must never change: the SQLite
+index derives row ids from it.
+"""
+SEARCH_TYPES = {
+    'books': {
+        'id': 1,
+        'model': 'library.Book',
+        'fields': {'title': 'A', 'author': 'A', 'description': 'B'},
+        'public': {'status': 'available'},
+    },
+    'blog': {
+        'id': 2,
+        'model': 'medium.BlogPost',
+        'fields': {'title': 'A', 'author': 'B', 'excerpt': 'B', 'content': 'C'},
+        'related': {'tags__name': 'A'},
+        'public': {'status': 'published'},
+    },
+    'videos': {
+        'id': 3,
+        'model': 'youtube_vedios.Video',
+        'fields': {'title': 'A', 'category': 'B', 'description': 'B'},
+        'public': {},
+    },
+    'workshops': {
+        'id': 4,
+        'model': 'workshops.Workshop',
+        'fields': {'title': 'A', 'instructor': 'B', 'category': 'B', 'description': 'C'},
+        'public': {},
+    },
+    'mentors': {
+        'id': 5,
+        'model': 'mentore.Mentor',
+        'fields': {
+            'full_name': 'A', 'job_title': 'B', 'company': 'B', 'expertise_areas': 'B',
+            'specializations': 'B', 'languages': 'C', 'bio': 'C',
+        },
+        'public': {'status': 'approved'},
+    },
+    'scholarships': {
+        'id': 6,
+        'model': 'scholarship.Scholarship',
+        'fields': {'title': 'A', 'provider': 'B', 'category': 'B', 'description': 'C', 'eligibility_criteria': 'C'},
+        'public': {'status': 'active'},
+    },
+}
+
+
+def get_spec(doc_type):
+    try:
+        return SEARCH_TYPES[doc_type]
+    except KeyError:
+        raise ValueError(f"Unknown search type: {doc_type}")
+
+
+def field_text(value):
+    """Text of an indexed field value; list fields are joined with commas"""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(item) for item in value)
+    return str(value or "")
+
+
+def split_path(path):
+    """'tags__name' -> ('tags', 'name')"""
+    relation, field = path.split('__', 1)
+    return relation, field
+
+
+def document_for(doc_type, instance):
+    """(title, body) text of an instance: 'A' fields go to title, the rest to body"""
+    spec = get_spec(doc_type)
+    title, body = [], []
+    for field, weight in spec['fields'].items():
+        value = getattr(instance, field, None)
+        if value:
+            (title if weight == 'A' else body).append(field_text(value))
+    for path, weight in spec.get('related', {}).items():
+        relation, field = split_path(path)
+        # Reads prefetch_related(relation) when present
+        values = [getattr(obj, field) for obj in getattr(instance, relation).all()]
+        if values:
+            (title if weight == 'A' else body).append(field_text(values))
+    return " ".join(title), " ".join(body)
@@ -0,0 +1,82 @@
+from django.apps import apps
+from django.db.models.signals import m2m_changed, post_save, post_delete, pre_delete
+
+from .backends import get_search_backend
+from .registry import SEARCH_TYPES, get_spec, split_path
+
+
+def _make_index_handlers(doc_type):
+    def handle_save(sender, instance, **kwargs):
+        get_search_backend().index_object(doc_type, instance)
+
+    def handle_delete(sender, instance, **kwargs):
+        get_search_backend().remove_object(doc_type, instance.pk)
+
+    return handle_save, handle_delete
+
+
+def _reindex(doc_type, pks):
+    spec = get_spec(doc_type)
+    model = apps.get_model(spec['model'])
+    backend = get_search_backend()
+    relations = [split_path(path)[0] for path in spec.get('related', {})]
+    for instance in model._default_manager.filter(pk__in=list(pks)).prefetch_related(*relations):
+        backend.index_object(doc_type, instance)
+
+
+def _make_related_handlers(doc_type, m2m):
+    """Re-index objects whose related text changed: links added or removed, related rows renamed or deleted"""
+    through = m2m.remote_field.through
+    source, target = m2m.m2m_field_name(), m2m.m2m_reverse_field_name()
+
+    def linked_pks(related):
+        return list(through._default_manager.filter(**{target: related.pk}).values_list(source, flat=True))
+
+    def handle_m2m(sender, instance, action, reverse, pk_set, **kwargs):
+        if not reverse:
+            if action.startswith('post_'):
+                _reindex(doc_type, [instance.pk])
+        elif action == 'pre_clear':
+            # pk_set is None when clearing from the related side; note who is affected first
+            instance._search_linked_pks = linked_pks(instance)
+        elif action == 'post_clear':
+            _reindex(doc_type, instance.__dict__.pop('_search_linked_pks', []))
+        elif action in ('post_add', 'post_remove'):
+            _reindex(doc_type, pk_set)
+
+    def handle_related_save(sender, instance, created, **kwargs):
+        if not created:
+            _reindex(doc_type, linked_pks(instance))
+
+    def handle_related_pre_delete(sender, instance, **kwargs):
+        # The links are deleted along with the row
+        instance._search_linked_pks = linked_pks(instance)
+
+    def handle_related_delete(sender, instance, **kwargs):
+        _reindex(doc_type, instance.__dict__.pop('_search_linked_pks', []))
+
+    return handle_m2m, handle_related_save, handle_related_pre_delete, handle_related_delete
+
+
+def connect_search_signals():
+    """Keep a separate search index (SQLite FTS5) in step with the indexed models"""
+    for doc_type, spec in SEARCH_TYPES.items():
+        model = apps.get_model(spec['model'])
+        handle_save, handle_delete = _make_index_handlers(doc_type)
+        post_save.connect(handle_save, sender=model, weak=False, dispatch_uid=f'search_save_{doc_type}')
+        post_delete.connect(handle_delete, sender=model, weak=False, dispatch_uid=f'search_delete_{doc_type}')
+
+        for path in spec.get('related', {}):
+            relation = split_path(path)[0]
+            m2m = model._meta.get_field(relation)
+            handle_m2m, handle_related_save, handle_related_pre_delete, handle_related_delete = \
+                _make_related_handlers(doc_type, m2m)
+            uid = f'search_{doc_type}_{relation}'
+            m2m_changed.connect(handle_m2m, sender=m2m.remote_field.through, weak=False,
+                                dispatch_uid=f'{uid}_m2m')
+            post_save.connect(handle_related_save, sender=m2m.related_model, weak=False,
+                              dispatch_uid=f'{uid}_save')
+            pre_delete.connect(handle_related_pre_delete, sender=m2m.related_model, weak=False,
+                               dispatch_uid=f'{uid}_pre_delete')
+            post_delete.connect(handle_related_delete, sender=m2m.related_model, weak=False,
+                                dispatch_uid=f'{uid}_delete')
@@ -0,0 +1,114 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+
+from library.models import Book
+from youtube_vedios.models import Video
+from .backends import RANK, get_search_backend, search_queryset
+from .federated import _hits, federated_search, highlight, term_pattern
+
+
+def make_book(title, description='A book', **kwargs):
+    return Book.objects.create(title=title, author='Author', description=description, category='physics',
+                               pages=10, publish_year=2020, isbn=f'isbn-{title}', **kwargs)
+
+
+class SearchRankingTests(TestCase):
+    def search(self, query):
+        return list(search_queryset(Book.objects.all(), 'books', query).values_list('title', flat=True))
+
+    def test_title_matches_rank_above_description_matches(self):
+        make_book('Introduction to physics', description='Mechanics and waves')
+        make_book('Mechanics', description='Covers thermodynamics in depth')
+        self.assertEqual(self.search('thermodynamics'), ['Mechanics'])
+        self.assertEqual(self.search('mechanics'), ['Mechanics', 'Introduction to physics'])
+
+    def test_last_word_matches_as_prefix(self):
+        make_book('Linear algebra')
+        self.assertEqual(self.search('linear alg'), ['Linear algebra'])
+
+    def test_index_follows_saves_and_deletes(self):
+        book = make_book('Organic chemistry')
+        book.title = 'Inorganic chemistry'
+        book.save()
+        self.assertEqual(self.search('organic'), [])
+        self.assertEqual(self.search('inorganic'), ['Inorganic chemistry'])
+
+        book.delete()
+        self.assertEqual(self.search('inorganic'), [])
+
+    def test_rebuild_reindexes_rows_written_without_signals(self):
+        book = make_book('Optics')
+        Book.objects.filter(pk=book.pk).update(title='Acoustics')
+        self.assertEqual(self.search('acoustics'), [])
+        get_search_backend().rebuild(['books'])
+        self.assertEqual(self.search('acoustics'), ['Acoustics'])
+
+    def test_punctuation_only_query_matches_nothing(self):
+        make_book('Optics')
+        self.assertEqual(self.search('"*()'), [])
+
+
+class HighlightTests(SimpleTestCase):
+    def test_terms_are_not_matched_inside_entities(self):
+        pattern = term_pattern(['amp', 'lt'])
+        self.assertEqual(highlight('Salt & pepper < amplifier', pattern),
+                         'Salt &amp; pepper &lt; <mark>amplifier</mark>')
+
+    def test_matched_text_is_escaped(self):
+        pattern = term_pattern(['script'])
+        self.assertEqual(highlight('<script>', pattern), '&lt;<mark>script</mark>&gt;')
+
+    def test_long_text_is_excerpted_around_the_first_match(self):
+        text = 'word ' * 100 + 'needle ' + 'word ' * 100
+        excerpt = highlight(text, term_pattern(['needle']), length=60)
+        self.assertTrue(excerpt.startswith('…') and excerpt.endswith('…'))
+        self.assertIn('<mark>needle</mark>', excerpt)
+
+    def test_snippet_falls_back_to_the_longest_body_field(self):
+        row = {'pk': 1, RANK: 1.0, 'title': 'Match', 'author': 'Someone', 'excerpt': '',
+               'content': 'The full text of the post'}
+        hit = _hits('blog', [row], term_pattern(['match']))[0]
+        self.assertEqual(hit['snippet'], 'The full text of the post')
+
+
+class UnifiedSearchTests(TransactionTestCase):
+    # Types are searched on worker threads, which only see committed rows
+
+    def test_merges_public_results_across_types(self):
+        make_book('Calculus made easy')
+        make_book('Calculus for the hidden', status='unavailable')
+        Video.objects.create(title='Calculus lecture', description='Limits', category='math',
+                             youtube_video_id='abcdefghijk', duration='10:00')
+
+        response = self.client.get('/search/', {'q': 'calculus', 'types': 'books,videos'})
+        self.assertEqual(response.status_code, 200)
+        titles = sorted(hit['title'] for hit in response.json()['results'])
+        self.assertEqual(titles, ['<mark>Calculus</mark> lecture', '<mark>Calculus</mark> made easy'])
+        self.assertEqual(response.json()['counts'], {'books': 1, 'videos': 1})
+
+    def test_rejects_unknown_types(self):
+        response = self.client.get('/search/', {'q': 'calculus', 'types': 'books,podcasts'})
+        self.assertEqual(response.status_code, 400)
+
+    def test_types_over_budget_are_reported_and_cancelled(self):
+        release = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=1)
+        self.addCleanup(executor.shutdown)
+        self.addCleanup(release.set)
+
+        def blocked_search(doc_type, query, limit):
+            release.wait(5)
+            return []
+
+        with mock.patch('search.federated.get_executor', return_value=executor), \
+                mock.patch('search.federated._search_type', side_effect=blocked_search) as search_type:
+            result = federated_search('calculus', doc_types=['books', 'videos'], budget=0.05)
+            release.set()
+            executor.shutdown(wait=True)
+
+        self.assertEqual(result['timed_out'], ['books', 'videos'])
+        # The queued search never ran
+        self.assertEqual(search_type.call_count, 1)
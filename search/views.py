@@ -0,0 +1,38 @@
+# views.py
+from django.conf import settings
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+
+from .federated import federated_search
+from .registry import SEARCH_TYPES
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def unified_search(request):
+    """Search books, posts, videos, workshops, mentors and scholarships in one request"""
+    query = request.query_params.get('q', '').strip()
+    if not query:
+        return Response({'error': 'Query parameter q is required'}, status=status.HTTP_400_BAD_REQUEST)
+
+    doc_types = None
+    if request.query_params.get('types'):
+        doc_types = [t.strip() for t in request.query_params['types'].split(',') if t.strip()]
+        unknown = [t for t in doc_types if t not in SEARCH_TYPES]
+        if unknown:
+            return Response({
+                'error': f"Unknown search type(s): {', '.join(unknown)}",
+                'available_types': list(SEARCH_TYPES),
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    limit = None
+    if request.query_params.get('limit'):
+        try:
+            limit = int(request.query_params['limit'])
+        except ValueError:
+            return Response({'error': 'limit must be a number'}, status=status.HTTP_400_BAD_REQUEST)
+        limit = max(1, min(limit, getattr(settings, 'SEARCH_MAX_RESULTS_PER_TYPE', 20)))
+
+    return Response(federated_search(query, doc_types=doc_types, limit=limit))
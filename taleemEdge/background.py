@@ -0,0 +1,57 @@
+# background.py
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+_pending = 0
+_pending_lock = threading.Lock()
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'BACKGROUND_WORKERS', 2),
+            thread_name_prefix='taleemedge-bg',
+        )
+    return _executor
+
+
+def queue_depth():
+    """Number of deferred tasks submitted but not yet finished in this process"""
+    return _pending
+
+
+def _submit(func, args, kwargs):
+    global _pending
+    with _pending_lock:
+        _pending += 1
+    get_executor().submit(_run, func, args, kwargs)
+
+
+def _run(func, args, kwargs):
+    global _pending
+    close_old_connections()
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        logger.exception(f"Background task {func.__name__} failed")
+    finally:
+        # Worker threads get their own DB connection; don't leak it
+        connection.close()
+        with _pending_lock:
+            _pending -= 1
+
+
+def defer(func, *args, **kwargs):
+    """
+    Run func(*args, **kwargs) on a background worker thread once the
+    current transaction commits, so the caller's request returns right away.
+    """
+    transaction.on_commit(lambda: _submit(func, args, kwargs))
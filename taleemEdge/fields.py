@@ -0,0 +1,62 @@
+# fields.py
+from django import forms
+from rest_framework import serializers
+from rest_framework.utils import html
+
+
+def split_list(value):
+    """'a, b,,c' -> ['a', 'b', 'c'], dropping blanks and repeats"""
+    items = value.split(',') if isinstance(value, str) else value
+    result = []
+    for item in items:
+        item = str(item).strip()
+        if item and item not in result:
+            result.append(item)
+    return result
+
+
+class CommaSeparatedListField(serializers.ListField):
+    """
+    List of strings that keeps the old comma-separated API shape: accepts a
+    JSON list or a "a, b, c" string (form posts) and renders "a, b, c".
+    The `*_list` fields expose the list itself.
+    """
+    child = serializers.CharField()
+
+    def get_value(self, dictionary):
+        # A form field holding "a, b, c" arrives as ['a, b, c']; keep it a string
+        if html.is_html_input(dictionary):
+            values = dictionary.getlist(self.field_name)
+            if len(values) == 1:
+                return values[0]
+        return super().get_value(dictionary)
+
+    def to_internal_value(self, data):
+        if isinstance(data, (str, list)):
+            data = split_list(data)
+        return super().to_internal_value(data)
+
+    def to_representation(self, value):
+        return ", ".join(value or [])
+
+
+class CommaSeparatedFormField(forms.CharField):
+    """
+    Form (admin) counterpart of CommaSeparatedListField: edits a JSON list
+    of strings as "a, b, c" instead of raw JSON.
+
+        formfield_overrides = {models.JSONField: {'form_class': CommaSeparatedFormField}}
+    """
+    widget = forms.Textarea
+
+    def __init__(self, *, encoder=None, decoder=None, **kwargs):
+        # models.JSONField.formfield() passes its encoder/decoder; lists of strings don't need them
+        super().__init__(**kwargs)
+
+    def prepare_value(self, value):
+        if isinstance(value, (list, tuple)):
+            return ", ".join(str(item) for item in value)
+        return value
+
+    def to_python(self, value):
+        return split_list(super().to_python(value))
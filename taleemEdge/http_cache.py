@@ -0,0 +1,165 @@
+# http_cache.py
+"""
+Response caching for public, read-mostly endpoints.
+
+    @api_view(['GET'])
+    @permission_classes([AllowAny])
+    @cache_response('medium.BlogPost')
+    def featured_posts(request):
+        ...
+
+Each model in CACHED_MODELS has a version number in the cache, bumped by
+post_save / post_delete / m2m_changed (see connect_cache_signals). A cached response is
+stored under the current versions of the models it depends on, so any
+write makes the old entries unreachable instead of deleting them one by
+one. Queryset.update() skips the signals; RESPONSE_CACHE_TIMEOUT bounds
+how stale such writes (view counters, for instance) can get.
+
+Responses carry an ETag of their body, and a matching If-None-Match gets
+a 304 without rendering anything. Class-based views use
+method_decorator(cache_response(...), name='get').
+"""
+import hashlib
+import json
+import time
+from functools import wraps
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models.signals import m2m_changed, post_save, post_delete
+from django.http import HttpResponse, HttpResponseNotModified
+from rest_framework.response import Response
+
+# Models whose writes invalidate cached responses
+CACHED_MODELS = [
+    'hero_section.HeroSection',
+    'hero_section.FeatureCard',
+    'authentication.PlatformSettings',
+    'scholarship.Scholarship',
+    'scholarship.ScholarshipApplication',
+    'medium.BlogPost',
+    'medium.Tag',
+    'library.Book',
+    'workshops.Workshop',
+]
+
+KEY_PREFIX = 'http'
+
+
+def get_cache():
+    return caches[getattr(settings, 'RESPONSE_CACHE_ALIAS', 'default')]
+
+
+def _version_key(model_label):
+    return f'{KEY_PREFIX}:version:{model_label.lower()}'
+
+
+def bump_version(model_label):
+    """Invalidate every cached response that depends on the model"""
+    cache = get_cache()
+    try:
+        cache.incr(_version_key(model_label))
+    except ValueError:
+        # Not set yet (or evicted); any fresh value works as long as it's new
+        cache.set(_version_key(model_label), time.time_ns(), None)
+
+
+def get_versions(model_labels):
+    cache = get_cache()
+    keys = [_version_key(label) for label in model_labels]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # Start from the clock, so a version lost to eviction never reuses an old number
+            cache.add(key, time.time_ns(), None)
+            versions[key] = cache.get(key)
+    return [versions[key] for key in keys]
+
+
+def _etag(content):
+    return '"' + hashlib.md5(content, usedforsecurity=False).hexdigest() + '"'
+
+
+def _not_modified(request, etag):
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH', '')
+    return etag in [tag.strip() for tag in if_none_match.split(',')] or if_none_match.strip() == '*'
+
+
+def cache_response(*model_labels, timeout=None, skip=None):
+    """
+    Cache a GET view's 200 responses until one of `model_labels` changes.
+    `skip(request)` returning True bypasses the cache (e.g. admin-only data).
+    """
+    for label in model_labels:
+        if label not in CACHED_MODELS:
+            raise ImproperlyConfigured(f"{label} must be listed in CACHED_MODELS to invalidate cached responses")
+
+    def decorator(view_func):
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'GET' or (skip and skip(request)):
+                return view_func(request, *args, **kwargs)
+
+            cache = get_cache()
+            versions = ".".join(str(version) for version in get_versions(model_labels))
+            variant = hashlib.md5(
+                # Host too: pagination links are absolute URLs
+                f"{request.get_host()}|{request.get_full_path()}|{request.META.get('HTTP_ACCEPT', '')}".encode(),
+                usedforsecurity=False
+            ).hexdigest()
+            key = f'{KEY_PREFIX}:{view_func.__module__}.{view_func.__qualname__}:{versions}:{variant}'
+
+            entry = cache.get(key)
+            if entry is None:
+                response = view_func(request, *args, **kwargs)
+                if response.status_code != 200:
+                    return response
+                if isinstance(response, Response):
+                    # DRF responses render later; cache the data and hash it for the ETag
+                    content = json.dumps(response.data, cls=DjangoJSONEncoder, sort_keys=True).encode()
+                    entry = {'data': response.data, 'etag': _etag(content)}
+                else:
+                    entry = {
+                        'content': response.content,
+                        'content_type': response['Content-Type'],
+                        'etag': _etag(response.content),
+                    }
+                cache.set(key, entry, timeout if timeout is not None else
+                          getattr(settings, 'RESPONSE_CACHE_TIMEOUT', 300))
+
+            if _not_modified(request, entry['etag']):
+                response = HttpResponseNotModified()
+            elif 'data' in entry:
+                response = Response(entry['data'])
+            else:
+                response = HttpResponse(entry['content'], content_type=entry['content_type'])
+            response['ETag'] = entry['etag']
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def _make_invalidation_handler(model_label):
+    def handle_change(sender, instance, **kwargs):
+        # m2m_changed fires before and after; the post_* actions are the writes
+        if kwargs.get('action', 'post_').startswith('post_'):
+            bump_version(model_label)
+
+    return handle_change
+
+
+def connect_cache_signals():
+    for model_label in CACHED_MODELS:
+        model = apps.get_model(model_label)
+        handle_change = _make_invalidation_handler(model_label)
+        post_save.connect(handle_change, sender=model, weak=False, dispatch_uid=f'http_cache_save_{model_label}')
+        post_delete.connect(handle_change, sender=model, weak=False, dispatch_uid=f'http_cache_delete_{model_label}')
+        # Relations such as BlogPost.tags are set after the row is saved
+        for field in model._meta.many_to_many:
+            m2m_changed.connect(handle_change, sender=field.remote_field.through, weak=False,
+                                dispatch_uid=f'http_cache_m2m_{model_label}_{field.name}')
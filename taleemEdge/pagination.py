@@ -0,0 +1,52 @@
+# pagination.py
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+from search.backends import is_ranked
+
+
+class StandardPagination(PageNumberPagination):
+    """Default page-number pagination (?page=2&page_size=50)"""
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
+class CreatedAtCursorPagination(CursorPagination):
+    """
+    Cursor pagination for append-heavy tables, ordered by (created_at, id).
+    The cursor holds the last created_at seen: DRF positions on the first
+    ordering field only, skips rows sharing that timestamp with a small
+    offset kept in the cursor, and id keeps those rows in a stable order.
+    Deep pages stay cheap because each page starts with a range scan from
+    the cursor instead of a growing OFFSET. Views with an OrderingFilter
+    page on its ordering instead. Clients that need page numbers can still pass
+    ?page=N, which switches to StandardPagination for that request; so do
+    search results ordered by relevance, which have no created_at cursor.
+    """
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-created_at', '-id')
+    page_number_class = StandardPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_number_paginator = None
+        if StandardPagination.page_query_param in request.query_params or is_ranked(queryset):
+            self.page_number_paginator = self.page_number_class()
+            return self.page_number_paginator.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.page_number_paginator:
+            return self.page_number_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_next_link(self):
+        if self.page_number_paginator:
+            return self.page_number_paginator.get_next_link()
+        return super().get_next_link()
+
+    def get_previous_link(self):
+        if self.page_number_paginator:
+            return self.page_number_paginator.get_previous_link()
+        return super().get_previous_link()
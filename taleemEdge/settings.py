@@ -55,12 +55,35 @@ INSTALLED_APPS = [
     'chatbot',
     'medium',
     'hero_section',
+    'search',
 ]
 
 
 from dotenv import load_dotenv
 load_dotenv()
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
+GEMINI_MODEL = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+# Passed to GenerativeModel, e.g. {'temperature': 0.7, 'max_output_tokens': 1024}
+GEMINI_GENERATION_CONFIG = {}
+# Conversation history sent with each chatbot prompt: the last N messages,
+# optionally trimmed further to fit an approximate token budget (None = no budget)
+CHATBOT_HISTORY_MESSAGES = 10
+CHATBOT_HISTORY_TOKEN_BUDGET = None
+# Rolling session summary: refreshed once this many new messages have arrived,
+# reading at most CHATBOT_SUMMARY_MAX_MESSAGES of them per refresh
+CHATBOT_SUMMARY_EVERY = 10
+CHATBOT_SUMMARY_MAX_MESSAGES = 50
+# Cache alias (see CACHES) for answers to repeated prompts; None disables it
+CHATBOT_RESPONSE_CACHE = 'chatbot'
+# Session titles are generated in the background; past this many queued
+# background tasks the first CHATBOT_TITLE_WORDS words are used instead
+CHATBOT_TITLE_QUEUE_LIMIT = 20
+CHATBOT_TITLE_WORDS = 6
+# Message pages: session detail embeds the latest CHATBOT_SESSION_RECENT_MESSAGES,
+# sessions/<id>/messages/ returns ?per_page= (default 50, capped at 100)
+CHATBOT_SESSION_RECENT_MESSAGES = 20
+CHATBOT_MESSAGES_PER_PAGE = 50
+CHATBOT_MESSAGES_MAX_PER_PAGE = 100
 
 
 MIDDLEWARE = [
@@ -156,7 +179,11 @@ REST_FRAMEWORK = {
     'DEFAULT_FILTER_BACKENDS': [
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
-    ]
+    ],
+    # Page-number by default; append-heavy lists opt into
+    # taleemEdge.pagination.CreatedAtCursorPagination (cursor on created_at)
+    'DEFAULT_PAGINATION_CLASS': 'taleemEdge.pagination.StandardPagination',
+    'PAGE_SIZE': 20,
 }
 
 # Custom User Model
@@ -222,6 +249,80 @@ MEDIA_ROOT = BASE_DIR / "media"
 FILE_UPLOAD_MAX_MEMORY_SIZE = 100 * 1024 * 1024  # 100MB
 DATA_UPLOAD_MAX_MEMORY_SIZE = 100 * 1024 * 1024  # 100MB
 
+# Book PDF delivery
+# None streams the file from Django; 'x-accel-redirect' (nginx) or 'x-sendfile' (apache)
+# hands it off to the web server so workers are not tied up by downloads
+LIBRARY_FILE_OFFLOAD = os.environ.get('LIBRARY_FILE_OFFLOAD') or None
+LIBRARY_X_ACCEL_PREFIX = '/protected-media/'
+
+# View/read/download counters
+# When buffered, increments are summed in memory and flushed every
+# COUNTER_FLUSH_INTERVAL seconds or once COUNTER_FLUSH_THRESHOLD rows are pending
+COUNTER_BUFFERED = os.environ.get('COUNTER_BUFFERED', 'False') == 'True'
+COUNTER_FLUSH_INTERVAL = 10
+COUNTER_FLUSH_THRESHOLD = 500
+
+# Background work (taleemEdge.background.defer) runs on a small thread pool
+BACKGROUND_WORKERS = 2
+# Fan out admin notifications for new scholarship applications in the background
+NOTIFICATION_FANOUT_ASYNC = os.environ.get('NOTIFICATION_FANOUT_ASYNC', 'True') == 'True'
+
+# Caches
+# 'chatbot' holds answers to repeated chatbot prompts. TIMEOUT is the TTL and
+# locmem evicts least-recently-used entries past MAX_ENTRIES. For a cache
+# shared by all workers use FileBasedCache or DatabaseCache (run
+# `python manage.py createcachetable`) instead.
+CACHES = {
+    # Also holds cached public API responses (taleemEdge/http_cache.py) and the
+    # version PlatformSettings.get_settings() checks. Versions are bumped on
+    # writes, so with several worker processes point this at a shared cache
+    # (e.g. Redis) for invalidation to reach all
+    'default': {
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', ''),
+    },
+    'chatbot': {
+        'BACKEND': os.environ.get('CHATBOT_CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CHATBOT_CACHE_LOCATION', 'chatbot-responses'),
+        'TIMEOUT': 60 * 60 * 24,
+        'OPTIONS': {
+            'MAX_ENTRIES': 5000,
+        },
+    },
+}
+
+# Public read endpoints cached by taleemEdge.http_cache.cache_response: the
+# cache alias, and how long an entry lives even if no signal invalidates it
+RESPONSE_CACHE_ALIAS = 'default'
+RESPONSE_CACHE_TIMEOUT = 60 * 5
+
+# Seconds a process may reuse its in-memory PlatformSettings without a
+# version bump; bounds staleness when the cache above is per-process
+PLATFORM_SETTINGS_MAX_AGE = 30
+
+# Longest window (in days) the admin analytics endpoint reports on
+ANALYTICS_MAX_DAYS = 730
+
+# Platform stat rollups (authentication/rollups.py): seconds before today's
+# stored pending/approved counts are recomputed on read, and the most days
+# a read queues for backfill (refresh_platform_stats covers longer gaps)
+ROLLUP_SNAPSHOT_MAX_AGE = 60
+ROLLUP_MAX_BACKFILL_DAYS = 31
+
+# Full-text search (see search/backends.py). None picks the backend from the
+# database: Postgres tsvector + GIN, SQLite FTS5, otherwise icontains
+SEARCH_BACKEND = None
+SEARCH_CONFIG = 'english'
+# Most matches the SQLite backend ranks per query
+SEARCH_MAX_CANDIDATES = 1000
+# Unified /search/ endpoint (see search/federated.py): hits returned per
+# content type, the most a client may ask for with ?limit=, and how long to
+# wait for the slowest type before answering without it.
+# SEARCH_FANOUT_WORKERS defaults to one thread per content type.
+SEARCH_RESULTS_PER_TYPE = 5
+SEARCH_MAX_RESULTS_PER_TYPE = 20
+SEARCH_LATENCY_BUDGET = 0.8
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.0/ref/settings/#default-auto-field
 
@@ -35,6 +35,7 @@ urlpatterns = [
     path('vedios/',include('youtube_vedios.urls')),
     path('chatbot/',include('chatbot.urls')),
     path('blog/',include('medium.urls')),
+    path('search/',include('search.urls')),
     path("",include('hero_section.urls')),
     path('auth/token/', TokenObtainPairView.as_view(), name='token_obtain_pair'),
     path('auth/token/refresh/', TokenRefreshView.as_view(), name='token_refresh'),
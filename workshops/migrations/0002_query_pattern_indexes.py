@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workshops", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="workshop",
+            index=models.Index(
+                fields=["created_by", "status"], name="workshop_creator_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workshop",
+            index=models.Index(fields=["created_at"], name="workshop_created_idx"),
+        ),
+    ]
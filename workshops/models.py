@@ -1,9 +1,19 @@
 # workshops/models.py
 from django.db import models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
+class WorkshopQuerySet(models.QuerySet):
+    def recount_enrollments(self):
+        """Set enrolled_count from the enrollment rows in one UPDATE, so it can't drift"""
+        enrollments = WorkshopEnrollment.objects.filter(
+            workshop=OuterRef('pk')
+        ).order_by().values('workshop').annotate(total=Count('pk')).values('total')
+        return self.update(enrolled_count=Coalesce(Subquery(enrollments), 0))
+
 class Workshop(models.Model):
     STATUS_CHOICES = [
         ('upcoming', 'Upcoming'),
@@ -46,11 +56,22 @@ class Workshop(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = WorkshopQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_by', 'status'], name='workshop_creator_status_idx'),
+            models.Index(fields=['created_at'], name='workshop_created_idx'),
+        ]
     
     def __str__(self):
         return self.title
+    
+    def refresh_enrolled_count(self):
+        Workshop.objects.filter(pk=self.pk).recount_enrollments()
+        self.refresh_from_db(fields=['enrolled_count'])
+        return self.enrolled_count
 
 class WorkshopEnrollment(models.Model):
     """Model to track workshop enrollments"""
@@ -1,3 +1,41 @@
-from django.test import TestCase
+from datetime import date, time
 
-# Create your tests here.
+from rest_framework.test import APITestCase
+
+from authentication.models import User
+from .models import Workshop
+
+
+class EnrollmentCountTests(APITestCase):
+    def setUp(self):
+        admin = User.objects.create_user(username='admin', email='admin@example.com', password='x',
+                                         full_name='Admin', role='admin')
+        self.student = User.objects.create_user(username='student', email='student@example.com', password='x',
+                                                full_name='Student', role='student')
+        self.workshop = Workshop.objects.create(
+            title='Django', instructor='Ann', description='Web', date=date.today(), time=time(10),
+            duration='2 hours', capacity=10, level='beginner', category='web', location='online',
+            created_by=admin,
+        )
+        self.client.force_authenticate(self.student)
+
+    def test_enroll_and_unenroll_keep_count_in_step(self):
+        self.client.post(f'/workshops/student/{self.workshop.pk}/enroll/')
+        self.workshop.refresh_from_db()
+        self.assertEqual(self.workshop.enrolled_count, 1)
+
+        self.client.delete(f'/workshops/student/{self.workshop.pk}/unenroll/')
+        self.workshop.refresh_from_db()
+        self.assertEqual(self.workshop.enrolled_count, 0)
+
+    def test_drifted_count_is_corrected(self):
+        Workshop.objects.filter(pk=self.workshop.pk).update(enrolled_count=7)
+        self.client.post(f'/workshops/student/{self.workshop.pk}/enroll/')
+        self.workshop.refresh_from_db()
+        self.assertEqual(self.workshop.enrolled_count, 1)
+
+        # Unenrolling never leaves a negative count, even from a drifted value
+        Workshop.objects.filter(pk=self.workshop.pk).update(enrolled_count=0)
+        self.client.delete(f'/workshops/student/{self.workshop.pk}/unenroll/')
+        self.workshop.refresh_from_db()
+        self.assertEqual(self.workshop.enrolled_count, 0)
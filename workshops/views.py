@@ -14,6 +14,9 @@ from .serializers import (
     WorkshopEnrollmentSerializer
 )
 from authentication.models import PlatformActivity
+from taleemEdge.pagination import CreatedAtCursorPagination
+from search.backends import search_queryset
+from taleemEdge.http_cache import cache_response
 
 # ================ ADMIN VIEWS ================
 class AdminWorkshopListCreateView(generics.ListCreateAPIView):
@@ -109,19 +112,11 @@ class StudentWorkshopListView(generics.ListAPIView):
     """Students can view all workshops"""
     serializer_class = WorkshopSerializer
     permission_classes = [AllowAny]
+    pagination_class = CreatedAtCursorPagination
     
     def get_queryset(self):
         queryset = Workshop.objects.all()
         
-        # Search functionality
-        search = self.request.query_params.get('search', None)
-        if search:
-            queryset = queryset.filter(
-                Q(title__icontains=search) |
-                Q(category__icontains=search) |
-                Q(instructor__icontains=search)
-            )
-        
         # Filter by status
         status_filter = self.request.query_params.get('status', None)
         if status_filter:
@@ -137,7 +132,14 @@ class StudentWorkshopListView(generics.ListAPIView):
         if category_filter:
             queryset = queryset.filter(category__icontains=category_filter)
         
-        return queryset.annotate(enrolled_students_count=Count('enrollments'))
+        queryset = queryset.annotate(enrolled_students_count=Count('enrollments'))
+        
+        # Full-text search, ranked by relevance
+        search = self.request.query_params.get('search', None)
+        if search:
+            queryset = search_queryset(queryset, 'workshops', search)
+        
+        return queryset
 
 class StudentWorkshopDetailView(generics.RetrieveAPIView):
     """Student can view workshop details"""
@@ -226,8 +228,7 @@ def enroll_workshop(request, workshop_id):
     )
     
     # Update enrolled count (for backward compatibility)
-    workshop.enrolled_count = workshop.enrollments.count()
-    workshop.save()
+    workshop.refresh_enrolled_count()
     
     # Log activity
     PlatformActivity.objects.create(
@@ -255,8 +256,7 @@ def unenroll_workshop(request, workshop_id):
         enrollment.delete()
         
         # Update enrolled count
-        workshop.enrolled_count = workshop.enrollments.count()
-        workshop.save()
+        workshop.refresh_enrolled_count()
         
         # Log activity
         PlatformActivity.objects.create(
@@ -273,10 +273,10 @@ def unenroll_workshop(request, workshop_id):
 
 # ================ UTILITY VIEWS ================
 @api_view(['GET'])
+@cache_response('workshops.Workshop')
 def workshop_categories(request):
     """Get all unique workshop categories"""
     categories = Workshop.objects.values_list('category', flat=True).distinct().order_by('category')
-    print("categories: ",categories)
     return Response({'categories': list(categories)})
 
 @api_view(['GET'])
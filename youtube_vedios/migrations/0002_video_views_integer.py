@@ -0,0 +1,100 @@
+from decimal import Decimal, InvalidOperation
+
+from django.db import migrations, models
+
+# Frozen copies of youtube_vedios.utils as of this migration, so later
+# changes to the app code can't change what it does
+SUFFIXES = [
+    (1_000_000_000, 'B'),
+    (1_000_000, 'M'),
+    (1_000, 'K'),
+]
+
+# The new column's maximum (PositiveIntegerField)
+MAX_VIEW_COUNT = 2_147_483_647
+
+
+def parse_view_count(value):
+    if value is None:
+        return 0
+    if isinstance(value, int):
+        return min(max(value, 0), MAX_VIEW_COUNT)
+
+    text = str(value).strip().upper().replace(',', '').replace('VIEWS', '').strip()
+    if not text:
+        return 0
+
+    multiplier = 1
+    for factor, suffix in SUFFIXES:
+        if text.endswith(suffix):
+            multiplier = factor
+            text = text[:-1].strip()
+            break
+
+    try:
+        count = Decimal(text)
+        if not count.is_finite():
+            # 'Infinity' / 'NaN' parse as decimals; int() of them would abort the migration
+            raise InvalidOperation
+        count = count * multiplier
+        count = MAX_VIEW_COUNT if count > MAX_VIEW_COUNT else int(count)
+    except (ArithmeticError, ValueError):
+        digits = ''.join(filter(str.isdigit, text))
+        count = int(digits) * multiplier if digits else 0
+    # Legacy strings like '5B' don't fit the integer column
+    return min(max(count, 0), MAX_VIEW_COUNT)
+
+
+def format_view_count(count):
+    count = count or 0
+    for factor, suffix in SUFFIXES:
+        if count >= factor:
+            value = f"{(count * 10 // factor) / 10:.1f}".rstrip('0').rstrip('.')
+            return f"{value}{suffix}"
+    return str(count)
+
+
+def forwards(apps, schema_editor):
+    Video = apps.get_model("youtube_vedios", "Video")
+    videos = list(Video.objects.only("pk", "views"))
+    for video in videos:
+        video.view_count = parse_view_count(video.views)
+    Video.objects.bulk_update(videos, ["view_count"], batch_size=500)
+
+
+def backwards(apps, schema_editor):
+    Video = apps.get_model("youtube_vedios", "Video")
+    videos = list(Video.objects.only("pk", "view_count"))
+    for video in videos:
+        video.views = format_view_count(video.view_count)
+    Video.objects.bulk_update(videos, ["views"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("youtube_vedios", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="video",
+            name="view_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.RunPython(forwards, backwards),
+        migrations.RemoveField(
+            model_name="video",
+            name="views",
+        ),
+        migrations.RenameField(
+            model_name="video",
+            old_name="view_count",
+            new_name="views",
+        ),
+        migrations.AlterField(
+            model_name="video",
+            name="views",
+            field=models.PositiveIntegerField(db_index=True, default=0),
+        ),
+    ]
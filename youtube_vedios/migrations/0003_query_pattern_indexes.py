@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-17 20:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("youtube_vedios", "0002_video_views_integer"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="video",
+            index=models.Index(fields=["created_at"], name="video_created_idx"),
+        ),
+    ]
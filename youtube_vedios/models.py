@@ -15,7 +15,7 @@ class Video(models.Model):
     category = models.CharField(max_length=100)
     youtube_video_id = models.CharField(max_length=50, unique=True)
     duration = models.CharField(max_length=20)
-    views = models.CharField(max_length=20, default='0')
+    views = models.PositiveIntegerField(default=0, db_index=True)
     thumbnail_url = models.URLField(blank=True, null=True)  # Manual thumbnail URL
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -33,4 +33,7 @@ class Video(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at'], name='video_created_idx'),
+        ]
 
@@ -2,16 +2,31 @@
 # serializers.py
 from rest_framework import serializers
 from .models import Video
+from .utils import format_view_count, parse_view_count
+
+class ViewCountField(serializers.Field):
+    """Integer view count shown as '12K' / '1.5M', accepts either form on input"""
+    
+    def to_representation(self, value):
+        return format_view_count(value)
+    
+    def to_internal_value(self, data):
+        try:
+            return parse_view_count(data, strict=True)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e))
 
 class VideoSerializer(serializers.ModelSerializer):
     youtube_url = serializers.ReadOnlyField()
     youtube_embed_url = serializers.ReadOnlyField()
+    views = ViewCountField(read_only=True)
+    view_count = serializers.IntegerField(source='views', read_only=True)
     
     class Meta:
         model = Video
         fields = [
             'id', 'title', 'description', 'category', 
-            'youtube_video_id', 'duration', 'views', 
+            'youtube_video_id', 'duration', 'views', 'view_count',
             'thumbnail_url', 'youtube_url', 'youtube_embed_url',
             'created_at', 'updated_at'
         ]
@@ -23,6 +38,8 @@ class VideoSerializer(serializers.ModelSerializer):
         return value
 
 class VideoCreateSerializer(serializers.ModelSerializer):
+    views = ViewCountField(required=False)
+    
     class Meta:
         model = Video
         fields = [
@@ -31,6 +48,8 @@ class VideoCreateSerializer(serializers.ModelSerializer):
         ]
 
 class VideoUpdateSerializer(serializers.ModelSerializer):
+    views = ViewCountField(required=False)
+    
     class Meta:
         model = Video
         fields = [
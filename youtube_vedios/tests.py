@@ -1,3 +1,49 @@
-from django.test import TestCase
+from importlib import import_module
 
-# Create your tests here.
+from django.test import SimpleTestCase
+
+from .serializers import VideoUpdateSerializer
+from .utils import MAX_VIEW_COUNT, parse_view_count
+
+views_migration = import_module('youtube_vedios.migrations.0002_video_views_integer')
+
+
+class ViewCountTests(SimpleTestCase):
+    def test_display_strings_parse(self):
+        self.assertEqual(parse_view_count('12K', strict=True), 12_000)
+        self.assertEqual(parse_view_count('1.5M', strict=True), 1_500_000)
+        self.assertEqual(parse_view_count('1,234 views', strict=True), 1234)
+        self.assertEqual(parse_view_count(42, strict=True), 42)
+
+    def test_lenient_parse_keeps_old_fallback(self):
+        self.assertEqual(parse_view_count('abc'), 0)
+        self.assertEqual(parse_view_count('about 300'), 300)
+
+    def test_serializer_rejects_unparseable_counts(self):
+        for value in ['abc', '1.5X', '-5', -5, '']:
+            serializer = VideoUpdateSerializer(data={'views': value}, partial=True)
+            self.assertFalse(serializer.is_valid(), value)
+            self.assertIn('views', serializer.errors)
+
+    def test_serializer_accepts_display_strings(self):
+        serializer = VideoUpdateSerializer(data={'views': '2.5K'}, partial=True)
+        self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual(serializer.validated_data['views'], 2500)
+
+    def test_counts_beyond_the_column_are_rejected(self):
+        self.assertEqual(parse_view_count('2147483647', strict=True), MAX_VIEW_COUNT)
+        for value in ['3B', '2.5B', '1e10', 2 ** 40]:
+            with self.assertRaises(ValueError):
+                parse_view_count(value, strict=True)
+            serializer = VideoUpdateSerializer(data={'views': value}, partial=True)
+            self.assertFalse(serializer.is_valid(), value)
+            self.assertIn('views', serializer.errors)
+        self.assertEqual(parse_view_count('3B'), MAX_VIEW_COUNT)
+
+    def test_migration_parser_survives_legacy_values(self):
+        parse = views_migration.parse_view_count
+        self.assertEqual(parse('1.5M'), 1_500_000)
+        for value in ['Infinity', 'inf', 'NaN', '-inf']:
+            self.assertEqual(parse(value), 0, value)
+        for value in ['5B', '9' * 30, 2 ** 40]:
+            self.assertEqual(parse(value), MAX_VIEW_COUNT, value)
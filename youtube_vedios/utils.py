@@ -0,0 +1,73 @@
+# utils.py
+from decimal import Decimal, InvalidOperation
+
+SUFFIXES = [
+    (1_000_000_000, 'B'),
+    (1_000_000, 'M'),
+    (1_000, 'K'),
+]
+
+# Largest value Video.views (a PositiveIntegerField) holds on every database
+MAX_VIEW_COUNT = 2_147_483_647
+
+
+def parse_view_count(value, strict=False):
+    """
+    Convert a display string like '12K', '1.5M' or '1,234' to an integer.
+    Returns 0 for empty or unparseable values and caps counts at
+    MAX_VIEW_COUNT, or raises ValueError for either when `strict` is set.
+    """
+    if value is None or isinstance(value, bool):
+        if strict:
+            raise ValueError("A view count is required")
+        return 0
+    if isinstance(value, int):
+        if strict and value < 0:
+            raise ValueError("A view count can't be negative")
+        return _in_range(value, strict)
+
+    text = str(value).strip().upper().replace(',', '').replace('VIEWS', '').strip()
+    if not text:
+        if strict:
+            raise ValueError("A view count is required")
+        return 0
+
+    multiplier = 1
+    for factor, suffix in SUFFIXES:
+        if text.endswith(suffix):
+            multiplier = factor
+            text = text[:-1].strip()
+            break
+
+    try:
+        count = Decimal(text)
+        if not count.is_finite() or (strict and count < 0):
+            raise InvalidOperation
+        count = count * multiplier
+        # Compare before int(): '1e999999' would otherwise become a huge integer
+        count = MAX_VIEW_COUNT + 1 if count > MAX_VIEW_COUNT else int(count)
+    except (ArithmeticError, ValueError):
+        if strict:
+            raise ValueError(f"'{value}' is not a view count like 1234, 12K or 1.5M")
+        digits = ''.join(filter(str.isdigit, text))
+        count = int(digits) * multiplier if digits else 0
+    return _in_range(count, strict)
+
+
+def _in_range(count, strict):
+    if count > MAX_VIEW_COUNT:
+        if strict:
+            raise ValueError(f"A view count can't be more than {MAX_VIEW_COUNT:,}")
+        return MAX_VIEW_COUNT
+    return max(count, 0)
+
+
+def format_view_count(count):
+    """Format an integer view count for display, e.g. 1500 -> '1.5K'"""
+    count = count or 0
+    for factor, suffix in SUFFIXES:
+        if count >= factor:
+            # Truncate rather than round so 999,999 never shows as '1000K'
+            value = f"{(count * 10 // factor) / 10:.1f}".rstrip('0').rstrip('.')
+            return f"{value}{suffix}"
+    return str(count)
@@ -9,6 +9,8 @@ from django.shortcuts import get_object_or_404
 from .models import Video
 from .serializers import VideoSerializer, VideoCreateSerializer, VideoUpdateSerializer
 from .permissions import IsAdminOrReadOnly
+from authentication.counters import increment
+from search.backends import search_queryset
 
 class VideoViewSet(viewsets.ModelViewSet):
     queryset = Video.objects.all()
@@ -55,13 +57,10 @@ class VideoViewSet(viewsets.ModelViewSet):
         if category:
             queryset = queryset.filter(category__icontains=category)
         
-        # Search in title and description
+        # Full-text search, ranked by relevance
         search = request.query_params.get('search', None)
         if search:
-            queryset = queryset.filter(
-                models.Q(title__icontains=search) | 
-                models.Q(description__icontains=search)
-            )
+            queryset = search_queryset(queryset, 'videos', search)
         
         page = self.paginate_queryset(queryset)
         if page is not None:
@@ -74,36 +73,8 @@ class VideoViewSet(viewsets.ModelViewSet):
         """All users can get single video by ID"""
         instance = self.get_object()
         
-        try:
-            # Safer view count parsing and incrementing
-            current_views_str = instance.views or '0'
-            
-            # Extract numeric value
-            if 'M' in current_views_str:
-                current_views = int(float(current_views_str.replace('M', '')) * 1000000)
-            elif 'K' in current_views_str:
-                current_views = int(float(current_views_str.replace('K', '')) * 1000)
-            else:
-                current_views = int(''.join(filter(str.isdigit, current_views_str)) or '0')
-            
-            # Increment views
-            current_views += 1
-            
-            # Format views back to K/M format
-            if current_views >= 1000000:
-                instance.views = f"{current_views // 1000000}M"
-            elif current_views >= 1000:
-                instance.views = f"{current_views // 1000}K"
-            else:
-                instance.views = str(current_views)
-            
-            instance.save(update_fields=['views'])
-            
-        except (ValueError, AttributeError) as e:
-            # If view count parsing fails, just increment by 1 from current string
-            print(f"View count parsing error: {e}")
-            # Don't fail the request, just log and continue
-            pass
+        # Atomic UPDATE ... SET views = views + 1, formatting happens in VideoSerializer
+        increment(instance, 'views')
         
         serializer = self.get_serializer(instance)
         return Response(serializer.data)